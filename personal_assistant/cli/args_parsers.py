@@ -1,6 +1,9 @@
 from typing import Tuple, Deque
 from collections import deque
 
+# aliases parsed as the "exit" command
+EXIT_COMMANDS = frozenset(("exit", "quit", "q", "close"))
+
 
 def parse_input(user_input: str) -> (Tuple[str, list[str]]):
     user_input_strip = user_input.strip()
@@ -16,7 +19,7 @@ def parse_input(user_input: str) -> (Tuple[str, list[str]]):
     if not args:
         args = []
 
-    if command in ["exit", "quit", "q", "close"]:
+    if command in EXIT_COMMANDS:
         command = "exit"
 
     return command, args
@@ -49,6 +49,13 @@ class AppConfig:
 
     _mode = _detect_default_mode()  # Auto-detect based on installation
 
+    # Write heap records as indented JSON (for debugging only, doubles file size)
+    DEBUG_PRETTY_JSON = False
+
+    # Heap backend: "json" (a file per record), "writeback" (a file per record,
+    # saved in the background) or "sqlite" (a single database file)
+    HEAP_BACKEND = "json"
+
     @classmethod
     def set_mode(cls, mode: str) -> None:
         """
@@ -1,3 +1,4 @@
+from bisect import bisect_left
 from collections import UserDict
 from datetime import datetime, timedelta
 from personal_assistant.models.record import Record
@@ -5,6 +6,17 @@ from personal_assistant.models.exceptions import RecordAlreadyExistsError, Conta
 
 
 class AddressBook(UserDict):
+    # width of the per-record trigram Bloom signature used by search()
+    SIGNATURE_BITS = 128
+
+    def __init__(self, *args, **kwargs):
+        # name -> (search text, Bloom signature of it), built lazily by search();
+        # records can change in place, so an entry is only reused while its text is the same
+        self._signatures: dict[str, tuple[str, int]] = {}
+        # sorted (lowercased name, name) pairs, built lazily by find_ci()/starts_with() and dropped on any change
+        self._names_lower: list[tuple[str, str]] | None = None
+        super().__init__(*args, **kwargs)
+
     def __setitem__(self, key, value):
         if not isinstance(value, Record):
             raise ValueError("Value must be an instance of Record.")
@@ -13,6 +25,7 @@ class AddressBook(UserDict):
         if key in self.data:
             raise RecordAlreadyExistsError(f"Contact '{key}' already exists.")
         super().__setitem__(key, value)
+        self._names_lower = None
 
     def __getitem__(self, key):
         if key not in self.data:
@@ -23,6 +36,8 @@ class AddressBook(UserDict):
         if key not in self.data:
             raise ContactNotFoundError(f"Contact '{key}' not found.")
         super().__delitem__(key)
+        self._signatures.pop(key, None)
+        self._names_lower = None
 
     def add_record(self, record: Record):
         self[record.first_name.value] = record
@@ -35,6 +50,69 @@ class AddressBook(UserDict):
     def delete(self, name: str) -> None:
         del self[name]
 
+    def _iter_names_with_prefix(self, prefix: str):
+        """Yield names whose lowercased form starts with the lowercased prefix, in sorted order."""
+        if self._names_lower is None:
+            self._names_lower = sorted((key.lower(), key) for key in self.data)
+
+        prefix = prefix.lower()
+        names = self._names_lower
+        # binary search for the first name >= prefix, matches are a contiguous run from there
+        for i in range(bisect_left(names, (prefix,)), len(names)):
+            name_lower, name = names[i]
+            if not name_lower.startswith(prefix):
+                break
+            yield name_lower, name
+
+    def find_ci(self, name: str) -> Record | None:
+        """Find a record by name, ignoring case."""
+        # the exact name sorts first among the names it prefixes
+        match = next(self._iter_names_with_prefix(name), None)
+        if match is None or match[0] != name.lower():
+            return None
+        return self.data[match[1]]
+
+    def starts_with(self, prefix: str) -> list[Record]:
+        """Get records whose name starts with prefix, ignoring case."""
+        return [self.data[key] for _, key in self._iter_names_with_prefix(prefix)]
+
+    @staticmethod
+    def _search_text(record: Record) -> str:
+        last_name = record.last_name.value if record.last_name else ""
+        phones = " ".join([p.value for p in record.phones])
+        return f"{record.first_name.value} {last_name} {phones}".lower()
+
+    @classmethod
+    def _signature(cls, text: str) -> int:
+        signature = 0
+        for i in range(len(text) - 2):
+            signature |= 1 << (hash(text[i:i + 3]) % cls.SIGNATURE_BITS)
+        return signature
+
+    def search(self, query: str) -> list[Record]:
+        """
+        Search records whose name or phone contains the query.
+
+        Every record has a Bloom signature of its trigrams; records whose
+        signature misses any bit of the query are skipped without a string match.
+        A signature is rebuilt when the record's name or phones changed.
+        """
+        query = query.lower().strip()
+        if not query:
+            return []
+
+        signatures = self._signatures
+        mask = self._signature(query)
+        found = []
+        for key, record in self.data.items():
+            text = self._search_text(record)
+            cached = signatures.get(key)
+            if cached is None or cached[0] != text:
+                cached = signatures[key] = (text, self._signature(text))
+            if cached[1] & mask == mask and query in text:
+                found.append(record)
+        return found
+
     def get_upcoming_birthdays(self, warn_in_days: int = 7) -> list[tuple[Record, datetime]]:
         today = datetime.today().date()
         warn_delta = timedelta(days=warn_in_days)
@@ -62,6 +140,6 @@ class AddressBook(UserDict):
         return upcoming_birthdays_users
 
     def __str__(self):
-        return '\n'.join(str(record) for record in self.data.values())
+        return '\n'.join([str(record) for record in self.data.values()])
 
 __all__ = ["AddressBook"]
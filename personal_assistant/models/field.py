@@ -14,18 +14,28 @@ __all__ = ["Field", "Name", "Birthday", "Phone", "Title", "Tag", "Email", "Addre
 
 
 class Field:
+    # every record holds several fields, so they don't carry an instance __dict__;
+    # subclasses declare their own (possibly empty) __slots__ to keep it that way
+    __slots__ = ("value",)
+
     def __init__(self, value):
         self.value = value
 
     def __str__(self):
         return str(self.value)
 
+    def __bool__(self):
+        # a field without a value (e.g. Name(None) of a contact with no last name) is empty
+        return bool(self.value)
+
 
 class Name(Field):
-    pass
+    __slots__ = ()
 
 
 class Birthday(Field):
+    __slots__ = ("_formatted",)
+
     def __init__(self, value):
         try:
             birthday = datetime.strptime(value, "%d.%m.%Y")
@@ -35,12 +45,24 @@ class Birthday(Field):
         if birthday.date() > datetime.today().date():
             raise BirthdayInFutureError(value)
         super().__init__(birthday)
+        # (value, text) of the last formatting; a parsed 10-character input is already "DD.MM.YYYY"
+        self._formatted = (birthday, value) if len(value) == 10 else None
+
+    @property
+    def formatted(self) -> str:
+        """Birthday as "DD.MM.YYYY", formatted once per value."""
+        value = self.value
+        if self._formatted is None or self._formatted[0] is not value:
+            # fixed format, no need for strftime to parse a format string
+            self._formatted = (value, f"{value.day:02d}.{value.month:02d}.{value.year:04d}")
+        return self._formatted[1]
 
     def __str__(self):
-        return self.value.strftime("%d.%m.%Y")
+        return self.formatted
 
 
 class Phone(Field):
+    __slots__ = ()
 
     def __init__(self, value):
         normalized = self.normalize_ua_phone(value)
@@ -108,6 +130,8 @@ class Phone(Field):
 
 
 class Email(Field):
+    __slots__ = ()
+
     EMAIL_PATTERN = r"^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}$"
 
     def __init__(self, value: str):
@@ -125,6 +149,8 @@ class Address(Field):
         - trims extra spaces
     """
 
+    __slots__ = ()
+
     FORBIDDEN = r'[%<&>"\']'
 
     def __init__(self, value: str):
@@ -140,6 +166,8 @@ class Address(Field):
 
 
 class Title(Field):
+    __slots__ = ()
+
     def __init__(self, value):
         if not value or len(value.strip()) <= 5:
             raise InvalidTitleFormatError(value)
@@ -147,6 +175,8 @@ class Title(Field):
 
 
 class Tag(Field):
+    __slots__ = ()
+
     def __init__(self, value):
         tag_len = len(value.strip()) if value else 0
         if not value or tag_len < 3 or tag_len > 10:
@@ -15,15 +15,17 @@ class Note:
     def add_tag(self, tag: str) -> None:
         """Add a tag to the note if it doesn't already exist."""
         tag_obj = Tag(tag)
+        tag_lower = tag_obj.value.lower()
         # Check if tag already exists (case-insensitive)
-        if any(t.value.lower() == tag_obj.value.lower() for t in self.tags):
+        if any(t.value.lower() == tag_lower for t in self.tags):
             raise TagAlreadyExistsError(f"Tag '{tag}' already exists for this note")
         self.tags.append(tag_obj)
 
     def remove_tag(self, tag: str) -> None:
         """Remove a tag from the note."""
+        tag_lower = tag.lower()
         for idx, t in enumerate(self.tags):
-            if t.value.lower() == tag.lower():
+            if t.value.lower() == tag_lower:
                 del self.tags[idx]
                 return
         raise ValueError(f"Tag '{tag}' not found in this note")
@@ -37,7 +39,7 @@ class Note:
         self.description = new_description
 
     def __str__(self):
-        tags_str = ", ".join(t.value for t in self.tags) if self.tags else "No tags"
+        tags_str = ", ".join([t.value for t in self.tags]) if self.tags else "No tags"
         return f"Note: {self.title.value}\nCreated: {self.creation_date.strftime('%d.%m.%Y %H:%M')}\nDescription: {self.description}\nTags: {tags_str}"
 
     @classmethod
@@ -8,8 +8,13 @@ from personal_assistant.models.exceptions import (
 
 
 class Record:
+    __slots__ = ("uuid", "updated_at", "first_name", "last_name", "_phones", "_phones_csv", "birthday", "email", "address")
+
     def __init__(self, name):
         self.uuid = None
+        # timestamp of the stored version the record was loaded from,
+        # cleared when the record is changed in memory
+        self.updated_at: str | None = None
         self.first_name = Name(name)
         self.last_name: Name | None = None
         self.phones: list[Phone] = []
@@ -17,6 +22,23 @@ class Record:
         self.email: Email | None = None
         self.address: Address | None = None
 
+    @property
+    def phones(self) -> list[Phone]:
+        return self._phones
+
+    @phones.setter
+    def phones(self, phones: list[Phone]) -> None:
+        self._phones = phones
+        self._phones_csv = None
+        self.updated_at = None
+
+    @property
+    def phones_csv(self) -> str:
+        """Phones joined with ", ", built once until the phones change."""
+        if self._phones_csv is None:
+            self._phones_csv = ", ".join([p.value for p in self._phones])
+        return self._phones_csv
+
     def add_phone(self, phone: str) -> None:
         if self.find_phone(phone):
             raise PhoneAlreadyExistsError(
@@ -24,11 +46,15 @@ class Record:
             )
         phone_obj = Phone(phone)
         self.phones.append(phone_obj)
+        self._phones_csv = None
+        self.updated_at = None
 
     def edit_phone(self, old_phone: str, new_phone: str) -> None:
         for idx, phone in enumerate(self.phones):
             if phone.value == old_phone:
                 self.phones[idx] = Phone(new_phone)
+                self._phones_csv = None
+                self.updated_at = None
                 return
         raise PhoneNotFoundError(f"Phone {old_phone} not found for {self.first_name}")
 
@@ -42,23 +68,28 @@ class Record:
         for idx, p in enumerate(self.phones):
             if p.value == phone:
                 del self.phones[idx]
+                self._phones_csv = None
+                self.updated_at = None
                 return
         raise PhoneNotFoundError(f"Phone {phone} not found for {self.first_name}")
 
     def add_birthday(self, birthday: str) -> None:
         self.birthday = Birthday(birthday)
+        self.updated_at = None
 
     def add_email(self, email: str) -> None:
         if email:
             self.email = Email(email)
         else:
             self.email = None
+        self.updated_at = None
 
     def add_address(self, address: str) -> None:
         self.address = Address(address)
+        self.updated_at = None
 
     def __str__(self):
-        return f"Contact name: {self.first_name.value}, phones: {'; '.join(p.value for p in self.phones)}"
+        return f"Contact name: {self.first_name.value}, phones: {'; '.join([p.value for p in self.phones])}"
 
     @classmethod
     def from_dict(cls, contact_data):
@@ -76,6 +107,7 @@ class Record:
             record.email = Email(contact_data.get("email"))
         if contact_data.get("address"):
             record.address = Address(contact_data.get("address"))
+        record.updated_at = contact_data.get("updated_at")
         return record
 
     def to_dict(self):
@@ -85,7 +117,7 @@ class Record:
             "last_name": self.last_name.value if self.last_name else None,
             "phones": [phone.value for phone in self.phones],
             "birthday": (
-                self.birthday.value.strftime("%d.%m.%Y") if self.birthday else None
+                self.birthday.formatted if self.birthday else None
             ),
             "email": self.email.value if self.email else None,
             "address": self.address.value if self.address else None,
@@ -10,6 +10,7 @@ from .search_contacts_by_phone_presenter import SearchContactsByPhonePresenter
 from .search_contacts_by_email_presenter import SearchContactsByEmailPresenter
 from .search_notes_presenter import SearchNotesPresenter
 from .search_notes_by_tag_presenter import SearchNotesByTagPresenter
+from .search_notes_by_date_presenter import SearchNotesByDatePresenter
 from .show_help_presenter import ShowHelpPresenter
 from .show_phone_presenter import ShowPhonePresenter
 from .add_birthday_presenter import AddBirthdayPresenter
@@ -33,6 +34,7 @@ __all__ = [
     "SearchContactsByEmailPresenter",
     "SearchNotesPresenter",
     "SearchNotesByTagPresenter",
+    "SearchNotesByDatePresenter",
     "ShowHelpPresenter",
     "ShowPhonePresenter",
     "AddBirthdayPresenter",
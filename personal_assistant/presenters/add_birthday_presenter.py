@@ -9,6 +9,9 @@ if TYPE_CHECKING:
 
 
 class AddBirthdayPresenter(Presenter):
+    min_args = 2
+    usage = "Usage: add-birthday <name> <date (DD.MM.YYYY)>"
+
     def __init__(self, storage: AddressBookStorage):
         self.storage = storage
 
@@ -21,10 +24,6 @@ class AddBirthdayPresenter(Presenter):
         return "Adds a birthday to a contact"
 
     async def execute_tui(self, app: "AddressBookApp", args: list[str]) -> None:
-        if len(args) < 2:
-            app.log_widget.write("[bold red]Usage: add-birthday <name> <date (DD.MM.YYYY)>[/bold red]")
-            return
-
         name = args[0]
         birthday_str = args[1]
 
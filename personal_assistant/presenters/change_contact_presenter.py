@@ -8,6 +8,9 @@ if TYPE_CHECKING:
 
 
 class ChangeContactPresenter(Presenter):
+    min_args = 1
+    usage = "Please provide contact name or UUID"
+
     def __init__(self, storage: AddressBookStorage):
         self.storage = storage
 
@@ -20,10 +23,6 @@ class ChangeContactPresenter(Presenter):
         return "Changes a contact's information"
 
     async def execute_tui(self, app: "AddressBookApp", args: list[str]) -> None:
-        if not args:
-            app.log_widget.write("[bold red]Please provide contact name or UUID[/bold red]")
-            return
-
         search_term = args[0]
         contacts = self.storage.search_by_first_name(search_term)
 
@@ -8,6 +8,9 @@ if TYPE_CHECKING:
 
 
 class ChangeNotePresenter(Presenter):
+    min_args = 1
+    usage = "Please provide note title or UUID"
+
     def __init__(self, storage: NotesStorage):
         self.storage = storage
 
@@ -20,10 +23,6 @@ class ChangeNotePresenter(Presenter):
         return "Changes a note's information"
 
     async def execute_tui(self, app: "AddressBookApp", args: list[str]) -> None:
-        if not args:
-            app.log_widget.write("[bold red]Please provide note title or UUID[/bold red]")
-            return
-
         search_term = " ".join(args)
         notes = self.storage.search_by_title(search_term)
 
@@ -1,13 +1,15 @@
 from typing import TYPE_CHECKING
 from personal_assistant.presenters.presenter import Presenter
 from personal_assistant.storage.address_book import AddressBookStorage
-from personal_assistant.tui.screens.confirmation_screen import ConfirmationScreen
 
 if TYPE_CHECKING:
     from personal_assistant.tui.app import AddressBookApp
 
 
 class DeleteContactPresenter(Presenter):
+    min_args = 1
+    usage = "Please provide a contact's first name, or UUID."
+
     def __init__(self, storage: AddressBookStorage):
         self.storage = storage
 
@@ -23,17 +25,15 @@ class DeleteContactPresenter(Presenter):
         app.run_worker(self._handle_delete_contact(app, args))
 
     async def _handle_delete_contact(self, app: "AddressBookApp", args: list[str]) -> None:
-        if not args:
-            app.log_widget.write("[bold red]Please provide a contact's first name, or UUID.[/bold red]")
-            return
+        from personal_assistant.tui.screens.confirmation_screen import ConfirmationScreen
 
         search_term = " ".join(args)
 
         contacts = self.storage.search_by_first_name(args[0])
 
         if len(args) > 1:
-            last_name = args[1]
-            contacts = [c for c in contacts if c.last_name and c.last_name.value.lower() == last_name.lower()]
+            last_name = args[1].lower()
+            contacts = [c for c in contacts if c.last_name and c.last_name.value.lower() == last_name]
 
         if not contacts:
             contact = self.storage.get_record_by_id(search_term)
@@ -1,13 +1,15 @@
 from typing import TYPE_CHECKING
 from personal_assistant.presenters.presenter import Presenter
 from personal_assistant.storage.notes_storage import NotesStorage
-from personal_assistant.tui.screens.confirmation_screen import ConfirmationScreen
 
 if TYPE_CHECKING:
     from personal_assistant.tui.app import AddressBookApp
 
 
 class DeleteNotePresenter(Presenter):
+    min_args = 1
+    usage = "Please provide a note title or UUID."
+
     def __init__(self, storage: NotesStorage):
         self.storage = storage
 
@@ -23,9 +25,7 @@ class DeleteNotePresenter(Presenter):
         app.run_worker(self._handle_delete_note(app, args))
 
     async def _handle_delete_note(self, app: "AddressBookApp", args: list[str]) -> None:
-        if not args:
-            app.log_widget.write("[bold red]Please provide a note title or UUID.[/bold red]")
-            return
+        from personal_assistant.tui.screens.confirmation_screen import ConfirmationScreen
 
         search_term = " ".join(args)
 
@@ -47,11 +47,12 @@ class GenerateDataPresenter(Presenter):
             )
             return
 
-        contact_uuids = []
         app.log_widget.write(f"Generating {num_contacts} contacts...")
-        for record in generate_contacts(num_contacts):
-            uuid = self.address_book_storage.add_record(record)
-            contact_uuids.append(uuid)
+        # records are generated first and written in one synchronous call, so no
+        # other command runs while the heap batch and index bulk update are open
+        records = list(generate_contacts(num_contacts))
+        contact_uuids = self.address_book_storage.add_records_bulk(records)
+        for record in records:
             app.log_widget.write(f"  - Generated contact: {record.first_name.value} {record.last_name.value if record.last_name else ''}")
             await asyncio.sleep(0.1)
         app.log_widget.write(
@@ -59,8 +60,9 @@ class GenerateDataPresenter(Presenter):
         )
 
         app.log_widget.write(f"\nGenerating {num_notes} notes...")
-        for note in generate_notes(num_notes, contact_uuids):
-            self.notes_storage.add_note(note)
+        notes = list(generate_notes(num_notes, contact_uuids))
+        self.notes_storage.add_notes_bulk(notes)
+        for note in notes:
             app.log_widget.write(f"  - Generated note: {note.title.value}")
             await asyncio.sleep(0.1)
         app.log_widget.write(
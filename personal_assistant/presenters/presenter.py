@@ -6,6 +6,11 @@ if TYPE_CHECKING:
 
 
 class Presenter(ABC):
+    # minimal number of arguments; with fewer the app shows `usage`
+    # instead of calling execute_tui
+    min_args: int = 0
+    usage: str = ""
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -16,6 +16,7 @@ from personal_assistant.presenters import (
     AddNotePresenter,
     SearchNotesPresenter,
     SearchNotesByTagPresenter,
+    SearchNotesByDatePresenter,
     ShowAllNotesPresenter,
     ShowHelpPresenter,
     GenerateDataPresenter,
@@ -47,6 +48,7 @@ class PresentersRegistry:
         self.commands['change-note'] = ChangeNotePresenter(notes_storage)      #
         self.commands['search-notes'] = SearchNotesPresenter(notes_storage)                 #
         self.commands['search-tag'] = SearchNotesByTagPresenter(notes_storage)              #
+        self.commands['search-date'] = SearchNotesByDatePresenter(notes_storage)            #
         self.commands['delete-contact'] = DeleteContactPresenter(address_book_storage)      #
         self.commands['delete-note'] = DeleteNotePresenter(notes_storage)                   #
         self.commands['all-notes'] = ShowAllNotesPresenter(notes_storage)                   #
@@ -7,6 +7,9 @@ if TYPE_CHECKING:
 
 
 class SearchContactsByEmailPresenter(Presenter):
+    min_args = 1
+    usage = "Please provide an email address to search for."
+
     def __init__(self, storage: AddressBookStorage):
         self.storage = storage
 
@@ -19,10 +22,6 @@ class SearchContactsByEmailPresenter(Presenter):
         return "Search contacts by email address"
 
     async def execute_tui(self, app: "AddressBookApp", args: list[str]) -> None:
-        if not args:
-            app.log_widget.write("[bold red]Please provide an email address to search for.[/bold red]")
-            return
-
         email = " ".join(args)
 
         contacts = self.storage.search_by_email(email)
@@ -34,7 +33,7 @@ class SearchContactsByEmailPresenter(Presenter):
         app.log_widget.write(f"[bold green]Found {len(contacts)} contact(s) with email '{email}':[/bold green]\n")
 
         for contact in contacts:
-            phones_str = ", ".join([p.value for p in contact.phones]) if contact.phones else "No phones"
+            phones_str = contact.phones_csv or "No phones"
             email_str = contact.email.value if contact.email else "No email"
             app.log_widget.write(f"[bold cyan]Name:[/bold cyan] {contact.first_name.value} {contact.last_name.value}")
             app.log_widget.write(f"[bold cyan]Email:[/bold cyan] {email_str}")
@@ -10,6 +10,9 @@ if TYPE_CHECKING:
 
 
 class SearchContactsByPhonePresenter(Presenter):
+    min_args = 1
+    usage = "Please provide a phone number to search for."
+
     def __init__(self, storage: AddressBookStorage):
         self.storage = storage
 
@@ -22,10 +25,6 @@ class SearchContactsByPhonePresenter(Presenter):
         return "Search contacts by phone number"
 
     async def execute_tui(self, app: "AddressBookApp", args: list[str]) -> None:
-        if not args:
-            app.log_widget.write("[bold red]Please provide a phone number to search for.[/bold red]")
-            return
-
         phone = args[0]
 
         try:
@@ -43,7 +42,7 @@ class SearchContactsByPhonePresenter(Presenter):
         app.log_widget.write(f"[bold green]Found {len(contacts)} contact(s) with phone number '{phone}':[/bold green]\n")
 
         for contact in contacts:
-            phones_str = ", ".join([p.value for p in contact.phones]) if contact.phones else "No phones"
+            phones_str = contact.phones_csv or "No phones"
             email_str = contact.email.value if contact.email else "No email"
             app.log_widget.write(f"[bold cyan]Name:[/bold cyan] {contact.first_name.value} {contact.last_name.value}")
             app.log_widget.write(f"[bold cyan]Phones:[/bold cyan] {phones_str}")
@@ -7,6 +7,9 @@ if TYPE_CHECKING:
 
 
 class SearchContactsPresenter(Presenter):
+    min_args = 1
+    usage = "Please provide a search term"
+
     def __init__(self, storage: AddressBookStorage):
         self.storage = storage
 
@@ -19,16 +22,16 @@ class SearchContactsPresenter(Presenter):
         return "Searches for contacts"
 
     async def execute_tui(self, app: "AddressBookApp", args: list[str]) -> None:
-        if not args:
-            app.log_widget.write("[bold red]Please provide a search term[/bold red]")
-            return
-
         search_term = args[0]
         contacts = self.storage.search_by_first_name(search_term)
 
         if not contacts:
             contacts = self.storage.search_by_last_name(search_term)
 
+        if not contacts:
+            search_term = " ".join(args)
+            contacts = self.storage.search_by_name(search_term)
+
         if not contacts:
             app.log_widget.write(f"[bold yellow]No contacts found for '{search_term}'[/bold yellow]")
             return
@@ -37,7 +40,7 @@ class SearchContactsPresenter(Presenter):
         for contact in contacts:
             output += f"\n[bold cyan]{contact.first_name.value} {contact.last_name.value if contact.last_name else ''}[/bold cyan]\n"
             if contact.phones:
-                output += f"Phones: {', '.join(phone.value for phone in contact.phones)}\n"
+                output += f"Phones: {contact.phones_csv}\n"
             # if contact.emails:
             #     output += f"Email: {', '.join(email.value for email in contact.emails)}\n"
             if contact.email:
@@ -45,6 +48,6 @@ class SearchContactsPresenter(Presenter):
             if contact.address:
                 output += f"Address: {contact.address.value}\n"
             if contact.birthday:
-                output += f"Birthday: {contact.birthday.value.strftime('%d.%m.%Y')}\n"
+                output += f"Birthday: {contact.birthday.formatted}\n"
 
         app.log_widget.write(output)
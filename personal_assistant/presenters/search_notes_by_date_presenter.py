@@ -0,0 +1,51 @@
+from datetime import datetime
+from typing import TYPE_CHECKING
+from personal_assistant.presenters.presenter import Presenter
+from personal_assistant.storage.notes_storage import NotesStorage
+
+if TYPE_CHECKING:
+    from personal_assistant.tui.app import AddressBookApp
+
+
+class SearchNotesByDatePresenter(Presenter):
+    min_args = 1
+    usage = "Usage: search-date <from (DD.MM.YYYY)> [to (DD.MM.YYYY)]"
+
+    def __init__(self, storage: NotesStorage):
+        self.storage = storage
+
+    @property
+    def name(self) -> str:
+        return "search-date"
+
+    @property
+    def description(self) -> str:
+        return "Search notes created on a day or in a date range"
+
+    async def execute_tui(self, app: "AddressBookApp", args: list[str]) -> None:
+        try:
+            start = datetime.strptime(args[0], "%d.%m.%Y").date()
+            end = datetime.strptime(args[1], "%d.%m.%Y").date() if len(args) > 1 else start
+        except ValueError:
+            app.log_widget.write("[bold red]Invalid date format. Use DD.MM.YYYY[/bold red]")
+            return
+
+        if end < start:
+            start, end = end, start
+
+        notes = self.storage.search_by_date_range(start, end)
+        period = start.strftime("%d.%m.%Y") if start == end else f"{start:%d.%m.%Y} - {end:%d.%m.%Y}"
+
+        if not notes:
+            app.log_widget.write(f"[bold yellow]No notes created {'on' if start == end else 'in'} {period}[/bold yellow]")
+            return
+
+        app.log_widget.write(f"[bold green]Found {len(notes)} note(s) created {'on' if start == end else 'in'} {period}:[/bold green]\n")
+
+        for note in notes:
+            tags_str = ", ".join([tag.value for tag in note.tags]) if note.tags else "No tags"
+            description_preview = note.description[:100] + "..." if len(note.description) > 100 else note.description
+            app.log_widget.write(f"[bold cyan]Title:[/bold cyan] {note.title.value}")
+            app.log_widget.write(f"[bold cyan]Tags:[/bold cyan] {tags_str}")
+            app.log_widget.write(f"[bold cyan]UUID:[/bold cyan] {note.uuid}")
+            app.log_widget.write(f"[bold cyan]Description:[/bold cyan] {description_preview}")
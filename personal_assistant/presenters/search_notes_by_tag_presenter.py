@@ -7,6 +7,9 @@ if TYPE_CHECKING:
 
 
 class SearchNotesByTagPresenter(Presenter):
+    min_args = 1
+    usage = "Please provide a tag to search for."
+
     def __init__(self, storage: NotesStorage):
         self.storage = storage
 
@@ -19,10 +22,6 @@ class SearchNotesByTagPresenter(Presenter):
         return "Search notes by tag"
 
     async def execute_tui(self, app: "AddressBookApp", args: list[str]) -> None:
-        if not args:
-            app.log_widget.write("[bold red]Please provide a tag to search for.[/bold red]")
-            return
-
         tag = " ".join(args)
 
         notes = self.storage.search_by_tag(tag)
@@ -7,6 +7,9 @@ if TYPE_CHECKING:
 
 
 class SearchNotesPresenter(Presenter):
+    min_args = 1
+    usage = "Please provide a search term"
+
     def __init__(self, storage: NotesStorage):
         self.storage = storage
 
@@ -19,10 +22,6 @@ class SearchNotesPresenter(Presenter):
         return "Searches for notes"
 
     async def execute_tui(self, app: "AddressBookApp", args: list[str]) -> None:
-        if not args:
-            app.log_widget.write("[bold red]Please provide a search term[/bold red]")
-            return
-
         search_term = args[0]
         notes = self.storage.search_by_title(search_term)
 
@@ -38,6 +37,6 @@ class SearchNotesPresenter(Presenter):
             output += f"\n[bold cyan]{note.title.value}[/bold cyan]\n"
             output += f"{note.description}\n"
             if note.tags:
-                output += f"Tags: {', '.join(tag.value for tag in note.tags)}\n"
+                output += f"Tags: {', '.join([tag.value for tag in note.tags])}\n"
 
         app.log_widget.write(output)
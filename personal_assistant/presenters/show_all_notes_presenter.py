@@ -19,17 +19,16 @@ class ShowAllNotesPresenter(Presenter):
         return "Shows all notes"
 
     async def execute_tui(self, app: "AddressBookApp", args: list[str]) -> None:
-        notes = self.storage.get_all_notes()
-
-        if not notes:
-            app.log_widget.write("[bold yellow]No notes found[/bold yellow]")
-            return
-
-        output = "[bold green]All Notes:[/bold green]\n"
-        for note in notes:
+        # notes are loaded one by one while the output is built
+        output = ""
+        for note in self.storage.get_all_notes():
             output += f"\n[bold cyan]{note.title.value}[/bold cyan]\n"
             output += f"{note.description}\n"
             if note.tags:
-                output += f"Tags: {', '.join(tag.value for tag in note.tags)}\n"
+                output += f"Tags: {', '.join([tag.value for tag in note.tags])}\n"
+
+        if not output:
+            app.log_widget.write("[bold yellow]No notes found[/bold yellow]")
+            return
 
-        app.log_widget.write(output)
+        app.log_widget.write("[bold green]All Notes:[/bold green]\n" + output)
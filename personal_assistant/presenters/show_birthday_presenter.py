@@ -7,6 +7,9 @@ if TYPE_CHECKING:
 
 
 class ShowBirthdayPresenter(Presenter):
+    min_args = 1
+    usage = "Please provide a contact name"
+
     def __init__(self, storage: AddressBookStorage):
         self.storage = storage
 
@@ -19,10 +22,6 @@ class ShowBirthdayPresenter(Presenter):
         return "Shows birthday for a contact"
 
     async def execute_tui(self, app: "AddressBookApp", args: list[str]) -> None:
-        if not args:
-            app.log_widget.write("[bold red]Please provide a contact name[/bold red]")
-            return
-
         search_term = args[0]
         contacts = self.storage.search_by_first_name(search_term)
 
@@ -36,7 +35,7 @@ class ShowBirthdayPresenter(Presenter):
         for contact in contacts:
             name = f"{contact.first_name.value} {contact.last_name.value if contact.last_name else ''}".strip()
             if contact.birthday:
-                birthday_str = contact.birthday.value.strftime("%d.%m.%Y")
+                birthday_str = contact.birthday.formatted
                 app.log_widget.write(f"[bold green]Birthday for {name}:[/bold green] {birthday_str}")
             else:
                 app.log_widget.write(f"[bold yellow]{name} has no birthday set[/bold yellow]")
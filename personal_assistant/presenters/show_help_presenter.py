@@ -1,6 +1,5 @@
 from typing import TYPE_CHECKING, Dict
 from personal_assistant.presenters.presenter import Presenter
-from personal_assistant.tui.screens.help.help import HelpScreen
 
 if TYPE_CHECKING:
     from personal_assistant.tui.app import AddressBookApp
@@ -19,4 +18,5 @@ class ShowHelpPresenter(Presenter):
         return "Shows available commands"
 
     async def execute_tui(self, app: "AddressBookApp", args: list[str]) -> None:
-        await app.push_screen(HelpScreen())
+        # installed in AddressBookApp.SCREENS, the same screen is reused
+        await app.push_screen("help")
@@ -7,6 +7,9 @@ if TYPE_CHECKING:
 
 
 class ShowPhonePresenter(Presenter):
+    min_args = 1
+    usage = "Please provide a contact name"
+
     def __init__(self, storage: AddressBookStorage):
         self.storage = storage
 
@@ -19,10 +22,6 @@ class ShowPhonePresenter(Presenter):
         return "Shows phone number(s) for a contact"
 
     async def execute_tui(self, app: "AddressBookApp", args: list[str]) -> None:
-        if not args:
-            app.log_widget.write("[bold red]Please provide a contact name[/bold red]")
-            return
-
         search_term = args[0]
         contacts = self.storage.search_by_first_name(search_term)
 
@@ -40,7 +39,6 @@ class ShowPhonePresenter(Presenter):
                 continue
 
             output = f"[bold green]Phone numbers for {contact.first_name.value} {contact.last_name.value if contact.last_name else ''}:[/bold green]\n"
-            for phone in contact.phones:
-                output += f"  {phone.value}\n"
+            output += "".join([f"  {phone.value}\n" for phone in contact.phones])
 
             app.log_widget.write(output)
@@ -3,14 +3,21 @@ Storage package — File-based storage system for Personal Assistant application
 
 This package provides a file-based storage system with indexing capabilities:
 - heap_storage: Base file storage (Heap)
+- sqlite_heap_storage: SQLite-backed alternative to HeapStorage
+- write_back_heap_storage: HeapStorage that saves records in the background
 - index_manager: Index management for fast search
+- mmap_hash_bucket: Packed memory-mapped copy of a Hash index bucket
+- mmap_trie_bucket: Packed memory-mapped copy of a Trie index bucket
 - base_storage: Abstract base class for storage with indexing
 - address_book: High-level API for address book
 - notes_storage: High-level API for notes management
 - constants: Index name constants
+- file_utils: File system helpers shared by the storages
 """
 
 from personal_assistant.storage.heap_storage import HeapStorage
+from personal_assistant.storage.sqlite_heap_storage import SqliteHeapStorage
+from personal_assistant.storage.write_back_heap_storage import WriteBackHeapStorage
 from personal_assistant.storage.index_manager import IndexManager
 from personal_assistant.storage.base_storage import BaseStorage
 from personal_assistant.storage.address_book import AddressBookStorage
@@ -20,6 +27,7 @@ from personal_assistant.storage.constants import (
     INDEX_CONTACT_LAST_NAME,
     INDEX_CONTACT_PHONE,
     INDEX_CONTACT_EMAIL,
+    INDEX_CONTACT_NAME_TRIGRAM,
     INDEX_NOTE_TITLE,
     INDEX_NOTE_CREATION_DATE,
     CONTACT_INDEXES,
@@ -30,6 +38,8 @@ from personal_assistant.storage.constants import (
 
 __all__ = [
     'HeapStorage',
+    'SqliteHeapStorage',
+    'WriteBackHeapStorage',
     'IndexManager',
     'BaseStorage',
     'AddressBookStorage',
@@ -39,6 +49,7 @@ __all__ = [
     'INDEX_CONTACT_LAST_NAME',
     'INDEX_CONTACT_PHONE',
     'INDEX_CONTACT_EMAIL',
+    'INDEX_CONTACT_NAME_TRIGRAM',
     'INDEX_NOTE_TITLE',
     'INDEX_NOTE_CREATION_DATE',
     'CONTACT_INDEXES',
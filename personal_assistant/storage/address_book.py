@@ -5,7 +5,8 @@ Combines HeapStorage (file storage) and IndexManager (indexes for search).
 Ensures consistency between data and indexes.
 """
 
-from typing import Optional, List, Dict, Any
+from datetime import date, timedelta
+from typing import Iterable, Optional, List, Dict, Any, Tuple
 from personal_assistant.models.record import Record
 from personal_assistant.storage.base_storage import BaseStorage
 from personal_assistant.storage.constants import (
@@ -13,6 +14,7 @@ from personal_assistant.storage.constants import (
     INDEX_CONTACT_LAST_NAME,
     INDEX_CONTACT_PHONE,
     INDEX_CONTACT_EMAIL,
+    INDEX_CONTACT_NAME_TRIGRAM,
     CONTACT_INDEXES,
 )
 
@@ -26,6 +28,19 @@ class AddressBookStorage(BaseStorage):
     - Indexes (for fast search)
     """
 
+    def __init__(self, data_root: Optional[str] = None, index_root: Optional[str] = None):
+        """
+        Args:
+            data_root: Directory for storing data (None = use config default)
+            index_root: Directory for storing indexes (None = use config default)
+        """
+        # upcoming birthdays per number of days, valid for _upcoming_birthdays_date; cleared on every write
+        self._upcoming_birthdays: Dict[int, List[Tuple[str, str, int]]] = {}
+        self._upcoming_birthdays_date: Optional[date] = None
+        # number of finished writes, a birthday scan only caches its result if no write ran meanwhile
+        self._generation = 0
+        super().__init__(data_root, index_root)
+
     # ============================================================
     # Overrides from BaseStorage
     # ============================================================
@@ -54,9 +69,36 @@ class AddressBookStorage(BaseStorage):
 
         new_record = self.heap.create_contact(record.to_dict())
         self._add_to_indexes(new_record.get("uuid"), new_record)
+        self._contacts_changed()
 
         return record.uuid
 
+    def add_records_bulk(self, records: Iterable[Record], durable: bool = False) -> List[str]:
+        """
+        Add many contacts at once, e.g. on import or data generation.
+
+        Records are written in one heap batch and every touched index file
+        is written once at the end instead of after every contact.
+
+        Args:
+            records: Contacts to add
+            durable: Passed to heap.batch; the default writes records in
+                place without syncing them, a crash may lose the last ones
+
+        Returns:
+            UUIDs of created contacts in the order of records
+        """
+        uuids = []
+        with self.heap.batch(durable=durable), self.index_manager.bulk_update():
+            for record in records:
+                new_record = self.heap.create_contact(record.to_dict())
+                uuid = new_record.get("uuid")
+                self._add_to_indexes(uuid, new_record)
+                uuids.append(uuid)
+
+        self._contacts_changed()
+        return uuids
+
     def get_record_by_id(self, contact_uuid: str) -> Optional[Record]:
         """
         Get contact by UUID.
@@ -84,12 +126,12 @@ class AddressBookStorage(BaseStorage):
         self._remove_from_indexes(record.uuid, old_contact)
 
         raw_record = record.to_dict()
-        if self.heap.update_contact(record.uuid, raw_record):
+        updated = self.heap.update_contact(record.uuid, raw_record)
+        if updated:
             self._add_to_indexes(record.uuid, raw_record)
-            return True
-
+        self._contacts_changed()
 
-        return False
+        return updated
 
     def delete_record(self, contact_uuid: str) -> bool:
         """
@@ -104,7 +146,14 @@ class AddressBookStorage(BaseStorage):
 
         self._remove_from_indexes(contact_uuid, record)
 
-        return self.heap.delete_contact(contact_uuid)
+        deleted = self.heap.delete_contact(contact_uuid)
+        self._contacts_changed()
+        return deleted
+
+    def _contacts_changed(self):
+        """Drop results computed from contacts, called once a write is finished."""
+        self._generation += 1
+        self._upcoming_birthdays.clear()
 
     def get_all_records(self) -> List[Record]:
         """
@@ -115,6 +164,15 @@ class AddressBookStorage(BaseStorage):
         """
         return list(map(lambda record_data: Record.from_dict(record_data),  self.heap.list_all_contacts()))
 
+    def get_records_bulk(self, contact_uuids: Iterable[str]) -> List[Record]:
+        """
+        Get several contacts by UUID with a single heap call.
+
+        Returns:
+            List of found contacts (missing UUIDs are skipped)
+        """
+        return list(map(Record.from_dict, self.heap.read_many("contacts", contact_uuids)))
+
     # ============================================================
     # Search
     # ============================================================
@@ -129,16 +187,7 @@ class AddressBookStorage(BaseStorage):
         Returns:
             List of found contacts
         """
-        results = self.index_manager.search_by_prefix(INDEX_CONTACT_FIRST_NAME, prefix)
-
-        contacts = []
-        for name, uuids in results.items():
-            for uuid in uuids:
-                contact = self.heap.read_contact(uuid)
-                if contact:
-                    contacts.append(Record.from_dict(contact))
-
-        return contacts
+        return self.get_records_bulk(self.index_manager.iter_uuids_by_prefix(INDEX_CONTACT_FIRST_NAME, prefix))
 
     def search_by_last_name(self, prefix: str) -> List[Record]:
         """
@@ -150,16 +199,7 @@ class AddressBookStorage(BaseStorage):
         Returns:
             List of found contacts
         """
-        results = self.index_manager.search_by_prefix(INDEX_CONTACT_LAST_NAME, prefix)
-
-        contacts = []
-        for name, uuids in results.items():
-            for uuid in uuids:
-                contact = self.heap.read_contact(uuid)
-                if contact:
-                    contacts.append(Record.from_dict(contact))
-
-        return contacts
+        return self.get_records_bulk(self.index_manager.iter_uuids_by_prefix(INDEX_CONTACT_LAST_NAME, prefix))
 
     def search_by_phone(self, phone: str) -> List[Record]:
         """
@@ -171,15 +211,7 @@ class AddressBookStorage(BaseStorage):
         Returns:
             List of found contacts
         """
-        uuids = self.index_manager.search_by_exact_match(INDEX_CONTACT_PHONE, phone)
-
-        contacts = []
-        for uuid in uuids:
-            contact = self.heap.read_contact(uuid)
-            if contact:
-                contacts.append(Record.from_dict(contact))
-
-        return contacts
+        return self.get_records_bulk(self.index_manager.search_by_exact_match(INDEX_CONTACT_PHONE, phone))
 
     def search_by_email(self, email: str) -> List[Record]:
         """
@@ -191,50 +223,130 @@ class AddressBookStorage(BaseStorage):
         Returns:
             List of found contacts
         """
-        uuids = self.index_manager.search_by_exact_match(INDEX_CONTACT_EMAIL, email)
+        return self.get_records_bulk(self.index_manager.search_by_exact_match(INDEX_CONTACT_EMAIL, email))
+
+    def search_by_name(self, query: str) -> List[Record]:
+        """
+        Substring search for contacts by full name ("first last").
+
+        Args:
+            query: Part of the name to search for (at least 3 characters)
+
+        Returns:
+            List of found contacts
+        """
+        query_lower = query.lower().strip()
+        uuids = self.index_manager.search_by_trigrams(INDEX_CONTACT_NAME_TRIGRAM, query_lower)
+
+        # trigrams only narrow down candidates, confirm the real substring match
+        return [
+            Record.from_dict(contact) for contact in self.heap.read_many("contacts", uuids)
+            if query_lower in self._get_full_name(contact).lower()
+        ]
 
-        contacts = []
-        for uuid in uuids:
-            contact = self.heap.read_contact(uuid)
-            if contact:
-                contacts.append(Record.from_dict(contact))
+    # ============================================================
+    # Birthdays
+    # ============================================================
 
-        return contacts
+    def get_upcoming_birthdays(self, days: int = 7) -> List[Tuple[str, str, int]]:
+        """
+        Get contacts to congratulate within the next days.
+
+        A birthday falling on a weekend is moved to the following Monday.
+        The result is computed once per day and number of days, until contacts change.
+
+        Args:
+            days: Number of days to look ahead (0 = today only)
+
+        Returns:
+            List of (name, congratulation date "DD.MM.YYYY", days until it) sorted by days until
+        """
+        today = date.today()
+        if self._upcoming_birthdays_date != today:
+            self._upcoming_birthdays.clear()
+            self._upcoming_birthdays_date = today
+
+        upcoming = self._upcoming_birthdays.get(days)
+        if upcoming is None:
+            generation = self._generation
+            upcoming = self._find_upcoming_birthdays(today, days)
+            # the scan may run in a worker thread; a write finished meanwhile
+            # makes its result stale, so it is returned but not cached
+            if self._generation == generation:
+                self._upcoming_birthdays[days] = upcoming
+
+        return list(upcoming)
+
+    def _find_upcoming_birthdays(self, today: date, days: int) -> List[Tuple[str, str, int]]:
+        """Compute get_upcoming_birthdays result by scanning all contacts."""
+        end_date = today + timedelta(days=days)
+        upcoming = []
+
+        for contact in self.get_all_records():
+            if not contact.birthday:
+                continue
+
+            bday = contact.birthday.value.date()
+            this_year_bday = bday.replace(year=today.year)
+            user_congratulation_date = None
+
+            if today <= this_year_bday <= end_date:
+                user_congratulation_date = this_year_bday
+            elif this_year_bday < today:
+                next_year_bday = bday.replace(year=today.year + 1)
+                if today <= next_year_bday <= end_date:
+                    user_congratulation_date = next_year_bday
+
+            if user_congratulation_date:
+                # Adjust for weekends
+                if user_congratulation_date.weekday() in (5, 6):
+                    user_congratulation_date += timedelta(days=(7 - user_congratulation_date.weekday()))
+
+                # Recalculate days_until after potential weekend adjustment
+                days_until = (user_congratulation_date - today).days
+
+                # Ensure the adjusted date is still within the warning period
+                if 0 <= days_until <= days:
+                    name = f"{contact.first_name.value} {contact.last_name.value if contact.last_name else ''}".strip()
+                    birthday_str = user_congratulation_date.strftime("%d.%m.%Y")
+                    upcoming.append((name, birthday_str, days_until))
+
+        upcoming.sort(key=lambda x: x[2])
+        return upcoming
 
     # ============================================================
     # index synchronization
     # ============================================================
 
-    def _add_to_indexes(self, contact_uuid: str, contact_data: Dict[str, Any]):
-        """Add contact to all indexes."""
+    @staticmethod
+    def _get_full_name(contact_data: Dict[str, Any]) -> str:
+        """Get "first last" name of raw contact data."""
+        return f"{contact_data.get('first_name') or ''} {contact_data.get('last_name') or ''}".strip()
+
+    def _get_index_entries(self, contact_data: Dict[str, Any]) -> List[Tuple[str, str, str]]:
+        """Get (kind, index_name, value) entries of a contact for IndexManager bulk operations."""
+        entries = []
 
         if contact_data.get('first_name'):
-            self.index_manager.add_to_trie_index(INDEX_CONTACT_FIRST_NAME, contact_data['first_name'], contact_uuid)
+            entries.append(("trie", INDEX_CONTACT_FIRST_NAME, contact_data['first_name']))
 
         if contact_data.get('last_name'):
-            self.index_manager.add_to_trie_index(INDEX_CONTACT_LAST_NAME, contact_data['last_name'], contact_uuid)
+            entries.append(("trie", INDEX_CONTACT_LAST_NAME, contact_data['last_name']))
+
+        entries.append(("trigram", INDEX_CONTACT_NAME_TRIGRAM, self._get_full_name(contact_data)))
 
         for phone in contact_data.get('phones', []):
-            self.index_manager.add_to_hash_index(INDEX_CONTACT_PHONE, phone, contact_uuid)
+            entries.append(("hash", INDEX_CONTACT_PHONE, phone))
 
-        # for email in contact_data.get('emails', []):
-        #     self.index_manager.add_to_hash_index(INDEX_CONTACT_EMAIL, email, contact_uuid)
         if contact_data.get('email'):
-            self.index_manager.add_to_hash_index(INDEX_CONTACT_EMAIL, contact_data['email'], contact_uuid)
+            entries.append(("hash", INDEX_CONTACT_EMAIL, contact_data['email']))
 
+        return entries
+
+    def _add_to_indexes(self, contact_uuid: str, contact_data: Dict[str, Any]):
+        """Add contact to all indexes."""
+        self.index_manager.add_bulk(contact_uuid, self._get_index_entries(contact_data))
 
     def _remove_from_indexes(self, contact_uuid: str, contact_data: Dict[str, Any]):
         """Remove contact from all indexes."""
-        if contact_data.get('first_name'):
-            self.index_manager.remove_from_trie_index(INDEX_CONTACT_FIRST_NAME, contact_data['first_name'], contact_uuid)
-
-        if contact_data.get('last_name'):
-            self.index_manager.remove_from_trie_index(INDEX_CONTACT_LAST_NAME, contact_data['last_name'], contact_uuid)
-
-        for phone in contact_data.get('phones', []):
-            self.index_manager.remove_from_hash_index(INDEX_CONTACT_PHONE, phone, contact_uuid)
-
-        if contact_data.get('email'):
-            self.index_manager.remove_from_hash_index(INDEX_CONTACT_EMAIL, contact_data['email'], contact_uuid)
-        # for email in contact_data.get('emails', []):
-        #     self.index_manager.remove_from_hash_index(INDEX_CONTACT_EMAIL, email, contact_uuid)
+        self.index_manager.remove_bulk(contact_uuid, self._get_index_entries(contact_data))
@@ -6,12 +6,31 @@ with automatic index synchronization.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from personal_assistant.storage.heap_storage import HeapStorage
-from personal_assistant.storage.index_manager import IndexManager
+from personal_assistant.storage.sqlite_heap_storage import SqliteHeapStorage
+from personal_assistant.storage.write_back_heap_storage import WriteBackHeapStorage
+from personal_assistant.storage.index_manager import IndexManager, INDEX_FORMAT_VERSION
 from personal_assistant.config import AppConfig
 
 
+# Default (data_path, index_path) per application mode, resolved once per process
+_default_paths: Dict[str, Tuple[str, str]] = {}
+
+
+def _get_default_paths() -> Tuple[str, str]:
+    """
+    Get default storage paths for the current AppConfig mode.
+
+    Returns:
+        Tuple of (data_path, index_path)
+    """
+    mode = AppConfig.get_mode()
+    if mode not in _default_paths:
+        _default_paths[mode] = AppConfig.get_storage_paths()
+    return _default_paths[mode]
+
+
 class BaseStorage(ABC):
     """
     Abstract base class for storage with indexing.
@@ -29,13 +48,20 @@ class BaseStorage(ABC):
             index_root: Directory for storing indexes (None = use config default)
         """
         if data_root is None or index_root is None:
-            data_path, index_path = AppConfig.get_storage_paths()
+            data_path, index_path = _get_default_paths()
             data_root = data_root or data_path
             index_root = index_root or index_path
 
-        self.heap = HeapStorage(data_root)
+        if AppConfig.HEAP_BACKEND == "sqlite":
+            self.heap = SqliteHeapStorage(data_root)
+        elif AppConfig.HEAP_BACKEND == "writeback":
+            self.heap = WriteBackHeapStorage(data_root)
+        else:
+            self.heap = HeapStorage(data_root)
         self.index_manager = IndexManager(index_root)
         self._ensure_indexes()
+        self._migrate_indexes()
+        self._sync_indexes()
 
     def _ensure_indexes(self):
         """
@@ -44,6 +70,27 @@ class BaseStorage(ABC):
         for index_name in self._get_entity_indexes():
             (self.index_manager.index_root / index_name).mkdir(parents=True, exist_ok=True)
 
+    def _migrate_indexes(self):
+        """
+        Rebuild indexes built with an older INDEX_FORMAT_VERSION.
+        """
+        entity_type = self._get_entity_type()
+        if self.index_manager.load_format_version(entity_type) != INDEX_FORMAT_VERSION:
+            self.rebuild_indexes(force=True)
+            self.index_manager.save_format_version(entity_type)
+
+    def _sync_indexes(self):
+        """
+        Reindex entities changed since the last rebuild (e.g. by another process
+        or a crash between a heap write and its index update).
+
+        Indexes are persistent, so startup only compares a cheap heap fingerprint
+        and runs the incremental rebuild when it differs.
+        """
+        entity_type = self._get_entity_type()
+        if self.index_manager.load_heap_fingerprint(entity_type) != self.heap.fingerprint(entity_type):
+            self.rebuild_indexes()
+
     @abstractmethod
     def _add_to_indexes(self, entity_uuid: str, entity_data: Dict[str, Any]):
         """
@@ -66,6 +113,16 @@ class BaseStorage(ABC):
         """
         pass
 
+    @abstractmethod
+    def _get_index_entries(self, entity_data: Dict[str, Any]) -> List[Tuple[str, str, str]]:
+        """
+        Get (kind, index_name, value) entries of an entity for IndexManager bulk operations.
+
+        Args:
+            entity_data: Entity data
+        """
+        pass
+
     @abstractmethod
     def _get_entity_indexes(self) -> List[str]:
         """
@@ -86,28 +143,105 @@ class BaseStorage(ABC):
         """
         pass
 
-    def rebuild_indexes(self) -> int:
+    def rebuild_indexes(self, force: bool = False) -> int:
         """
-        Rebuild all indexes from scratch.
+        Rebuild indexes.
 
-        This method:
+        A full rebuild:
         1. Clears all indexes
         2. Reads all entities from storage
         3. Rebuilds indexes for all entities
 
+        It runs when force is True or there is no manifest from a previous
+        rebuild. Otherwise only entities changed, added or removed since the
+        last rebuild (by file modification time) are reindexed.
+
+        Args:
+            force: Always rebuild from scratch
+
+        Returns:
+            Number of entities reindexed
+        """
+        entity_type = self._get_entity_type()
+        manifest = None if force else self.index_manager.load_manifest(entity_type)
+
+        # pending (batched / write-back) records must be on disk to get a version
+        self.heap.flush()
+
+        # scan before reading, so a file changed in between is picked up next time
+        fingerprint = self.heap.fingerprint(entity_type)
+        versions = self.heap.scan_versions(entity_type)
+
+        if manifest is None:
+            count = self._rebuild_all_indexes(versions)
+            self.index_manager.save_heap_fingerprint(entity_type, fingerprint)
+            return count
+
+        reindexed = 0
+        removed = 0
+
+        with self.index_manager.bulk_update():
+            for entity_uuid, entry in list(manifest.items()):
+                if versions.get(entity_uuid) != entry.get('mtime_ns'):
+                    # the entity may be gone or changed, remove what it was indexed with
+                    entries = [tuple(index_entry) for index_entry in entry.get('entries', [])]
+                    self.index_manager.remove_bulk(entity_uuid, entries)
+                    del manifest[entity_uuid]
+                    removed += 1
+
+            for entity_uuid, mtime_ns in versions.items():
+                if entity_uuid in manifest:
+                    continue
+
+                entity = self.heap.read(entity_type, entity_uuid)
+                if entity:
+                    self._add_to_indexes(entity_uuid, entity)
+                    manifest[entity_uuid] = self._get_manifest_entry(mtime_ns, entity)
+                    reindexed += 1
+
+        # unchanged manifest, skip rewriting it
+        if reindexed or removed:
+            self.index_manager.save_manifest(entity_type, manifest)
+        self.index_manager.save_heap_fingerprint(entity_type, fingerprint)
+        return reindexed
+
+    def _rebuild_all_indexes(self, versions: Dict[str, int]) -> int:
+        """
+        Rebuild all indexes from scratch and write a new manifest.
+
+        Args:
+            versions: Dict {uuid: mtime_ns} scanned before reading entities
+
         Returns:
             Number of entities reindexed
         """
         self.index_manager.rebuild_index_set(self._get_entity_indexes())
 
-        all_entities = self._list_all_entities()
+        manifest = {}
+        count = 0
+
+        with self.index_manager.bulk_update():
+            for entity in self._iter_all_entities():
+                count += 1
+                entity_uuid = entity.get('uuid')
+                if entity_uuid:
+                    self._add_to_indexes(entity_uuid, entity)
+                    manifest[entity_uuid] = self._get_manifest_entry(versions.get(entity_uuid, 0), entity)
+
+        self.index_manager.save_manifest(self._get_entity_type(), manifest)
+        return count
+
+    def _get_manifest_entry(self, mtime_ns: int, entity_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Get manifest entry of an indexed entity.
 
-        for entity in all_entities:
-            entity_uuid = entity.get('uuid')
-            if entity_uuid:
-                self._add_to_indexes(entity_uuid, entity)
+        Only the index entries are kept (not the whole entity, which is in the heap),
+        they are all an incremental rebuild needs to unindex a changed entity.
 
-        return len(all_entities)
+        Returns:
+            Dict {"mtime_ns": ..., "entries": [[kind, index_name, value], ...]}
+        """
+        return {'mtime_ns': mtime_ns, 'entries': self._get_index_entries(entity_data)}
 
     def _list_all_entities(self) -> List[Dict[str, Any]]:
         """
@@ -117,3 +251,12 @@ class BaseStorage(ABC):
             List of all entities
         """
         return self.heap.list_all(self._get_entity_type())
+
+    def _iter_all_entities(self) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over all entities from heap storage one at a time.
+
+        Yields:
+            Entity data
+        """
+        return self.heap.iter_all(self._get_entity_type())
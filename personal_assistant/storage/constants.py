@@ -12,22 +12,28 @@ INDEX_CONTACT_FIRST_NAME = "contact_first_name"
 INDEX_CONTACT_LAST_NAME = "contact_last_name"
 INDEX_CONTACT_PHONE = "contact_phone"
 INDEX_CONTACT_EMAIL = "contact_email"
+INDEX_CONTACT_NAME_TRIGRAM = "contact_name_trigram"
 
 INDEX_NOTE_TITLE = "note_title"
 INDEX_NOTE_TAG = "note_tag"
 INDEX_NOTE_CREATION_DATE = "note_creation_date"
+INDEX_NOTE_CONTENT_TRIGRAM = "note_content_trigram"
+INDEX_NOTE_CONTACT = "note_contact"
 
 CONTACT_INDEXES = [
     INDEX_CONTACT_FIRST_NAME,
     INDEX_CONTACT_LAST_NAME,
     INDEX_CONTACT_PHONE,
     INDEX_CONTACT_EMAIL,
+    INDEX_CONTACT_NAME_TRIGRAM,
 ]
 
 NOTE_INDEXES = [
     INDEX_NOTE_TITLE,
     INDEX_NOTE_TAG,
     INDEX_NOTE_CREATION_DATE,
+    INDEX_NOTE_CONTENT_TRIGRAM,
+    INDEX_NOTE_CONTACT,
 ]
 
 ALL_INDEXES = CONTACT_INDEXES + NOTE_INDEXES
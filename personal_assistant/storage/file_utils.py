@@ -0,0 +1,21 @@
+"""
+File system helpers shared by HeapStorage and IndexManager.
+"""
+
+import os
+from typing import Union
+
+
+def fsync_directory(directory: Union[str, os.PathLike]):
+    """Persist directory entries (no-op where directories can't be opened, e.g. Windows)."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
@@ -16,10 +16,34 @@ import os
 import json
 import uuid
 import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, Iterable, Iterator, List, Set, Tuple
 from datetime import datetime
 
+from personal_assistant.config import AppConfig
+from personal_assistant.storage.file_utils import fsync_directory
+
+# Records are read in one go, a larger buffer avoids extra read() calls
+READ_BUFFER_SIZE = 64 * 1024
+
+# json.dumps builds a new JSONEncoder on every call with non-default options,
+# shared instances skip that (encode() keeps no state between calls)
+_COMPACT_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+_PRETTY_ENCODER = json.JSONEncoder(ensure_ascii=False, indent=2)
+
+# Max number of record files kept in memory by HeapStorage
+CACHE_SIZE = 4096
+
+# Max number of record creation timestamps kept in memory by HeapStorage
+CREATED_AT_CACHE_SIZE = 16384
+
+# list_all loads records in a thread pool starting from this many files
+PARALLEL_LOAD_THRESHOLD = 64
+
 
 class HeapStorage:
     """
@@ -34,14 +58,43 @@ class HeapStorage:
             data_root: Root directory for data
         """
         self.data_root = Path(data_root)
+        # serialized records waiting for flush() while inside batch()
+        self._pending: Optional[Dict[str, bytes]] = None
+        # False inside batch(durable=False): pending records skip the atomic rename
+        self._durable = True
+        # LRU cache of raw record files: {file_path: (mtime_ns, payload)}
+        self._cache: "OrderedDict[str, Tuple[int, bytes]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        # LRU of created_at of recently seen records ({file_path: created_at}), lets updates skip parsing
+        self._created_at: "OrderedDict[str, str]" = OrderedDict()
+        # directories already created, so writes don't mkdir every time
+        self._known_dirs: Set[str] = set()
+        # record paths are plain strings built from these, os.* calls take them as is
+        self._entity_dirs: Dict[str, str] = {
+            "contacts": str(self.data_root / "contacts"),
+            "notes": str(self.data_root / "notes"),
+        }
         self._ensure_directories()
 
     def _ensure_directories(self):
         """Creates directory structure for storage."""
-        (self.data_root / "contacts").mkdir(parents=True, exist_ok=True)
-        (self.data_root / "notes").mkdir(parents=True, exist_ok=True)
+        for directory in self._entity_dirs.values():
+            self._ensure_dir(directory)
+
+    def _ensure_dir(self, directory: str):
+        """Create directory on first use."""
+        if directory not in self._known_dirs:
+            os.makedirs(directory, exist_ok=True)
+            self._known_dirs.add(directory)
 
-    def _get_file_path(self, entity_type: str, entity_uuid: str) -> Path:
+    def _get_entity_dir(self, entity_type: str) -> str:
+        """Get directory of an entity type."""
+        directory = self._entity_dirs.get(entity_type)
+        if directory is None:
+            directory = self._entity_dirs[entity_type] = str(self.data_root / entity_type)
+        return directory
+
+    def _get_file_path(self, entity_type: str, entity_uuid: str) -> str:
         """
         Get path to a record file.
 
@@ -52,27 +105,56 @@ class HeapStorage:
         Returns:
             Path to the file
         """
-        return self.data_root / entity_type / f"{entity_uuid}.json"
+        return f"{self._get_entity_dir(entity_type)}{os.sep}{entity_uuid}.json"
 
-    def _save_atomic(self, file_path: Path, data: Dict[str, Any]):
+    def _save_atomic(self, file_path: str, data: Dict[str, Any], new_file: bool = False):
         """
         Atomically save data (atomic rename pattern).
 
         Args:
             file_path: Path to the file
             data: Data to save
+            new_file: File is created for a freshly generated UUID, so there is
+                nothing to replace and it is written directly (no tempfile + rename)
         """
-        file_path.parent.mkdir(parents=True, exist_ok=True)
+        if data.get('created_at'):
+            self._remember_created_at(file_path, data['created_at'])
+
+        if self._pending is not None:
+            self._pending[file_path] = self._serialize(data)
+            return
+
+        self._ensure_dir(os.path.dirname(file_path))
+        if new_file:
+            self._write_bytes_direct(file_path, self._serialize(data))
+        else:
+            self._write_bytes_atomic(file_path, self._serialize(data))
+
+    @staticmethod
+    def _serialize(data: Dict[str, Any]) -> bytes:
+        """Serialize record into compact UTF-8 JSON (pretty-printed if AppConfig.DEBUG_PRETTY_JSON)."""
+        encoder = _PRETTY_ENCODER if AppConfig.DEBUG_PRETTY_JSON else _COMPACT_ENCODER
+        return encoder.encode(data).encode('utf-8')
+
+    def _write_bytes_atomic(self, file_path: str, payload: bytes):
+        """
+        Atomically write already serialized payload with a single write() call.
+
+        Parent directory must exist.
+        """
+        self._invalidate(file_path)
 
         fd, tmp_path = tempfile.mkstemp(
-            dir=file_path.parent,
+            dir=os.path.dirname(file_path),
             prefix='.tmp_',
             suffix='.json'
         )
 
         try:
-            with os.fdopen(fd, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            try:
+                self._write_all(fd, payload)
+            finally:
+                os.close(fd)
 
             os.replace(tmp_path, file_path)
         except Exception as e:
@@ -82,22 +164,205 @@ class HeapStorage:
                 pass
             raise e
 
-    def _load(self, file_path: Path) -> Optional[Dict[str, Any]]:
+    def _write_bytes_direct(self, file_path: str, payload: bytes):
+        """
+        Overwrite file in place with a single write() call (not crash safe).
+
+        Parent directory must exist.
+        """
+        self._invalidate(file_path)
+
+        fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+        try:
+            self._write_all(fd, payload)
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    def _write_all(fd: int, payload: bytes):
+        """Write the whole payload to a file descriptor."""
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+
+    # ============================================================
+    # Batched writes
+    # ============================================================
+
+    def batch_write(self, items: List[Tuple[str, Dict[str, Any]]], durable: bool = True):
+        """
+        Save many records at once.
+
+        Parent directories are created once per batch and every record
+        is written with a single write() call.
+
+        Args:
+            items: List of (file_path, data)
+            durable: Save every record atomically; if False, files are
+                overwritten in place, see batch()
+        """
+        self._flush_payloads(
+            [(os.fspath(file_path), self._serialize(data)) for file_path, data in items], durable
+        )
+
+    def _flush_payloads(self, payloads: List[Tuple[str, bytes]], durable: bool = True):
+        """Write serialized records to disk."""
+        parents = {os.path.dirname(file_path) for file_path, _ in payloads}
+        for parent in parents:
+            self._ensure_dir(parent)
+
+        if durable:
+            for file_path, payload in payloads:
+                self._write_bytes_atomic(file_path, payload)
+            return
+
+        for file_path, payload in payloads:
+            self._write_bytes_direct(file_path, payload)
+
+        # file contents are left to the OS, only the new directory entries are synced
+        for parent in parents:
+            fsync_directory(parent)
+
+    @contextmanager
+    def batch(self, durable: bool = True):
+        """
+        Collect all writes made inside the block and save them on exit.
+
+        Reads inside the block see pending records. Nested blocks are
+        merged into the outermost one, as is every other write made while
+        the block is open, so it must not await or wait for user input.
+
+        Args:
+            durable: Save every record atomically (tempfile + rename). Bulk
+                imports of new records may pass False to write files in place;
+                file contents are not synced, only their directories once at
+                the end, so after a crash the last records may be lost or torn
+                (a torn record is read as corrupted and skipped).
+
+        Usage:
+            with heap.batch():
+                for data in contacts:
+                    heap.create_contact(data)
+        """
+        if self._pending is not None:
+            yield self
+            return
+
+        self._pending = {}
+        self._durable = durable
+        try:
+            yield self
+        finally:
+            self.flush()
+            self._pending = None
+            self._durable = True
+
+    def flush(self):
+        """Write records collected by batch() to disk."""
+        if not self._pending:
+            return
+
+        payloads = list(self._pending.items())
+        self._pending.clear()
+        self._flush_payloads(payloads, self._durable)
+
+    def _load(self, file_path: str) -> Optional[Dict[str, Any]]:
         """
         Load data from file.
 
         Returns:
             Dict with data or None if file doesn't exist or is corrupted
         """
-        if not file_path.exists():
+        payload = self._pending.get(file_path) if self._pending else None
+        if payload is not None:
+            return json.loads(payload)
+
+        # a missing file is reported as OSError, no separate exists() check needed
+        try:
+            mtime_ns = os.stat(file_path).st_mtime_ns
+        except OSError:
+            self._invalidate(file_path)
             return None
 
+        with self._cache_lock:
+            cached = self._cache.get(file_path)
+            if cached is not None and cached[0] == mtime_ns:
+                self._cache.move_to_end(file_path)
+                payload = cached[1]
+            else:
+                payload = None
+
+        # parsing the compact bytes hands out a fresh dict and is cheaper than deep-copying a parsed one
+        if payload is not None:
+            return json.loads(payload)
+
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            # binary mode skips the TextIOWrapper layer, json decodes UTF-8 bytes itself
+            with open(file_path, 'rb', buffering=READ_BUFFER_SIZE) as f:
+                payload = f.read()
+            data = json.loads(payload)
         except (json.JSONDecodeError, IOError, UnicodeDecodeError):
             return None
 
+        if isinstance(data, dict) and data.get('created_at'):
+            self._remember_created_at(file_path, data['created_at'])
+
+        with self._cache_lock:
+            self._cache[file_path] = (mtime_ns, payload)
+            self._cache.move_to_end(file_path)
+            if len(self._cache) > CACHE_SIZE:
+                self._cache.popitem(last=False)
+
+        return data
+
+    def _remember_created_at(self, file_path: str, created_at: str):
+        """Remember created_at of a record, forgetting the least recently used ones past CREATED_AT_CACHE_SIZE."""
+        with self._cache_lock:
+            self._created_at[file_path] = created_at
+            self._created_at.move_to_end(file_path)
+            if len(self._created_at) > CREATED_AT_CACHE_SIZE:
+                self._created_at.popitem(last=False)
+
+    def _invalidate(self, file_path: str):
+        """Drop record from the in-memory cache."""
+        with self._cache_lock:
+            self._cache.pop(file_path, None)
+
+    def _load_metadata(self, file_path: str) -> Optional[Dict[str, Any]]:
+        """
+        Get uuid and created_at of a record.
+
+        Known records are only checked for existence, without parsing the file.
+
+        Returns:
+            Dict {'uuid': ..., 'created_at': ...} or None if record doesn't exist
+        """
+        created_at = self._created_at.get(file_path)
+        if created_at is not None and ((self._pending and file_path in self._pending) or os.path.exists(file_path)):
+            return {'uuid': os.path.basename(file_path)[:-len('.json')], 'created_at': created_at}
+
+        return self._load(file_path)
+
+    def _delete(self, file_path: str) -> bool:
+        """
+        Delete record file (and its pending write, if any).
+
+        Returns:
+            True if successful, False if record not found
+        """
+        was_pending = bool(self._pending) and self._pending.pop(file_path, None) is not None
+        self._invalidate(file_path)
+        with self._cache_lock:
+            self._created_at.pop(file_path, None)
+
+        try:
+            os.unlink(file_path)
+            return True
+        except FileNotFoundError:
+            return was_pending
+        except OSError:
+            return False
+
     # ============================================================
     # CRUD operations for contacts
     # ============================================================
@@ -115,12 +380,13 @@ class HeapStorage:
 
         contact_uuid = str(uuid.uuid4())
 
+        now = datetime.now().isoformat()
         contact_data['uuid'] = contact_uuid
-        contact_data['created_at'] = datetime.now().isoformat()
-        contact_data['updated_at'] = datetime.now().isoformat()
+        contact_data['created_at'] = now
+        contact_data['updated_at'] = now
 
         file_path = self._get_file_path("contacts", contact_uuid)
-        self._save_atomic(file_path, contact_data)
+        self._save_atomic(file_path, contact_data, new_file=True)
 
         return contact_data
 
@@ -147,10 +413,10 @@ class HeapStorage:
         """
         file_path = self._get_file_path("contacts", contact_uuid)
 
-        if not file_path.exists():
+        existing = self._load_metadata(file_path)
+        if existing is None:
             return False
 
-        existing = self._load(file_path)
         contact_data = self._add_metadata(existing, contact_data)
         # contact_data['uuid'] = contact_uuid
         # contact_data['created_at'] = existing.get('created_at', datetime.now().isoformat())
@@ -167,15 +433,7 @@ class HeapStorage:
             True if successful, False if contact not found
         """
         file_path = self._get_file_path("contacts", contact_uuid)
-
-        if not file_path.exists():
-            return False
-
-        try:
-            file_path.unlink()
-            return True
-        except OSError:
-            return False
+        return self._delete(file_path)
 
     def list_all_contacts(self) -> List[Dict[str, Any]]:
         """
@@ -186,6 +444,80 @@ class HeapStorage:
         """
         return self.list_all("contacts")
 
+    def read(self, entity_type: str, entity_uuid: str) -> Optional[Dict[str, Any]]:
+        """
+        Read entity of a given type by UUID.
+
+        Returns:
+            Dict with entity data or None
+        """
+        return self._load(self._get_file_path(entity_type, entity_uuid))
+
+    def read_many(self, entity_type: str, entity_uuids: Iterable[str]) -> List[Dict[str, Any]]:
+        """
+        Read several entities of a given type at once.
+
+        Args:
+            entity_type: "contacts" or "notes"
+            entity_uuids: UUIDs to read
+
+        Returns:
+            List of found entities (missing UUIDs are skipped)
+        """
+        file_paths = [self._get_file_path(entity_type, entity_uuid) for entity_uuid in entity_uuids]
+        return [entity for entity in self._load_many(file_paths) if entity]
+
+    def _load_many(self, file_paths: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """Load several files, in parallel when there are many of them."""
+        if len(file_paths) >= PARALLEL_LOAD_THRESHOLD:
+            # loads block on I/O, so threads overlap them despite the GIL
+            with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 4) * 4)) as pool:
+                return list(pool.map(self._load, file_paths))
+        return [self._load(file_path) for file_path in file_paths]
+
+    def fingerprint(self, entity_type: str) -> List[int]:
+        """
+        Get a cheap fingerprint of all entities of a given type.
+
+        It is the modification time of the entity directory, which changes
+        whenever a record file is created, replaced (atomic rename) or deleted.
+        In-place overwrites (non-durable batches) are not detected.
+
+        Returns:
+            [dir_mtime_ns] or [] if the directory doesn't exist
+        """
+        try:
+            return [os.stat(self._get_entity_dir(entity_type)).st_mtime_ns]
+        except FileNotFoundError:
+            return []
+
+    def scan_versions(self, entity_type: str) -> Dict[str, int]:
+        """
+        Get modification times of all entities of a given type stored on disk.
+
+        Args:
+            entity_type: "contacts" or "notes"
+
+        Returns:
+            Dict {uuid: mtime_ns}
+        """
+        versions = {}
+
+        try:
+            with os.scandir(self._get_entity_dir(entity_type)) as it:
+                for entry in it:
+                    name = entry.name
+                    if name[:1] == '.' or name[-5:] != '.json':
+                        continue
+                    try:
+                        versions[name[:-5]] = entry.stat().st_mtime_ns
+                    except FileNotFoundError:
+                        continue
+        except FileNotFoundError:
+            pass
+
+        return versions
+
     def list_all(self, entity_type: str) -> List[Dict[str, Any]]:
         """
         Get all entities of a given type.
@@ -196,22 +528,61 @@ class HeapStorage:
         Returns:
             List of all entities
         """
-        entity_dir = self.data_root / entity_type
-        entities = []
+        entity_dir = self._get_entity_dir(entity_type)
+        pending = self._get_pending_in(entity_dir)
+        file_paths = list(self._iter_file_paths(entity_dir, pending))
+
+        entities = [entity for entity in self._load_many(file_paths) if entity]
+        entities.extend(json.loads(payload) for payload in pending.values())
+
+        return entities
+
+    def iter_all(self, entity_type: str) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over all entities of a given type, loading one at a time.
 
-        if not entity_dir.exists():
-            return entities
+        Args:
+            entity_type: "contacts" or "notes"
 
-        for file_path in entity_dir.glob("*.json"):
-            # ignore macOS hidden files and temp files
-            if file_path.name.startswith('._'):
-                continue
+        Yields:
+            Entity data
+        """
+        entity_dir = self._get_entity_dir(entity_type)
+        pending = self._get_pending_in(entity_dir)
 
+        for file_path in self._iter_file_paths(entity_dir, pending):
             entity = self._load(file_path)
             if entity:
-                entities.append(entity)
-
-        return entities
+                yield entity
+
+        for payload in pending.values():
+            yield json.loads(payload)
+
+    def _get_pending_in(self, entity_dir: str) -> Dict[str, bytes]:
+        """Get pending (not yet flushed) records of a directory."""
+        return {
+            file_path: payload for file_path, payload in (self._pending or {}).items()
+            if os.path.dirname(file_path) == entity_dir
+        }
+
+    @staticmethod
+    def _iter_file_paths(entity_dir: str, skip: Dict[str, bytes]) -> Iterator[str]:
+        """Iterate over record files of a directory, except paths in skip."""
+        prefix = entity_dir + os.sep
+        try:
+            with os.scandir(entity_dir) as it:
+                for entry in it:
+                    name = entry.name
+                    # ignore hidden files (macOS "._*") and temp files (".tmp_*");
+                    # slice compares avoid method calls in this per-file loop
+                    if name[:1] == '.' or name[-5:] != '.json':
+                        continue
+
+                    file_path = prefix + name
+                    if file_path not in skip:
+                        yield file_path
+        except FileNotFoundError:
+            return
 
     # ============================================================
     # CRUD operations for notes
@@ -229,13 +600,14 @@ class HeapStorage:
         """
         note_uuid = str(uuid.uuid4())
 
+        now = datetime.now().isoformat()
         note_data['uuid'] = note_uuid
         if 'created_at' not in note_data:
-            note_data['created_at'] = datetime.now().isoformat()
-        note_data['updated_at'] = datetime.now().isoformat()
+            note_data['created_at'] = now
+        note_data['updated_at'] = now
 
         file_path = self._get_file_path("notes", note_uuid)
-        self._save_atomic(file_path, note_data)
+        self._save_atomic(file_path, note_data, new_file=True)
 
         return note_data
 
@@ -262,11 +634,10 @@ class HeapStorage:
         """
         file_path = self._get_file_path("notes", note_uuid)
 
-        if not file_path.exists():
+        existing = self._load_metadata(file_path)
+        if existing is None:
             return False
 
-
-        existing = self._load(file_path)
         note_data = self._add_metadata(existing, note_data)
         # existing = self._load(file_path)
         # note_data['uuid'] = note_uuid
@@ -284,15 +655,7 @@ class HeapStorage:
             True if successful, False if note not found
         """
         file_path = self._get_file_path("notes", note_uuid)
-
-        if not file_path.exists():
-            return False
-
-        try:
-            file_path.unlink()
-            return True
-        except OSError:
-            return False
+        return self._delete(file_path)
 
     def list_all_notes(self) -> List[Dict[str, Any]]:
         """
@@ -303,6 +666,15 @@ class HeapStorage:
         """
         return self.list_all("notes")
 
+    def iter_all_notes(self) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over all notes, loading one at a time.
+
+        Yields:
+            Note data
+        """
+        return self.iter_all("notes")
+
     def _add_metadata(self, existing: Dict[str, Any], new_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Preserve UUID and creation timestamp in new data.
@@ -314,7 +686,8 @@ class HeapStorage:
         Returns:
             Merged data with preserved fields
         """
+        now = datetime.now().isoformat()
         new_data['uuid'] = existing.get('uuid')
-        new_data['created_at'] = existing.get('created_at', datetime.now().isoformat())
-        new_data['updated_at'] = datetime.now().isoformat()
+        new_data['created_at'] = existing.get('created_at') or now
+        new_data['updated_at'] = now
         return new_data
\ No newline at end of file
@@ -4,23 +4,81 @@ IndexManager — indexing system for fast contact search.
 Implements:
 - Trie indexes for contact_first_name and contact_last_name (prefix search)
 - Hash indexes for contact_phone and contact_email (exact search)
+- Trigram index for contact full names (substring search)
 - Atomic write through atomic rename pattern
+- Append-only mutation log per index file with compaction
+- Memory-mapped packed copies of Hash and Trie index buckets for lookups
+- In-memory LRU of parsed index files, validated by file mtime and size
 """
 
 import os
+import sys
 import json
+import calendar
 import hashlib
 import tempfile
+from collections import OrderedDict
+from contextlib import contextmanager
+from datetime import date, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Any
+from typing import Dict, Iterator, List, Optional, Set, Any, Tuple
 from threading import Lock
+
+from personal_assistant.storage.mmap_hash_bucket import HASH_SIZE, MmapHashBucket
+from personal_assistant.storage.mmap_trie_bucket import MmapTrieBucket
+from personal_assistant.storage.file_utils import fsync_directory
 from personal_assistant.storage.constants import (
     INDEX_CONTACT_FIRST_NAME,
     INDEX_CONTACT_LAST_NAME,
     INDEX_CONTACT_PHONE,
     INDEX_CONTACT_EMAIL,
+    INDEX_CONTACT_NAME_TRIGRAM,
 )
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# bulk_update() writes buffered index files out once this many are held in memory
+BULK_MAX_FILES = 4096
+
+# Shared encoder, json.dumps would build a new JSONEncoder per call for these options.
+# Index files are machine-only, so they are always written compact.
+_COMPACT_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+
+# Max number of parsed index files kept in memory
+CACHE_SIZE = 1024
+
+# Number of locks index files are spread over (power of two)
+LOCK_STRIPES = 256
+
+# On-disk index format, bump when stored keys change (storages rebuild outdated indexes)
+# 2: hash index keys are blake2b digests instead of sha1
+# 3: trie indexes keep an aggregate file per first letter
+# 4: date indexes keep an aggregate file per month
+# 5: hash index keys are 64-bit blake2b digests
+# 6: notes have content trigram and contact indexes
+# 7: manifest keeps index entries of every entity instead of the entity
+INDEX_FORMAT_VERSION = 7
+
+# Trie index file with all values of a first letter (used by one-letter prefix searches)
+TRIE_AGGREGATE_FILE = "__all__.json"
+
+# Date index file with all uuids of a month (used by month and year searches)
+DATE_AGGREGATE_FILE = "__month__.json"
+
+
+@lru_cache(maxsize=8192)
+def _bucket_path(index_root: Path, index_type: str, directory: str, name: str) -> Path:
+    """
+    Get path to an index bucket file "<index_root>/<index_type>/<directory>/<name>.json".
+
+    Paths of hot buckets are built once; directories are created by the writes.
+    """
+    return index_root / index_type / directory / f"{name}.json"
+
 
 class IndexManager:
     """
@@ -40,7 +98,8 @@ class IndexManager:
     │   │   └── b2.json
     │   └── e4/
     │       └── f5.json
-    └── contact_email/          # Hash index
+    ├── contact_email/          # Hash index
+    └── contact_name_trigram/   # Trigram index (stored as Hash index of trigrams)
     """
 
     def __init__(self, index_root: str = "index_store"):
@@ -49,7 +108,14 @@ class IndexManager:
             index_root: Root directory for all indexes
         """
         self.index_root = Path(index_root)
-        self._locks: Dict[str, Lock] = {}  # locks for atomicity
+        # fixed set of locks for atomicity, a file maps to a stripe by its path hash
+        self._lock_stripes: List[Lock] = [Lock() for _ in range(LOCK_STRIPES)]
+        # index files buffered in memory while inside bulk_update()
+        self._bulk: Optional[Dict[Path, dict]] = None
+        self._bulk_limit = BULK_MAX_FILES
+        # parsed index files (without their mutation log), validated by (mtime_ns, size)
+        self._cache: "OrderedDict[Path, Tuple[Tuple[int, int], dict]]" = OrderedDict()
+        self._cache_lock = Lock()
         self._ensure_directories()
 
     def _ensure_directories(self):
@@ -62,19 +128,22 @@ class IndexManager:
         (self.index_root / INDEX_CONTACT_PHONE).mkdir(parents=True, exist_ok=True)
         (self.index_root / INDEX_CONTACT_EMAIL).mkdir(parents=True, exist_ok=True)
 
+        # trigram indexes
+        (self.index_root / INDEX_CONTACT_NAME_TRIGRAM).mkdir(parents=True, exist_ok=True)
+
     def _get_lock(self, file_path: str) -> Lock:
-        """Get or create lock for file."""
-        if file_path not in self._locks:
-            self._locks[file_path] = Lock()
-        return self._locks[file_path]
+        """Get lock for file."""
+        return self._lock_stripes[hash(file_path) & (LOCK_STRIPES - 1)]
 
-    def _atomic_write_json(self, file_path: Path, data: Dict[str, Any]):
+    def _atomic_write_json(self, file_path: Path, data: Dict[str, Any], durable: bool = True):
         """
         Atomically save JSON data using atomic rename pattern.
 
         Args:
             file_path: Path to the file
             data: Data to save as JSON
+            durable: fsync the file before the rename and its directory after it;
+                bulk commits pass False and write best-effort (see commit())
         """
         file_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -84,11 +153,18 @@ class IndexManager:
             suffix='.json'
         )
 
+        payload = _COMPACT_ENCODER.encode(data).encode('utf-8')
+
         try:
-            with os.fdopen(fd, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            with os.fdopen(fd, 'wb') as f:
+                f.write(payload)
+                if durable:
+                    f.flush()
+                    os.fsync(f.fileno())
 
             os.replace(tmp_path, file_path)
+            if durable:
+                fsync_directory(file_path.parent)
         except Exception as e:
             try:
                 os.unlink(tmp_path)
@@ -114,15 +190,9 @@ class IndexManager:
         normalized = value.lower().strip()
         if len(normalized) < 2:
             # for names shorter than 2 characters use special file
-            return self.index_root / index_type / "_short" / f"{normalized[0] if normalized else '_'}.json"
-
-        first_char = normalized[0]
-        second_char = normalized[1]
-
-        first_dir = self.index_root / index_type / first_char
-        first_dir.mkdir(parents=True, exist_ok=True)
+            return _bucket_path(self.index_root, index_type, "_short", normalized[0] if normalized else '_')
 
-        return first_dir / f"{second_char}.json"
+        return _bucket_path(self.index_root, index_type, normalized[0], normalized[1])
 
     def _load_trie_index(self, file_path: Path) -> Dict[str, List[str]]:
         """
@@ -131,14 +201,7 @@ class IndexManager:
         Returns:
             Dict[full_name -> list_of_uuids]
         """
-        if not file_path.exists():
-            return {}
-
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError, UnicodeDecodeError):
-            return {}
+        return self._read_index_file(file_path)
 
     def _save_trie_index_atomic(self, file_path: Path, data: Dict[str, List[str]]):
         """
@@ -148,7 +211,55 @@ class IndexManager:
             file_path: Path to index file
             data: Data to save
         """
-        self._atomic_write_json(file_path, data)
+        self._write_index_file(file_path, data)
+
+    def _search_trie_bucket(self, file_path: Path, prefix: str) -> Iterator[Tuple[str, List[str]]]:
+        """
+        Iterate over entries of a Trie index file whose key starts with prefix.
+
+        Entries are looked up in the packed memory-mapped copy of the bucket
+        (see MmapTrieBucket); if it is missing or stale, the JSON bucket is
+        parsed and the packed copy is rebuilt for the next search.
+
+        Yields:
+            (key, list_of_uuids)
+        """
+        if self._bulk is not None and file_path in self._bulk:
+            for key, uuids in self._bulk[file_path].items():
+                if key.startswith(prefix):
+                    yield key, uuids
+            return
+
+        bucket = MmapTrieBucket(file_path)
+        version = bucket.source_version()
+        if version is None:
+            return
+
+        matches = bucket.lookup_prefix(prefix, version)
+        if matches is None:
+            index_data = self._load_trie_index(file_path)
+            bucket.build(index_data, version)
+            matches = [(key, uuids) for key, uuids in index_data.items() if key.startswith(prefix)]
+
+        yield from matches
+
+    def _get_trie_paths(self, index_type: str, value: str) -> List[Path]:
+        """
+        Get all Trie index files a value is stored in.
+
+        Besides its two-letter bucket, a value is copied into the aggregate
+        file of its first letter, so one-letter prefix searches read a single
+        file instead of every bucket of the letter.
+
+        Returns:
+            [bucket path] or [bucket path, aggregate path]
+        """
+        file_path = self._get_trie_path(index_type, value)
+        if not file_path:
+            return []
+        if file_path.parent.name == "_short":
+            return [file_path]
+        return [file_path, file_path.parent / TRIE_AGGREGATE_FILE]
 
     def add_to_trie_index(self, index_type: str, value: str, uuid: str):
         """
@@ -162,23 +273,9 @@ class IndexManager:
         if not value or not value.strip():
             return
 
-        file_path = self._get_trie_path(index_type, value)
-        if not file_path:
-            return
-
         normalized = value.lower().strip()
-        lock = self._get_lock(str(file_path))
-
-        with lock:
-            index_data = self._load_trie_index(file_path)
-
-            if normalized not in index_data:
-                index_data[normalized] = []
-
-            if uuid not in index_data[normalized]:
-                index_data[normalized].append(uuid)
-
-            self._save_trie_index_atomic(file_path, index_data)
+        for file_path in self._get_trie_paths(index_type, value):
+            self._apply_ops(file_path, [('+', normalized, uuid)])
 
     def remove_from_trie_index(self, index_type: str, value: str, uuid: str):
         """
@@ -192,24 +289,39 @@ class IndexManager:
         if not value or not value.strip():
             return
 
-        file_path = self._get_trie_path(index_type, value)
-        if not file_path or not file_path.exists():
-            return
-
         normalized = value.lower().strip()
-        lock = self._get_lock(str(file_path))
+        for file_path in self._get_trie_paths(index_type, value):
+            if self._index_file_exists(file_path):
+                self._apply_ops(file_path, [('-', normalized, uuid)])
 
-        with lock:
-            index_data = self._load_trie_index(file_path)
+    def _iter_prefix_matches(self, index_type: str, prefix: str) -> Iterator[Tuple[str, List[str]]]:
+        """
+        Iterate over Trie index entries whose value starts with prefix.
 
-            if normalized in index_data:
-                if uuid in index_data[normalized]:
-                    index_data[normalized].remove(uuid)
+        Yields:
+            (value, list_of_uuids)
+        """
+        normalized_prefix = prefix.lower().strip()
+        if not normalized_prefix:
+            return
 
-                if not index_data[normalized]:
-                    del index_data[normalized]
+        if len(normalized_prefix) < 2:
+            # search in file for short names
+            file_path = self.index_root / index_type / "_short" / f"{normalized_prefix[0]}.json"
+            if self._index_file_exists(file_path):
+                yield from self._search_trie_bucket(file_path, normalized_prefix)
+
+            # every name of the letter is in its aggregate file, all keys match the prefix
+            file_path = self.index_root / index_type / normalized_prefix[0] / TRIE_AGGREGATE_FILE
+            if self._index_file_exists(file_path):
+                yield from self._load_trie_index(file_path).items()
+        else:
+            first_char = normalized_prefix[0]
+            second_char = normalized_prefix[1]
 
-            self._save_trie_index_atomic(file_path, index_data)
+            file_path = self.index_root / index_type / first_char / f"{second_char}.json"
+            if self._index_file_exists(file_path):
+                yield from self._search_trie_bucket(file_path, normalized_prefix)
 
     def search_by_prefix(self, index_type: str, prefix: str) -> Dict[str, List[str]]:
         """
@@ -222,41 +334,25 @@ class IndexManager:
         Returns:
             Dict {value: [uuid1, uuid2, ...]}
         """
-        normalized_prefix = prefix.lower().strip()
-        if not normalized_prefix:
-            return {}
+        return dict(self._iter_prefix_matches(index_type, prefix))
 
-        results = {}
-
-        if len(normalized_prefix) < 2:
-            # search in file for short names
-            file_path = self.index_root / index_type / "_short" / f"{normalized_prefix[0]}.json"
-            if file_path.exists():
-                index_data = self._load_trie_index(file_path)
-                for key, uuids in index_data.items():
-                    if key.startswith(normalized_prefix):
-                        results[key] = uuids
-
-            first_char = normalized_prefix[0]
-            first_dir = self.index_root / index_type / first_char
-            if first_dir.exists():
-                for file_path in first_dir.glob("*.json"):
-                    index_data = self._load_trie_index(file_path)
-                    for key, uuids in index_data.items():
-                        if key.startswith(normalized_prefix):
-                            results[key] = uuids
-        else:
-            first_char = normalized_prefix[0]
-            second_char = normalized_prefix[1]
+    def iter_uuids_by_prefix(self, index_type: str, prefix: str) -> Iterator[str]:
+        """
+        Search by prefix in Trie index when only the uuids are needed.
 
-            file_path = self.index_root / index_type / first_char / f"{second_char}.json"
-            if file_path.exists():
-                index_data = self._load_trie_index(file_path)
-                for key, uuids in index_data.items():
-                    if key.startswith(normalized_prefix):
-                        results[key] = uuids
+        Same as search_by_prefix, without building the {value: uuids} dict.
+        Uuids come in index order; one indexed under several matching values
+        is yielded only the first time.
 
-        return results
+        Yields:
+            uuid
+        """
+        seen: Set[str] = set()
+        for _, uuids in self._iter_prefix_matches(index_type, prefix):
+            for uuid in uuids:
+                if uuid not in seen:
+                    seen.add(uuid)
+                    yield uuid
 
     # ============================================================
     # HASH INDEX
@@ -288,18 +384,15 @@ class IndexManager:
         # else:  # email
         #     normalized = self._normalize_email(value)
 
-        hash_obj = hashlib.sha1(value.encode('utf-8'))
+        # only used for bucket routing and key equality, no need for a cryptographic hash
+        # 64 bits keep collisions negligible for an address book and halve the key size
+        hash_obj = hashlib.blake2b(value.encode('utf-8'), digest_size=HASH_SIZE)
         full_hash = hash_obj.hexdigest()
 
         bucket1 = full_hash[:2]
         bucket2 = full_hash[2:4]
 
-        bucket_dir = self.index_root / index_type / bucket1
-        bucket_dir.mkdir(parents=True, exist_ok=True)
-
-        file_path = bucket_dir / f"{bucket2}.json"
-
-        return file_path, full_hash
+        return _bucket_path(self.index_root, index_type, bucket1, bucket2), full_hash
 
     def _load_hash_index(self, file_path: Path) -> Dict[str, List[str]]:
         """
@@ -308,14 +401,7 @@ class IndexManager:
         Returns:
             Dict[full_hash -> list_of_uuids]
         """
-        if not file_path.exists():
-            return {}
-
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError, UnicodeDecodeError):
-            return {}
+        return self._read_index_file(file_path)
 
     def _save_hash_index_atomic(self, file_path: Path, data: Dict[str, List[str]]):
         """
@@ -325,7 +411,7 @@ class IndexManager:
             file_path: Path to index file
             data: Data to save
         """
-        self._atomic_write_json(file_path, data)
+        self._write_index_file(file_path, data)
 
     def add_to_hash_index(self, index_type: str, value: str, uuid: str):
         """
@@ -340,18 +426,7 @@ class IndexManager:
             return
 
         file_path, full_hash = self._get_hash_path(index_type, value)
-        lock = self._get_lock(str(file_path))
-
-        with lock:
-            index_data = self._load_hash_index(file_path)
-
-            if full_hash not in index_data:
-                index_data[full_hash] = []
-
-            if uuid not in index_data[full_hash]:
-                index_data[full_hash].append(uuid)
-
-            self._save_hash_index_atomic(file_path, index_data)
+        self._apply_ops(file_path, [('+', full_hash, uuid)])
 
     def remove_from_hash_index(self, index_type: str, value: str, uuid: str):
         """
@@ -367,38 +442,127 @@ class IndexManager:
 
         file_path, full_hash = self._get_hash_path(index_type, value)
 
-        if not file_path.exists():
+        if not self._index_file_exists(file_path):
             return
 
-        lock = self._get_lock(str(file_path))
-
-        with lock:
-            index_data = self._load_hash_index(file_path)
-
-            if full_hash in index_data:
-                if uuid in index_data[full_hash]:
-                    index_data[full_hash].remove(uuid)
-
-                if not index_data[full_hash]:
-                    del index_data[full_hash]
-
-            self._save_hash_index_atomic(file_path, index_data)
+        self._apply_ops(file_path, [('-', full_hash, uuid)])
 
     def search_by_exact_match(self, index_name: str, value: str) -> List[str]:
         """
         Search a Hash index for an exact match.
+
+        Looks the hash up in the packed memory-mapped copy of the bucket
+        (see MmapHashBucket); if it is missing or stale, the JSON bucket is
+        parsed and the packed copy is rebuilt for the next search.
         """
         if not value or not value.strip():
             return []
 
         file_path, full_hash = self._get_hash_path(index_name, value)
 
-        if not file_path.exists():
+        if self._bulk is not None and file_path in self._bulk:
+            return list(self._bulk[file_path].get(full_hash, ()))
+
+        bucket = MmapHashBucket(file_path)
+        version = bucket.source_version()
+        if version is None:
             return []
 
+        uuids = bucket.lookup(full_hash, version)
+        if uuids is not None:
+            return uuids
+
         index_data = self._load_hash_index(file_path)
+        bucket.build(index_data, version)
         return index_data.get(full_hash, [])
 
+    # ============================================================
+    # TRIGRAM INDEX
+    # ============================================================
+
+    @staticmethod
+    def _get_trigrams(text: str) -> Set[str]:
+        """
+        Split text into the set of its lowercase 3-character windows.
+
+        Args:
+            text: Text to split (e.g., "John Smith")
+
+        Returns:
+            Set of trigrams, empty if text is shorter than 3 characters
+        """
+        normalized = text.lower().strip()
+        return {normalized[i:i + 3] for i in range(len(normalized) - 2)}
+
+    def add_to_trigram_index(self, index_name: str, text: str, uuid: str):
+        """
+        Add record to Trigram index.
+
+        Each trigram of the text is stored as a key of a Hash index,
+        so a trigram posting list lives in the same buckets as phones and emails.
+
+        Args:
+            index_name: index for trigrams e.g. INDEX_CONTACT_NAME_TRIGRAM
+            text: Text to index (e.g., "John Smith")
+            uuid: Record UUID
+        """
+        if not text or not text.strip():
+            return
+
+        for trigram in self._get_trigrams(text):
+            self.add_to_hash_index(index_name, trigram, uuid)
+
+    def remove_from_trigram_index(self, index_name: str, text: str, uuid: str):
+        """
+        Remove record from Trigram index.
+
+        Args:
+            index_name: index for trigrams e.g. INDEX_CONTACT_NAME_TRIGRAM
+            text: Text that was indexed
+            uuid: Record UUID
+        """
+        if not text or not text.strip():
+            return
+
+        for trigram in self._get_trigrams(text):
+            self.remove_from_hash_index(index_name, trigram, uuid)
+
+    def search_by_trigrams(self, index_name: str, query: str) -> Set[str]:
+        """
+        Find candidate records for a substring query.
+
+        Intersects the posting lists of all query trigrams. The result is a
+        superset of the real matches (trigrams may appear in a different order),
+        so the caller must confirm every candidate with a full substring check.
+
+        Args:
+            index_name: index for trigrams e.g. INDEX_CONTACT_NAME_TRIGRAM
+            query: Substring to search for (at least 3 characters)
+
+        Returns:
+            Set of candidate UUIDs
+        """
+        trigrams = self._get_trigrams(query)
+        if not trigrams:
+            return set()
+
+        postings = []
+        for trigram in trigrams:
+            uuids = self.search_by_exact_match(index_name, trigram)
+            if not uuids:
+                return set()
+            postings.append(uuids)
+
+        # start from the rarest trigram, so every intersection is at most its size
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for uuids in postings[1:]:
+            candidates.intersection_update(uuids)
+            if not candidates:
+                break
+
+        return candidates
+
     # ============================================================
     # Date Index (for notes)
     # ============================================================
@@ -417,46 +581,36 @@ class IndexManager:
         except (IndexError, TypeError):
             return None
 
-    def add_to_date_index(self, index_name: str, date_iso: str, uuid: str):
+    def _get_date_paths(self, index_name: str, date_iso: str) -> List[Path]:
         """
-        Add a UUID to a Date index.
-        Date should be in ISO format (YYYY-MM-DD...).
+        Get all Date index files a date is stored in.
+
+        Returns:
+            [day path, month aggregate path] or [] for an invalid date
         """
         file_path = self._get_date_path(index_name, date_iso)
         if not file_path:
-            return
-
-        lock = self._get_lock(str(file_path))
-
-        with lock:
-            # in date index, the key is the day, but we store all UUIDs for that day in a list.
-            # For simplicity, we'll use a structure where the file itself represents the day
-            # and contains a list of UUIDs.
-            data = self._read_index_file(file_path)
-            if 'uuids' not in data:
-                data['uuids'] = []
+            return []
+        return [file_path, file_path.parent / DATE_AGGREGATE_FILE]
 
-            if uuid not in data['uuids']:
-                data['uuids'].append(uuid)
-                self._write_index_file(file_path, data)
+    def add_to_date_index(self, index_name: str, date_iso: str, uuid: str):
+        """
+        Add a UUID to a Date index.
+        Date should be in ISO format (YYYY-MM-DD...).
+        """
+        # in date index, the key is the day, but we store all UUIDs for that day in a list.
+        # For simplicity, we'll use a structure where the file itself represents the day
+        # and contains a list of UUIDs. The month aggregate has the same structure.
+        for file_path in self._get_date_paths(index_name, date_iso):
+            self._apply_ops(file_path, [('+', 'uuids', uuid)])
 
     def remove_from_date_index(self, index_name: str, date_iso: str, uuid: str):
         """
         Remove a UUID from a Date index.
         """
-        file_path = self._get_date_path(index_name, date_iso)
-        if not file_path or not file_path.exists():
-            return
-
-        lock = self._get_lock(str(file_path))
-
-        with lock:
-            data = self._read_index_file(file_path)
-            if 'uuids' in data and uuid in data['uuids']:
-                data['uuids'].remove(uuid)
-                if not data['uuids']:
-                    del data['uuids']
-                self._write_index_file(file_path, data)
+        for file_path in self._get_date_paths(index_name, date_iso):
+            if self._index_file_exists(file_path):
+                self._apply_ops(file_path, [('-', 'uuids', uuid)])
 
     def search_by_date(self, index_name: str, year: int, month: Optional[int] = None, day: Optional[int] = None) -> Set[str]:
         """
@@ -470,34 +624,485 @@ class IndexManager:
         if day:
             base_path = base_path / f"{day:02d}.json"
 
-        if day and base_path.is_file():
-            data = self._read_index_file(base_path)
-            uuids.update(data.get('uuids', []))
-        elif not day and base_path.is_dir():
-            for json_file in base_path.rglob("*.json"):
-                data = self._read_index_file(json_file)
-                uuids.update(data.get('uuids', []))
+        if day:
+            files = [base_path]
+        elif month:
+            files = [base_path / DATE_AGGREGATE_FILE]
+        else:
+            files = [base_path / f"{m:02d}" / DATE_AGGREGATE_FILE for m in range(1, 13)]
+
+        # one file per month instead of every day file
+        for file_path in files:
+            if self._index_file_exists(file_path):
+                uuids.update(self._read_index_file(file_path).get('uuids', []))
 
         return uuids
 
+    def iter_uuids_by_date_range(self, index_name: str, start: date, end: date) -> Iterator[str]:
+        """
+        Iterate over UUIDs of a date range, in date order.
+
+        Months fully inside the range are read from their aggregate file,
+        only the edge months are read day by day. A month without an
+        aggregate file has no entries and is skipped.
+
+        Args:
+            index_name: index for dates e.g. INDEX_NOTE_CREATION_DATE
+            start: First day of the range
+            end: Last day of the range (inclusive)
+
+        Yields:
+            uuid
+        """
+        year, month = start.year, start.month
+        while (year, month) <= (end.year, end.month):
+            month_path = self.index_root / index_name / str(year) / f"{month:02d}"
+            aggregate_path = month_path / DATE_AGGREGATE_FILE
+
+            if self._index_file_exists(aggregate_path):
+                first_day = date(year, month, 1)
+                last_day = date(year, month, calendar.monthrange(year, month)[1])
+
+                if start <= first_day and last_day <= end:
+                    yield from self._read_index_file(aggregate_path).get('uuids', [])
+                else:
+                    day = max(start, first_day)
+                    while day <= min(end, last_day):
+                        file_path = month_path / f"{day.day:02d}.json"
+                        if self._index_file_exists(file_path):
+                            yield from self._read_index_file(file_path).get('uuids', [])
+                        day += timedelta(days=1)
+
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+
     def _read_index_file(self, file_path: Path) -> dict:
         """
         Read index file, return as dictionary.
         """
-        if not file_path.exists():
-            return {}
+        if self._bulk is not None and file_path in self._bulk:
+            # buffered files hold sets and are still being changed, hand out sorted copies
+            return {
+                key: sorted(value) if isinstance(value, set) else value
+                for key, value in self._bulk[file_path].items()
+            }
 
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError, UnicodeDecodeError):
+            stat = os.stat(file_path)
+        except OSError:
+            self._invalidate(file_path)
             return {}
+        version = (stat.st_mtime_ns, stat.st_size)
+
+        with self._cache_lock:
+            cached = self._cache.get(file_path)
+            if cached is not None and cached[0] == version:
+                self._cache.move_to_end(file_path)
+                data = cached[1]
+            else:
+                data = None
+
+        if data is None:
+            try:
+                with open(file_path, 'rb') as f:
+                    data = json.loads(f.read())
+            except (json.JSONDecodeError, IOError, UnicodeDecodeError):
+                data = {}
+            self._intern_postings(data)
+
+            with self._cache_lock:
+                self._cache[file_path] = (version, data)
+                self._cache.move_to_end(file_path)
+                if len(self._cache) > CACHE_SIZE:
+                    self._cache.popitem(last=False)
+
+        # callers mutate the result, values are flat lists/dicts so copying them is enough
+        data = {key: value.copy() if isinstance(value, (list, dict)) else value for key, value in data.items()}
+        self._replay_log(file_path, data)
+        return data
+
+    @staticmethod
+    def _intern_postings(data: dict):
+        """
+        Intern uuids of parsed index file posting lists in place.
+
+        The same uuid is listed in many index files (one per indexed value);
+        interned, all cached files share a single string object per uuid.
+        """
+        for key, value in data.items():
+            if isinstance(value, list):
+                data[key] = [sys.intern(item) if isinstance(item, str) else item for item in value]
+
+    def _invalidate(self, file_path: Path):
+        """Drop index file from the in-memory cache."""
+        with self._cache_lock:
+            self._cache.pop(file_path, None)
 
     def _write_index_file(self, file_path: Path, data: dict):
         """
         Write dictionary data to index file.
         """
-        self._atomic_write_json(file_path, data)
+        if self._bulk is not None:
+            self._bulk[file_path] = data
+            if len(self._bulk) >= self._bulk_limit:
+                self.commit()
+            return
+
+        self._write_snapshot(file_path, data)
+
+    # ============================================================
+    # Mutation log
+    # ============================================================
+    # Single changes of an existing index file are appended to "<file>.log"
+    # as JSON lines ["+" | "-", key, uuid] instead of rewriting the file.
+    # Readers replay the log on top of the file; once the log grows past
+    # half the file size, both are compacted into a new file.
+
+    @staticmethod
+    def _get_log_path(file_path: Path) -> Path:
+        """Get path to the mutation log of an index file."""
+        return file_path.with_suffix('.log')
+
+    @staticmethod
+    def _apply_op(index_data: dict, op: List[str]) -> bool:
+        """
+        Apply a single ("+" | "-", key, uuid) operation.
+
+        Returns:
+            True if index data changed
+        """
+        action, key, uuid = op
+        uuids = index_data.get(key)
+
+        if action == '+':
+            if uuids is None:
+                index_data[key] = [uuid]
+                return True
+            if uuid in uuids:
+                return False
+            uuids.append(uuid)
+            return True
+
+        if uuids is None or uuid not in uuids:
+            return False
+        uuids.remove(uuid)
+        if not uuids:
+            del index_data[key]
+        return True
+
+    def _apply_ops(self, file_path: Path, ops: List[Tuple[str, str, str]]):
+        """
+        Apply ("+" | "-", key, uuid) operations to an index file.
+
+        New files (and files buffered by bulk_update()) are written whole,
+        changes of existing files are appended to the mutation log. Outside
+        bulk_update() both are synced to disk before returning.
+
+        Appends don't read the file: replaying an operation is idempotent
+        (adding a present uuid or removing a missing one is a no-op), and a
+        single O_APPEND write is atomic, so there is no read-modify-write
+        for concurrent writers to interleave. The file is only read when
+        the log is compacted.
+
+        Threads of this process are serialized by the file's stripe lock.
+        Other processes are kept out of a compaction by a lock on the log
+        (see _open_log), where the platform has flock(); elsewhere only a
+        single process may write the indexes.
+        """
+        if self._bulk is not None:
+            self._apply_ops_bulk(file_path, ops)
+            return
+
+        with self._get_lock(str(file_path)):
+            if not file_path.exists():
+                index_data = {}
+                if any([self._apply_op(index_data, op) for op in ops]):
+                    self._write_index_file(file_path, index_data)
+                return
+
+            log_path = self._get_log_path(file_path)
+            payload = ''.join(json.dumps(op, ensure_ascii=False) + '\n' for op in ops).encode('utf-8')
+            fd = self._open_log(log_path, exclusive=False)
+            try:
+                created = os.fstat(fd).st_size == 0
+                os.write(fd, payload)
+                os.fsync(fd)
+                log_size = os.fstat(fd).st_size
+            finally:
+                os.close(fd)
+            if created:
+                fsync_directory(log_path.parent)
+
+            if log_size > os.path.getsize(file_path) / 2:
+                self._compact(file_path)
+
+    @staticmethod
+    def _open_log(log_path: Path, exclusive: bool) -> int:
+        """
+        Open the mutation log of an index file for appending, locked with flock().
+
+        Appends hold a shared lock, a compaction holds an exclusive one from
+        reading the log until it is unlinked, so no append of another process
+        lands in between and gets lost. A log that was unlinked while waiting
+        for the lock is reopened (a new one is created next to the new file).
+        Without fcntl (Windows) the log is opened unlocked.
+
+        Returns:
+            File descriptor, closing it releases the lock
+        """
+        while True:
+            fd = os.open(log_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            if fcntl is None:
+                return fd
+
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+                if os.path.samestat(os.fstat(fd), os.stat(log_path)):
+                    return fd
+            except FileNotFoundError:
+                pass
+            except BaseException:
+                os.close(fd)
+                raise
+            os.close(fd)
+
+    def _compact(self, file_path: Path):
+        """Merge the mutation log of an index file into a new file."""
+        fd = self._open_log(self._get_log_path(file_path), exclusive=True)
+        try:
+            self._write_snapshot(file_path, self._read_index_file(file_path))
+        finally:
+            os.close(fd)
+
+    def _apply_ops_bulk(self, file_path: Path, ops: List[Tuple[str, str, str]]):
+        """
+        Apply operations to an index file buffered by bulk_update().
+
+        Buffered files keep uuids of a key in a set, so rebuilding a bucket
+        with N entries takes N operations instead of N^2 list scans.
+        commit() writes them back as sorted lists.
+        """
+        with self._get_lock(str(file_path)):
+            index_data = self._bulk.get(file_path)
+            if index_data is not None:
+                changed = True
+            else:
+                index_data = {key: set(uuids) for key, uuids in self._read_index_file(file_path).items()}
+                changed = False
+
+            for action, key, uuid in ops:
+                if action == '+':
+                    index_data.setdefault(key, set()).add(uuid)
+                    changed = True
+                    continue
+
+                uuids = index_data.get(key)
+                if uuids is not None and uuid in uuids:
+                    uuids.discard(uuid)
+                    if not uuids:
+                        del index_data[key]
+                    changed = True
+
+            if changed:
+                self._write_index_file(file_path, index_data)
+
+    def _replay_log(self, file_path: Path, index_data: dict):
+        """Apply mutation log of an index file to its loaded data."""
+        try:
+            with open(self._get_log_path(file_path), 'rb') as f:
+                for line in f:
+                    try:
+                        self._apply_op(index_data, json.loads(line))
+                    except (ValueError, TypeError, IndexError, AttributeError):
+                        # torn last line after a crash
+                        continue
+        except FileNotFoundError:
+            return
+
+    def _write_snapshot(self, file_path: Path, data: dict, durable: bool = True):
+        """Write index file whole and drop its mutation log."""
+        self._atomic_write_json(file_path, data, durable)
+        self._invalidate(file_path)
+        try:
+            os.unlink(self._get_log_path(file_path))
+        except FileNotFoundError:
+            pass
+
+    def _index_file_exists(self, file_path: Path) -> bool:
+        """Check if index file exists on disk or is buffered by bulk_update()."""
+        return (self._bulk is not None and file_path in self._bulk) or file_path.exists()
+
+    def commit(self):
+        """
+        Write index files buffered by bulk_update() so far (the block stays open).
+
+        The files are not synced: bulk updates come from rebuilds and imports,
+        and indexes lost in a crash can be rebuilt from the heap
+        (rebuild_indexes(force=True)), so a batch doesn't pay an fsync per file.
+        """
+        if not self._bulk:
+            return
+
+        files = list(self._bulk.items())
+        self._bulk.clear()
+        for file_path, data in files:
+            self._write_snapshot(file_path, {
+                key: sorted(value) if isinstance(value, set) else value
+                for key, value in sorted(data.items())
+            }, durable=False)
+
+    @contextmanager
+    def bulk_update(self):
+        """
+        Buffer index changes made inside the block and write every touched
+        index file once on exit (with sorted keys). If more than BULK_MAX_FILES
+        files are buffered, they are written out early (see commit()).
+        Searches made inside the block see buffered changes.
+
+        Files are written on exit even if the block raises, so indexes
+        always match the changes that were applied. Nested blocks are
+        merged into the outermost one, as is every other change made while
+        the block is open, so it must not await or wait for user input.
+
+        Usage:
+            with index_manager.bulk_update():
+                for entity in entities:
+                    index_manager.add_bulk(entity['uuid'], entries)
+        """
+        if self._bulk is not None:
+            yield self
+            return
+
+        self._bulk = {}
+        try:
+            yield self
+        finally:
+            self.commit()
+            self._bulk = None
+
+    # ============================================================
+    # Bulk operations
+    # ============================================================
+
+    def _group_by_file(self, entries: List[Tuple[str, str, str]]) -> Dict[Path, List[str]]:
+        """
+        Resolve index entries to the index files and keys they live in.
+
+        Args:
+            entries: List of (kind, index_name, value), kind is "trie", "hash", "trigram" or "date"
+
+        Returns:
+            Dict {file_path: [key1, key2, ...]}
+        """
+        by_file: Dict[Path, List[str]] = {}
+
+        for kind, index_name, value in entries:
+            if not value or not value.strip():
+                continue
+
+            if kind == "trie":
+                normalized = value.lower().strip()
+                locations = [(file_path, normalized) for file_path in self._get_trie_paths(index_name, value)]
+            elif kind == "hash":
+                locations = [self._get_hash_path(index_name, value)]
+            elif kind == "trigram":
+                locations = [self._get_hash_path(index_name, trigram) for trigram in self._get_trigrams(value)]
+            elif kind == "date":
+                locations = [(file_path, 'uuids') for file_path in self._get_date_paths(index_name, value)]
+            else:
+                raise ValueError(f"Unknown index kind: {kind}")
+
+            for file_path, key in locations:
+                if file_path:
+                    by_file.setdefault(file_path, []).append(key)
+
+        return by_file
+
+    def add_bulk(self, uuid: str, adds: List[Tuple[str, str, str]]):
+        """
+        Add record to several indexes at once.
+
+        Entries are grouped by index file, so every touched file
+        is loaded and saved only once.
+
+        Args:
+            uuid: Record UUID
+            adds: List of (kind, index_name, value), e.g. ("trie", INDEX_CONTACT_FIRST_NAME, "John")
+        """
+        for file_path, keys in self._group_by_file(adds).items():
+            self._apply_ops(file_path, [('+', key, uuid) for key in keys])
+
+    def remove_bulk(self, uuid: str, removes: List[Tuple[str, str, str]]):
+        """
+        Remove record from several indexes at once.
+
+        Args:
+            uuid: Record UUID
+            removes: List of (kind, index_name, value), same format as in add_bulk
+        """
+        for file_path, keys in self._group_by_file(removes).items():
+            if not self._index_file_exists(file_path):
+                continue
+
+            self._apply_ops(file_path, [('-', key, uuid) for key in keys])
+
+    # ============================================================
+    # Manifest (state of the heap at the last rebuild)
+    # ============================================================
+
+    def _get_manifest_path(self, entity_type: str) -> Path:
+        """Get path to the manifest of an entity type."""
+        return self.index_root / entity_type / "manifest.json"
+
+    def load_manifest(self, entity_type: str) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        Load manifest written by the last rebuild.
+
+        Args:
+            entity_type: "contacts" or "notes"
+
+        Returns:
+            Dict {uuid: {"mtime_ns": ..., "entries": [[kind, index_name, value], ...]}} or None if there is no manifest
+        """
+        file_path = self._get_manifest_path(entity_type)
+        if not file_path.exists():
+            return None
+        return self._read_index_file(file_path)
+
+    def save_manifest(self, entity_type: str, manifest: Dict[str, Dict[str, Any]]):
+        """
+        Save manifest of indexed entities.
+
+        Args:
+            entity_type: "contacts" or "notes"
+            manifest: Dict {uuid: {"mtime_ns": ..., "entries": [[kind, index_name, value], ...]}}
+        """
+        self._write_index_file(self._get_manifest_path(entity_type), manifest)
+
+    def load_format_version(self, entity_type: str) -> Optional[int]:
+        """
+        Get format version the indexes of an entity type were built with.
+
+        Returns:
+            Version number or None if unknown (built before versioning)
+        """
+        return self._read_index_file(self.index_root / entity_type / "format_version.json").get('version')
+
+    def save_format_version(self, entity_type: str):
+        """Mark indexes of an entity type as built with the current INDEX_FORMAT_VERSION."""
+        self._write_index_file(self.index_root / entity_type / "format_version.json", {'version': INDEX_FORMAT_VERSION})
+
+    def load_heap_fingerprint(self, entity_type: str) -> Optional[List[int]]:
+        """
+        Get heap fingerprint saved by the last rebuild of an entity type.
+
+        Returns:
+            Fingerprint or None if unknown
+        """
+        return self._read_index_file(self.index_root / entity_type / "heap_fingerprint.json").get('fingerprint')
+
+    def save_heap_fingerprint(self, entity_type: str, fingerprint: List[int]):
+        """Save heap fingerprint the indexes of an entity type are up to date with."""
+        self._write_index_file(self.index_root / entity_type / "heap_fingerprint.json", {'fingerprint': fingerprint})
 
     # ============================================================
     # rebuild Indexes
@@ -514,6 +1119,9 @@ class IndexManager:
 
         for index_name in index_names:
             index_path = self.index_root / index_name
+            if self._bulk:
+                for file_path in [path for path in self._bulk if path.is_relative_to(index_path)]:
+                    del self._bulk[file_path]
             if index_path.exists():
                 shutil.rmtree(index_path)
             # Recreate empty directory
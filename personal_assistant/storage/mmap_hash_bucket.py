@@ -0,0 +1,185 @@
+"""
+MmapHashBucket — packed, memory-mapped read copy of a Hash index bucket.
+
+A Hash index bucket is a JSON file {full_hash: [uuid, ...]}. Looking up one
+hash means parsing the whole file, so next to it a packed "<bucket>.idx"
+file is kept and searched with binary search over a memory map.
+
+Layout (little-endian):
+    header   magic(8s) n_entries(Q) src_mtime_ns(q) src_size(Q) log_size(Q) bloom_size(Q)
+    bloom    bloom_size bytes, Bloom filter of the hashes
+    entries  n_entries x [hash(8s) pool_offset(I) pool_length(I)], sorted by hash
+    pool     uuids of every entry joined by "\\n" (UTF-8)
+
+A lookup of a missing hash is usually answered by the Bloom filter alone,
+without touching the entry table.
+
+The header stores the version of the JSON bucket (and its mutation log) the
+packed copy was built from; a stale copy is ignored and rebuilt by the caller.
+"""
+
+import mmap
+import os
+import struct
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+MAGIC = b"PAHBKT04"
+HEADER = struct.Struct("<8sQqQQQ")
+# size of Hash index keys (blake2b digest bytes)
+HASH_SIZE = 8
+ENTRY = struct.Struct(f"<{HASH_SIZE}sII")
+
+# Bloom filter bits per entry and bit positions per hash (~2% false positives)
+BLOOM_BITS_PER_ENTRY = 10
+BLOOM_PROBES = 3
+
+
+class MmapHashBucket:
+    """
+    Packed copy of a single Hash index bucket.
+    """
+
+    def __init__(self, file_path: Path):
+        """
+        Args:
+            file_path: Path to the JSON bucket file
+        """
+        self.file_path = file_path
+        self.packed_path = file_path.with_suffix('.idx')
+        self.log_path = file_path.with_suffix('.log')
+
+    def source_version(self) -> Optional[Tuple[int, int, int]]:
+        """
+        Get version of the JSON bucket.
+
+        Returns:
+            (mtime_ns, size, log_size) or None if the bucket doesn't exist
+        """
+        try:
+            stat = os.stat(self.file_path)
+        except FileNotFoundError:
+            return None
+
+        try:
+            log_size = os.stat(self.log_path).st_size
+        except FileNotFoundError:
+            log_size = 0
+
+        return stat.st_mtime_ns, stat.st_size, log_size
+
+    def lookup(self, full_hash: str, version: Tuple[int, int, int]) -> Optional[List[str]]:
+        """
+        Find uuids of a hash.
+
+        Args:
+            full_hash: Hex digest to look for
+            version: Current version of the JSON bucket (see source_version)
+
+        Returns:
+            List of uuids (empty if hash is not in the bucket) or None if
+            there is no up-to-date packed copy
+        """
+        try:
+            key = bytes.fromhex(full_hash)
+        except ValueError:
+            return None
+        if len(key) != HASH_SIZE:
+            return None
+
+        try:
+            with open(self.packed_path, 'rb') as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return self._search(mm, key, version)
+        except (OSError, ValueError, struct.error):
+            return None
+
+    @staticmethod
+    def _bloom_bits(key: bytes, n_bits: int) -> List[int]:
+        """
+        Get Bloom filter bit positions of a hash.
+
+        The hash is a blake2b digest, so its bytes are already uniform; the
+        first two select the bucket and are the same for all its hashes, the
+        remaining 48 bits are split into two independent values (low 32 and
+        high 16 bits) combined by double hashing.
+        """
+        value = int.from_bytes(key[2:], 'little')
+        h1 = value & 0xFFFFFFFF
+        h2 = (value >> 32) | 1
+        return [(h1 + i * h2) % n_bits for i in range(BLOOM_PROBES)]
+
+    @classmethod
+    def _search(cls, mm: mmap.mmap, key: bytes, version: Tuple[int, int, int]) -> Optional[List[str]]:
+        magic, n_entries, mtime_ns, size, log_size, bloom_size = HEADER.unpack_from(mm, 0)
+        if magic != MAGIC or (mtime_ns, size, log_size) != version:
+            return None
+
+        if n_entries == 0:
+            return []
+        for bit in cls._bloom_bits(key, bloom_size * 8):
+            if not mm[HEADER.size + bit // 8] & (1 << (bit % 8)):
+                return []
+
+        table_start = HEADER.size + bloom_size
+        lo, hi = 0, n_entries
+        while lo < hi:
+            mid = (lo + hi) // 2
+            start = table_start + mid * ENTRY.size
+            if mm[start:start + HASH_SIZE] < key:
+                lo = mid + 1
+            else:
+                hi = mid
+
+        if lo == n_entries:
+            return []
+
+        entry_hash, offset, length = ENTRY.unpack_from(mm, table_start + lo * ENTRY.size)
+        if entry_hash != key:
+            return []
+
+        pool_start = table_start + n_entries * ENTRY.size
+        return mm[pool_start + offset:pool_start + offset + length].decode('utf-8').split('\n')
+
+    def build(self, index_data: Dict[str, List[str]], version: Tuple[int, int, int]):
+        """
+        Write packed copy of bucket data.
+
+        Args:
+            index_data: Bucket data {full_hash: [uuid, ...]}
+            version: Version of the JSON bucket the data was read from,
+                taken before reading it
+        """
+        entries = []
+        for full_hash, uuids in index_data.items():
+            try:
+                key = bytes.fromhex(full_hash)
+            except ValueError:
+                return
+            if len(key) != HASH_SIZE or not uuids:
+                return
+            entries.append((key, '\n'.join(uuids).encode('utf-8')))
+        entries.sort()
+
+        bloom = bytearray((len(entries) * BLOOM_BITS_PER_ENTRY + 7) // 8 or 1)
+        table = bytearray()
+        pool = bytearray()
+        for key, joined in entries:
+            for bit in self._bloom_bits(key, len(bloom) * 8):
+                bloom[bit // 8] |= 1 << (bit % 8)
+            table += ENTRY.pack(key, len(pool), len(joined))
+            pool += joined
+
+        header = HEADER.pack(MAGIC, len(entries), *version, len(bloom))
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.packed_path.parent, prefix='.tmp_', suffix='.idx')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(header + bytes(bloom) + bytes(table) + bytes(pool))
+            os.replace(tmp_path, self.packed_path)
+        except OSError:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
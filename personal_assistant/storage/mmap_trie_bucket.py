@@ -0,0 +1,142 @@
+"""
+MmapTrieBucket — packed, memory-mapped read copy of a Trie index bucket.
+
+A Trie index bucket is a JSON file {value: [uuid, ...]}. A prefix search
+needs only the values starting with the prefix, so next to it a packed
+"<bucket>.idx" file is kept: a table of small fixed-size entries sorted by
+value, searched with binary search over a memory map.
+
+Layout (little-endian):
+    header   magic(8s) n_entries(Q) src_mtime_ns(q) src_size(Q) log_size(Q) common_length(Q)
+    common   prefix shared by all keys (UTF-8)
+    entries  n_entries x [key_offset(I) key_length(I) uuids_offset(I) uuids_length(I)],
+             sorted by key (UTF-8 bytes)
+    pool     key suffixes (after the common prefix) and uuids of every entry
+             joined by "\\n" (UTF-8)
+
+All values of a bucket start with the same letters (the bucket path), so the
+shared prefix is stored once, path-compressed like a Patricia trie edge, and
+the binary search compares only the rest. UTF-8 keeps both the code point
+order and prefixes of strings, so the entries matching a prefix are a
+contiguous run of the table.
+
+File naming and versioning are shared with MmapHashBucket: the header stores
+the version of the JSON bucket (and its mutation log) the packed copy was
+built from; a stale copy is ignored and rebuilt by the caller.
+"""
+
+import mmap
+import os
+import struct
+import tempfile
+from typing import Dict, List, Optional, Tuple
+
+from personal_assistant.storage.mmap_hash_bucket import MmapHashBucket
+
+MAGIC = b"PATRIE02"
+HEADER = struct.Struct("<8sQqQQQ")
+ENTRY = struct.Struct("<IIII")
+
+
+class MmapTrieBucket(MmapHashBucket):
+    """
+    Packed copy of a single Trie index bucket.
+    """
+
+    def lookup_prefix(self, prefix: str, version: Tuple[int, int, int]) -> Optional[List[Tuple[str, List[str]]]]:
+        """
+        Find entries whose value starts with prefix.
+
+        Args:
+            prefix: Normalized prefix
+            version: Current version of the JSON bucket (see source_version)
+
+        Returns:
+            List of (value, list_of_uuids) or None if there is no up-to-date packed copy
+        """
+        try:
+            with open(self.packed_path, 'rb') as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return self._search_prefix(mm, prefix.encode('utf-8'), version)
+        except (OSError, ValueError, struct.error):
+            return None
+
+    @staticmethod
+    def _search_prefix(mm: mmap.mmap, prefix: bytes, version: Tuple[int, int, int]) -> Optional[List[Tuple[str, List[str]]]]:
+        magic, n_entries, mtime_ns, size, log_size, common_length = HEADER.unpack_from(mm, 0)
+        if magic != MAGIC or (mtime_ns, size, log_size) != version:
+            return None
+
+        common = mm[HEADER.size:HEADER.size + common_length]
+        if common.startswith(prefix):
+            # every key matches
+            prefix = b''
+        elif prefix.startswith(common):
+            prefix = prefix[common_length:]
+        else:
+            return []
+
+        table_start = HEADER.size + common_length
+        pool_start = table_start + n_entries * ENTRY.size
+
+        def key_at(index: int) -> bytes:
+            key_offset, key_length, _, _ = ENTRY.unpack_from(mm, table_start + index * ENTRY.size)
+            return mm[pool_start + key_offset:pool_start + key_offset + key_length]
+
+        lo, hi = 0, n_entries
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if key_at(mid) < prefix:
+                lo = mid + 1
+            else:
+                hi = mid
+
+        results = []
+        for index in range(lo, n_entries):
+            key_offset, key_length, uuids_offset, uuids_length = ENTRY.unpack_from(mm, table_start + index * ENTRY.size)
+            key = mm[pool_start + key_offset:pool_start + key_offset + key_length]
+            if not key.startswith(prefix):
+                break
+            uuids = mm[pool_start + uuids_offset:pool_start + uuids_offset + uuids_length].decode('utf-8')
+            results.append(((common + key).decode('utf-8'), uuids.split('\n')))
+
+        return results
+
+    def build(self, index_data: Dict[str, List[str]], version: Tuple[int, int, int]):
+        """
+        Write packed copy of bucket data.
+
+        Args:
+            index_data: Bucket data {value: [uuid, ...]}
+            version: Version of the JSON bucket the data was read from,
+                taken before reading it
+        """
+        entries = sorted(
+            (key.encode('utf-8'), '\n'.join(uuids).encode('utf-8'))
+            for key, uuids in index_data.items() if uuids
+        )
+
+        # sorted keys: the prefix shared by the first and the last one is shared by all
+        # (matching is bytewise, so it may end inside a multi-byte character)
+        common = os.path.commonprefix([entries[0][0], entries[-1][0]]) if entries else b''
+
+        header = HEADER.pack(MAGIC, len(entries), *version, len(common))
+        table = bytearray()
+        pool = bytearray()
+        for key, joined in entries:
+            key_offset = len(pool)
+            key = key[len(common):]
+            pool += key
+            table += ENTRY.pack(key_offset, len(key), len(pool), len(joined))
+            pool += joined
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.packed_path.parent, prefix='.tmp_', suffix='.idx')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(header + common + bytes(table) + bytes(pool))
+            os.replace(tmp_path, self.packed_path)
+        except OSError:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
@@ -4,7 +4,9 @@ NotesStorage — high-level API for working with notes.
 Uses HeapStorage for file storage and IndexManager for fast search.
 """
 
-from typing import List, Optional, Set, Dict, Any
+from collections import OrderedDict
+from datetime import date
+from typing import Callable, Iterable, Iterator, List, Optional, Dict, Any, Tuple
 
 from personal_assistant.models.note import Note
 from personal_assistant.storage.base_storage import BaseStorage
@@ -12,15 +14,62 @@ from personal_assistant.storage.constants import (
     INDEX_NOTE_TITLE,
     INDEX_NOTE_TAG,
     INDEX_NOTE_CREATION_DATE,
+    INDEX_NOTE_CONTENT_TRIGRAM,
+    INDEX_NOTE_CONTACT,
     NOTE_INDEXES,
 )
 
+# Max number of recent search results kept in memory
+SEARCH_CACHE_SIZE = 128
+
+# Max number of notes whose index entries are kept in memory for removal
+INDEX_ENTRIES_CACHE_SIZE = 1024
+
+# Max number of notes whose lowercased content is kept in memory for content searches
+CONTENT_LOWER_CACHE_SIZE = 1024
+
 
 class NotesStorage(BaseStorage):
     """
     High-level API for managing notes with indexing.
     """
 
+    def __init__(self, data_root: Optional[str] = None, index_root: Optional[str] = None):
+        """
+        Args:
+            data_root: Directory for storing data (None = use config default)
+            index_root: Directory for storing indexes (None = use config default)
+        """
+        # lowercased content of recently searched notes: {uuid: (content, content_lower)}, reused while content is unchanged
+        self._content_lower: "OrderedDict[str, Tuple[str, str]]" = OrderedDict()
+        # raw notes found by recent searches, keyed by (search, normalized args); cleared on every write
+        self._search_cache: "OrderedDict[Tuple, List[Dict[str, Any]]]" = OrderedDict()
+        # index entries of recently indexed notes, so updates and deletes don't re-read the old note
+        self._index_entries: "OrderedDict[str, List[Tuple[str, str, str]]]" = OrderedDict()
+        super().__init__(data_root, index_root)
+
+    def _cached_search(self, key: Tuple, search: Callable[[], List[Dict[str, Any]]]) -> List[Note]:
+        """
+        Run a search or reuse its result from the last SEARCH_CACHE_SIZE searches.
+
+        Raw note data is cached and fresh Note objects are built on every call,
+        so callers may modify the returned notes.
+
+        Args:
+            key: (search name, normalized args)
+            search: Function returning raw data of found notes
+        """
+        notes = self._search_cache.get(key)
+        if notes is None:
+            notes = search()
+            self._search_cache[key] = notes
+            if len(self._search_cache) > SEARCH_CACHE_SIZE:
+                self._search_cache.popitem(last=False)
+        else:
+            self._search_cache.move_to_end(key)
+
+        return list(map(Note.from_dict, notes))
+
     # ============================================================
     # Overrides from BaseStorage
     # ============================================================
@@ -33,30 +82,72 @@ class NotesStorage(BaseStorage):
         """Get list of all note indexes."""
         return NOTE_INDEXES
 
-    def _add_to_indexes(self, note_uuid: str, note_data: Dict[str, Any]):
-        """Add note to all indexes."""
+    def _get_index_entries(self, note_data: Dict[str, Any]) -> List[Tuple[str, str, str]]:
+        """Get (kind, index_name, value) entries of a note for IndexManager bulk operations."""
+        entries = []
+
         if note_data.get('title'):
-            self.index_manager.add_to_trie_index(INDEX_NOTE_TITLE, note_data['title'], note_uuid)
+            entries.append(("trie", INDEX_NOTE_TITLE, note_data['title']))
 
         if note_data.get('created_at'):
-            self.index_manager.add_to_date_index(INDEX_NOTE_CREATION_DATE, note_data['created_at'], note_uuid)
+            entries.append(("date", INDEX_NOTE_CREATION_DATE, note_data['created_at']))
 
         tags = note_data.get('tags', [])
         for tag in tags:
-            self.index_manager.add_to_trie_index(INDEX_NOTE_TAG, tag, note_uuid)
+            entries.append(("trie", INDEX_NOTE_TAG, tag))
+
+        content = self._get_content(note_data)
+        if content:
+            entries.append(("trigram", INDEX_NOTE_CONTENT_TRIGRAM, content))
+
+        for contact_uuid in note_data.get('contact_ids', []):
+            entries.append(("hash", INDEX_NOTE_CONTACT, contact_uuid))
+
+        return entries
+
+    @staticmethod
+    def _get_content(note_data: Dict[str, Any]) -> str:
+        """Get text of raw note data (stored as 'content', older notes may have 'description')."""
+        return note_data.get("content") or note_data.get("description") or ""
+
+    def _get_content_lower(self, note_data: Dict[str, Any]) -> str:
+        """Get lowercased text of raw note data, lowercasing each note content only once."""
+        content = self._get_content(note_data)
+        note_uuid = note_data.get('uuid')
+        cached = self._content_lower.get(note_uuid)
+        if cached is not None and cached[0] == content:
+            self._content_lower.move_to_end(note_uuid)
+            return cached[1]
+
+        content_lower = content.lower()
+        if note_uuid:
+            self._content_lower[note_uuid] = (content, content_lower)
+            self._content_lower.move_to_end(note_uuid)
+            if len(self._content_lower) > CONTENT_LOWER_CACHE_SIZE:
+                self._content_lower.popitem(last=False)
+        return content_lower
 
+    def _add_to_indexes(self, note_uuid: str, note_data: Dict[str, Any]):
+        """Add note to all indexes."""
+        entries = self._get_index_entries(note_data)
+        self.index_manager.add_bulk(note_uuid, entries)
 
-    def _remove_from_indexes(self, note_uuid: str, note_data: Dict[str, Any]):
-        """Remove note from all indexes."""
-        if note_data.get('title'):
-            self.index_manager.remove_from_trie_index(INDEX_NOTE_TITLE, note_data['title'], note_uuid)
+        self._index_entries[note_uuid] = entries
+        self._index_entries.move_to_end(note_uuid)
+        if len(self._index_entries) > INDEX_ENTRIES_CACHE_SIZE:
+            self._index_entries.popitem(last=False)
 
-        if note_data.get('created_at'):
-            self.index_manager.remove_from_date_index(INDEX_NOTE_CREATION_DATE, note_data['created_at'], note_uuid)
+    def _remove_from_indexes(self, note_uuid: str, note_data: Optional[Dict[str, Any]]):
+        """
+        Remove note from all indexes.
 
-        tags = note_data.get('tags', [])
-        for tag in tags:
-            self.index_manager.remove_from_trie_index(INDEX_NOTE_TAG, tag, note_uuid)
+        Uses the entries the note was indexed with if they are still in memory,
+        otherwise the ones of note_data.
+        """
+        entries = self._index_entries.pop(note_uuid, None)
+        if entries is None:
+            entries = self._get_index_entries(note_data or {})
+        self.index_manager.remove_bulk(note_uuid, entries)
 
     # ============================================================
     # CRUD operations with indexing
@@ -76,9 +167,37 @@ class NotesStorage(BaseStorage):
         new_note = self.heap.create_note(note.to_dict())
         uuid = new_note.get("uuid")
         self._add_to_indexes(uuid, new_note)
+        self._search_cache.clear()
 
         return uuid
 
+    def add_notes_bulk(self, notes: Iterable[Note], durable: bool = False) -> List[str]:
+        """
+        Add many notes at once, e.g. on import or data generation.
+
+        Records are written in one heap batch and every touched index file
+        (and its packed copy, on the next search) is rebuilt once at the end
+        instead of after every note.
+
+        Args:
+            notes: Notes to add
+            durable: Passed to heap.batch; the default writes records in
+                place without syncing them, a crash may lose the last ones
+
+        Returns:
+            UUIDs of created notes in the order of notes
+        """
+        uuids = []
+        with self.heap.batch(durable=durable), self.index_manager.bulk_update():
+            for note in notes:
+                new_note = self.heap.create_note(note.to_dict())
+                uuid = new_note.get("uuid")
+                self._add_to_indexes(uuid, new_note)
+                uuids.append(uuid)
+
+        self._search_cache.clear()
+        return uuids
+
     def get_note_by_id(self, note_uuid: str) -> Optional[Note]:
         """
         Get note by UUID.
@@ -98,11 +217,15 @@ class NotesStorage(BaseStorage):
         Returns:
             True if successful, False if note not found
         """
-        old_note = self.heap.read_note(record.uuid)
-        if not old_note:
-            return False
+        # the old note is only needed for its index entries
+        old_note = None
+        if record.uuid not in self._index_entries:
+            old_note = self.heap.read_note(record.uuid)
+            if not old_note:
+                return False
 
         self._remove_from_indexes(record.uuid, old_note)
+        self._search_cache.clear()
 
         raw_note = record.to_dict()
         if self.heap.update_note(record.uuid, raw_note):
@@ -118,22 +241,26 @@ class NotesStorage(BaseStorage):
         Returns:
             True if successful, False if note not found
         """
-        note = self.heap.read_note(note_uuid)
-        if not note:
-            return False
+        note = None
+        if note_uuid not in self._index_entries:
+            note = self.heap.read_note(note_uuid)
+            if not note:
+                return False
 
         self._remove_from_indexes(note_uuid, note)
+        self._content_lower.pop(note_uuid, None)
+        self._search_cache.clear()
 
         return self.heap.delete_note(note_uuid)
 
-    def get_all_notes(self) -> List[Note]:
+    def get_all_notes(self) -> Iterator[Note]:
         """
-        Get all notes.
+        Iterate over all notes, loading one at a time.
 
-        Returns:
-            List of all notes
+        Yields:
+            Note
         """
-        return list(map(Note.from_dict, self.heap.list_all_notes()))
+        return map(Note.from_dict, self.heap.iter_all_notes())
 
     # ============================================================
     # search using indexes
@@ -149,18 +276,10 @@ class NotesStorage(BaseStorage):
         Returns:
             List of found notes
         """
-        search_results = self.index_manager.search_by_prefix(INDEX_NOTE_TITLE, prefix)
+        def search() -> List[Dict[str, Any]]:
+            return self.heap.read_many("notes", self.index_manager.iter_uuids_by_prefix(INDEX_NOTE_TITLE, prefix))
 
-        all_uuids: Set[str] = set()
-        for uuids in search_results.values():
-            all_uuids.update(uuids)
-
-        notes = []
-        for uuid in all_uuids:
-            note = self.get_note_by_id(uuid)
-            if note:
-                notes.append(Note.from_dict(note))
-        return notes
+        return self._cached_search(("title", prefix.lower().strip()), search)
 
     def search_by_date(self, year: int, month: Optional[int] = None, day: Optional[int] = None) -> List[Note]:
         """
@@ -174,18 +293,35 @@ class NotesStorage(BaseStorage):
         Returns:
             List of found notes
         """
-        uuids = self.index_manager.search_by_date(INDEX_NOTE_CREATION_DATE, year, month, day)
+        def search() -> List[Dict[str, Any]]:
+            uuids = self.index_manager.search_by_date(INDEX_NOTE_CREATION_DATE, year, month, day)
+            return self.heap.read_many("notes", uuids)
+
+        return self._cached_search(("date", year, month, day), search)
+
+    def search_by_date_range(self, start: date, end: date) -> List[Note]:
+        """
+        Search notes created in a date range using the index.
+
+        Args:
+            start: First day of the range
+            end: Last day of the range (inclusive)
+
+        Returns:
+            List of found notes, oldest day first
+        """
+        def search() -> List[Dict[str, Any]]:
+            uuids = self.index_manager.iter_uuids_by_date_range(INDEX_NOTE_CREATION_DATE, start, end)
+            return self.heap.read_many("notes", uuids)
 
-        notes = []
-        for uuid in uuids:
-            note = self.get_note_by_id(uuid)
-            if note:
-                notes.append(note)
-        return notes
+        return self._cached_search(("date_range", start, end), search)
 
     def search_by_content(self, query: str) -> List[Note]:
         """
-        Search notes by content (simple search, without index).
+        Search notes by content.
+
+        Queries of 3+ characters are narrowed down with the content trigram
+        index, shorter ones scan all notes.
 
         Args:
             query: Search string
@@ -193,13 +329,22 @@ class NotesStorage(BaseStorage):
         Returns:
             List of found notes
         """
-        all_notes = self.heap.list_all_notes()
+        if not query or not query.strip():
+            return []
+
         query_lower = query.lower()
 
-        return [
-            Note.from_dict(note) for note in all_notes
-            if query_lower in note.get("content", "").lower()
-        ]
+        def search() -> List[Dict[str, Any]]:
+            if len(query_lower.strip()) >= 3:
+                uuids = self.index_manager.search_by_trigrams(INDEX_NOTE_CONTENT_TRIGRAM, query_lower)
+                candidates = self.heap.read_many("notes", uuids)
+            else:
+                candidates = self.heap.list_all_notes()
+
+            # trigrams only narrow down candidates, confirm the real substring match
+            return [note for note in candidates if query_lower in self._get_content_lower(note)]
+
+        return self._cached_search(("content", query_lower), search)
 
     def search_by_tag(self, tag: str) -> List[Note]:
         """
@@ -211,13 +356,17 @@ class NotesStorage(BaseStorage):
         Returns:
             List of found notes
         """
-        all_notes = self.heap.list_all_notes()
-        tag_lower = tag.lower()
+        if not tag or not tag.strip():
+            return []
+
+        tag_lower = tag.lower().strip()
+
+        def search() -> List[Dict[str, Any]]:
+            # tags are stored in a Trie index, the exact tag is one of its keys
+            results = self.index_manager.search_by_prefix(INDEX_NOTE_TAG, tag_lower)
+            return self.heap.read_many("notes", results.get(tag_lower, []))
 
-        return [
-            Note.from_dict(note) for note in all_notes
-            if tag_lower in [t.lower() for t in note.get('tags', [])]
-        ]
+        return self._cached_search(("tag", tag_lower), search)
 
     def get_notes_by_contact(self, contact_uuid: str) -> List[Note]:
         """
@@ -229,9 +378,8 @@ class NotesStorage(BaseStorage):
         Returns:
             List of notes
         """
-        all_notes = self.heap.list_all_notes()
+        def search() -> List[Dict[str, Any]]:
+            uuids = self.index_manager.search_by_exact_match(INDEX_NOTE_CONTACT, contact_uuid)
+            return self.heap.read_many("notes", uuids)
 
-        return [
-            note for note in all_notes
-            if contact_uuid in note.get('contact_ids', [])
-        ]
+        return self._cached_search(("contact", contact_uuid), search)
@@ -0,0 +1,324 @@
+"""
+SqliteHeapStorage — SQLite-backed storage for contacts and notes.
+
+Drop-in replacement for HeapStorage: all records live in a single
+database file, one table per entity type.
+Structure:
+data/
+└── heap.sqlite3
+    ├── contacts (uuid, version, data)
+    └── notes    (uuid, version, data)
+
+Selected with AppConfig.HEAP_BACKEND = "sqlite".
+"""
+
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, Optional, Iterable, Iterator, List
+
+ENTITY_TYPES = ("contacts", "notes")
+
+DB_FILE_NAME = "heap.sqlite3"
+
+# Max UUIDs per "IN (...)" query, below SQLite's default bound parameter limit
+READ_MANY_CHUNK = 500
+
+
+class SqliteHeapStorage:
+    """
+    SQLite data storage (Heap).
+
+    Each record is a row with UUID as the primary key and the JSON document
+    as the value. The version column changes on every write and plays the
+    role of the file mtime in HeapStorage.scan_versions.
+    """
+
+    def __init__(self, data_root: str = "data"):
+        """
+        Args:
+            data_root: Root directory for data
+        """
+        self.data_root = Path(data_root)
+        self.data_root.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.RLock()
+        self._in_batch = False
+        self._conn = sqlite3.connect(str(self.data_root / DB_FILE_NAME), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._ensure_tables()
+
+    def _ensure_tables(self):
+        """Creates a table per entity type."""
+        with self._lock:
+            for entity_type in ENTITY_TYPES:
+                self._conn.execute(
+                    f"CREATE TABLE IF NOT EXISTS {entity_type} ("
+                    "uuid TEXT PRIMARY KEY, version INTEGER NOT NULL, data TEXT NOT NULL)"
+                )
+            self._conn.commit()
+
+    @staticmethod
+    def _check_entity_type(entity_type: str) -> str:
+        """Validate entity type, it is used as a table name."""
+        if entity_type not in ENTITY_TYPES:
+            raise ValueError(f"Unknown entity type: {entity_type}")
+        return entity_type
+
+    def _commit(self):
+        """Commit unless inside batch()."""
+        if not self._in_batch:
+            self._conn.commit()
+
+    def close(self):
+        """Close database connection."""
+        with self._lock:
+            self._conn.close()
+
+    # ============================================================
+    # Generic operations
+    # ============================================================
+
+    def _insert(self, entity_type: str, entity_uuid: str, data: Dict[str, Any]):
+        table = self._check_entity_type(entity_type)
+        with self._lock:
+            self._conn.execute(
+                f"INSERT OR REPLACE INTO {table} (uuid, version, data) VALUES (?, ?, ?)",
+                (entity_uuid, time.time_ns(), json.dumps(data, ensure_ascii=False, separators=(',', ':'))),
+            )
+            self._commit()
+
+    def read(self, entity_type: str, entity_uuid: str) -> Optional[Dict[str, Any]]:
+        """
+        Read entity of a given type by UUID.
+
+        Returns:
+            Dict with entity data or None
+        """
+        table = self._check_entity_type(entity_type)
+        with self._lock:
+            row = self._conn.execute(f"SELECT data FROM {table} WHERE uuid = ?", (entity_uuid,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def read_many(self, entity_type: str, entity_uuids: Iterable[str]) -> List[Dict[str, Any]]:
+        """
+        Read several entities of a given type with one query per READ_MANY_CHUNK UUIDs.
+
+        Returns:
+            List of found entities in the order of UUIDs (missing UUIDs are skipped)
+        """
+        table = self._check_entity_type(entity_type)
+        entity_uuids = list(entity_uuids)
+        rows = {}
+        with self._lock:
+            for start in range(0, len(entity_uuids), READ_MANY_CHUNK):
+                chunk = entity_uuids[start:start + READ_MANY_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                rows.update(self._conn.execute(f"SELECT uuid, data FROM {table} WHERE uuid IN ({placeholders})", chunk))
+        # IN (...) returns rows in table order
+        return [json.loads(rows[entity_uuid]) for entity_uuid in entity_uuids if entity_uuid in rows]
+
+    def _update(self, entity_type: str, entity_uuid: str, data: Dict[str, Any]) -> bool:
+        with self._lock:
+            existing = self.read(entity_type, entity_uuid)
+            if existing is None:
+                return False
+
+            self._insert(entity_type, entity_uuid, self._add_metadata(existing, data))
+            return True
+
+    def _delete(self, entity_type: str, entity_uuid: str) -> bool:
+        table = self._check_entity_type(entity_type)
+        with self._lock:
+            cursor = self._conn.execute(f"DELETE FROM {table} WHERE uuid = ?", (entity_uuid,))
+            self._commit()
+        return cursor.rowcount > 0
+
+    def fingerprint(self, entity_type: str) -> List[int]:
+        """
+        Get a cheap fingerprint of all entities of a given type.
+
+        Returns:
+            [row_count, max_version]
+        """
+        table = self._check_entity_type(entity_type)
+        with self._lock:
+            count, max_version = self._conn.execute(f"SELECT count(*), max(version) FROM {table}").fetchone()
+        return [count, max_version or 0]
+
+    def scan_versions(self, entity_type: str) -> Dict[str, int]:
+        """
+        Get versions of all entities of a given type.
+
+        Returns:
+            Dict {uuid: version}
+        """
+        table = self._check_entity_type(entity_type)
+        with self._lock:
+            return dict(self._conn.execute(f"SELECT uuid, version FROM {table}").fetchall())
+
+    def list_all(self, entity_type: str) -> List[Dict[str, Any]]:
+        """
+        Get all entities of a given type.
+
+        Args:
+            entity_type: "contacts" or "notes"
+
+        Returns:
+            List of all entities
+        """
+        return list(self.iter_all(entity_type))
+
+    def iter_all(self, entity_type: str) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over all entities of a given type.
+
+        Rows are fetched up front, so the database is not locked while
+        the caller processes them.
+
+        Yields:
+            Entity data
+        """
+        table = self._check_entity_type(entity_type)
+        with self._lock:
+            rows = self._conn.execute(f"SELECT data FROM {table}").fetchall()
+
+        for (data,) in rows:
+            yield json.loads(data)
+
+    # ============================================================
+    # Batched writes
+    # ============================================================
+
+    @contextmanager
+    def batch(self, durable: bool = True):
+        """
+        Run all writes made inside the block in a single transaction.
+
+        Args:
+            durable: Kept for compatibility with HeapStorage.batch; every
+                transaction commit is synced according to the WAL settings
+        """
+        with self._lock:
+            if self._in_batch:
+                yield self
+                return
+
+            self._in_batch = True
+            try:
+                yield self
+                self._conn.commit()
+            except Exception:
+                self._conn.rollback()
+                raise
+            finally:
+                self._in_batch = False
+
+    def flush(self):
+        """Commit writes made so far inside batch()."""
+        with self._lock:
+            self._conn.commit()
+
+    # ============================================================
+    # CRUD operations for contacts
+    # ============================================================
+
+    def create_contact(self, contact_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Create a new contact.
+
+        Args:
+            contact_data: Contact data (without uuid, it will be generated)
+
+        Returns:
+            Full contact data including generated UUID and timestamps
+        """
+        now = datetime.now().isoformat()
+        contact_data['uuid'] = str(uuid.uuid4())
+        contact_data['created_at'] = now
+        contact_data['updated_at'] = now
+
+        self._insert("contacts", contact_data['uuid'], contact_data)
+        return contact_data
+
+    def read_contact(self, contact_uuid: str) -> Optional[Dict[str, Any]]:
+        """Read contact by UUID."""
+        return self.read("contacts", contact_uuid)
+
+    def update_contact(self, contact_uuid: str, contact_data: Dict[str, Any]) -> bool:
+        """Update existing contact. Returns False if contact not found."""
+        return self._update("contacts", contact_uuid, contact_data)
+
+    def delete_contact(self, contact_uuid: str) -> bool:
+        """Delete contact. Returns False if contact not found."""
+        return self._delete("contacts", contact_uuid)
+
+    def list_all_contacts(self) -> List[Dict[str, Any]]:
+        """Get all contacts."""
+        return self.list_all("contacts")
+
+    # ============================================================
+    # CRUD operations for notes
+    # ============================================================
+
+    def create_note(self, note_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Create a new note.
+
+        Args:
+            note_data: Note data (without uuid)
+
+        Returns:
+            Full note data including generated UUID and timestamps
+        """
+        now = datetime.now().isoformat()
+        note_data['uuid'] = str(uuid.uuid4())
+        if 'created_at' not in note_data:
+            note_data['created_at'] = now
+        note_data['updated_at'] = now
+
+        self._insert("notes", note_data['uuid'], note_data)
+        return note_data
+
+    def read_note(self, note_uuid: str) -> Optional[Dict[str, Any]]:
+        """Read note by UUID."""
+        return self.read("notes", note_uuid)
+
+    def update_note(self, note_uuid: str, note_data: Dict[str, Any]) -> bool:
+        """Update existing note. Returns False if note not found."""
+        return self._update("notes", note_uuid, note_data)
+
+    def delete_note(self, note_uuid: str) -> bool:
+        """Delete note. Returns False if note not found."""
+        return self._delete("notes", note_uuid)
+
+    def list_all_notes(self) -> List[Dict[str, Any]]:
+        """Get all notes."""
+        return self.list_all("notes")
+
+    def iter_all_notes(self) -> Iterator[Dict[str, Any]]:
+        """Iterate over all notes."""
+        return self.iter_all("notes")
+
+    def _add_metadata(self, existing: Dict[str, Any], new_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Preserve UUID and creation timestamp in new data.
+
+        Args:
+            existing: Existing record data
+            new_data: New record data
+
+        Returns:
+            Merged data with preserved fields
+        """
+        now = datetime.now().isoformat()
+        new_data['uuid'] = existing.get('uuid')
+        new_data['created_at'] = existing.get('created_at') or now
+        new_data['updated_at'] = now
+        return new_data
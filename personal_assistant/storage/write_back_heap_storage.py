@@ -0,0 +1,105 @@
+"""
+WriteBackHeapStorage — HeapStorage that saves records in the background.
+
+Writes are kept in memory and flushed to disk by a background thread,
+so bursts of creates/updates don't wait for the disk and are written
+together. Reads always see the latest data. Pending records are flushed
+on close() and at exit.
+
+Selected with AppConfig.HEAP_BACKEND = "writeback".
+"""
+
+import atexit
+import json
+import threading
+from typing import Dict, Any, Optional
+
+from personal_assistant.storage.heap_storage import HeapStorage
+
+# Seconds between background flushes
+FLUSH_INTERVAL = 1.0
+
+# Number of pending records that triggers a flush before the interval is over
+FLUSH_MAX_PENDING = 256
+
+
+class WriteBackHeapStorage(HeapStorage):
+    """
+    File-based data storage (Heap) with a write-back buffer.
+
+    Reuses the batch() machinery of HeapStorage: the pending buffer is
+    always on, and flush() is called by a background thread.
+    """
+
+    def __init__(
+        self,
+        data_root: str = "data",
+        flush_interval: float = FLUSH_INTERVAL,
+        max_pending: int = FLUSH_MAX_PENDING,
+    ):
+        """
+        Args:
+            data_root: Root directory for data
+            flush_interval: Seconds between background flushes
+            max_pending: Number of pending records that wakes the flusher early
+        """
+        super().__init__(data_root)
+        self._pending = {}
+        self._write_lock = threading.RLock()
+        self._flush_interval = flush_interval
+        self._max_pending = max_pending
+        self._wake = threading.Event()
+        self._closed = False
+
+        self._thread = threading.Thread(target=self._flush_loop, name="heap-write-back", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def _flush_loop(self):
+        """Flush pending records until close()."""
+        while not self._closed:
+            self._wake.wait(self._flush_interval)
+            self._wake.clear()
+            self.flush()
+
+    def close(self):
+        """Stop the background thread and write all pending records."""
+        if self._closed:
+            return
+
+        self._closed = True
+        self._wake.set()
+        self._thread.join()
+        self.flush()
+        atexit.unregister(self.close)
+
+    def flush(self):
+        """Write pending records to disk."""
+        with self._write_lock:
+            super().flush()
+
+    def _save_atomic(self, file_path: str, data: Dict[str, Any], new_file: bool = False):
+        with self._write_lock:
+            super()._save_atomic(file_path, data, new_file)
+            pending_count = len(self._pending)
+        if self._closed:
+            self.flush()
+        elif pending_count >= self._max_pending:
+            # otherwise the write waits for the next interval, together with the rest of its burst
+            self._wake.set()
+
+    def _load(self, file_path: str) -> Optional[Dict[str, Any]]:
+        # waits for a running flush, so the file is not read half-way through it
+        with self._write_lock:
+            payload = self._pending.get(file_path)
+        if payload is not None:
+            return json.loads(payload)
+        return super()._load(file_path)
+
+    def _delete(self, file_path: str) -> bool:
+        with self._write_lock:
+            return super()._delete(file_path)
+
+    def _get_pending_in(self, entity_dir: str) -> Dict[str, bytes]:
+        with self._write_lock:
+            return super()._get_pending_in(entity_dir)
@@ -2,9 +2,9 @@ import asyncio
 from typing import Type
 
 from textual.driver import Driver
-from textual.suggester import SuggestFromList
 from textual.app import App, ComposeResult
 from textual.containers import VerticalScroll
+from textual.screen import Screen
 from textual.widgets import (
     Header,
     Footer,
@@ -14,16 +14,23 @@ from textual.widgets import (
 
 from personal_assistant.cli.args_parsers import parse_input
 from personal_assistant.presenters.presenters_registry import PresentersRegistry
-from personal_assistant.tui.screens.help.help import HelpScreen
+from personal_assistant.tui.suggester import PrefixSuggester
 from personal_assistant.storage.address_book import AddressBookStorage
 from personal_assistant.storage.notes_storage import NotesStorage
 from personal_assistant.config import AppConfig
 
 
+def _help_screen() -> Screen:
+    """Create the help screen, importing it only when help is first shown."""
+    from personal_assistant.tui.screens.help.help import HelpScreen
+
+    return HelpScreen()
+
+
 class AddressBookApp(App):
     """Textual interface for the address book."""
 
-    INPUT_SUGGESTIONS = [
+    INPUT_SUGGESTIONS = (
         "hello",
         "help",
         "add-contact",
@@ -32,6 +39,7 @@ class AddressBookApp(App):
         "search-email",
         "search-notes",
         "search-tag",
+        "search-date",
         "all",
         "all-notes",
         "add-note",
@@ -47,176 +55,18 @@ class AddressBookApp(App):
         "clear",
         "exit",
         "close",
-    ]
-
-    CSS = """
-    #main-log-container {
-        height: 80%; 
-        border: solid white;
-        margin: 1;
-    }
-    #command-input {
-        dock: bottom;
-        margin: 0 1 1 1;
-    }
-    AllContactsScreen {
-        layout: vertical;
-    }
-
-    #all-contacts-table {
-        height: 100%;
-        width: 100%;
-    }
-
-    BirthdaysScreen {
-        layout: vertical;
-    }
-
-    #birthdays-table {
-        height: 100%;
-        width: 100%;
-    }
-
-
-    AddContactScreen {
-        align: center middle;
-    }
-
-    #add-contact-form {
-        width: 60;
-        height: auto;
-        border: thick $primary;
-        background: $panel;
-        padding: 1 2;
-    }
-    
-    #add-contact-form .title {
-        width: 100%;
-        text-align: center;
-        padding-bottom: 1;
-    }
-
-    #add-contact-form Static {
-        margin-top: 1;
-        width: 100%;
-    }
-    
-    #add-contact-form Input {
-        width: 100%;
-    }
-    
-    #add-contact-form Input:disabled {
-        background: $boost;
-        color: $text-muted;
-        border: solid $panel;
-    }
-    
-    #form-error {
-        height: auto;
-        margin-top: 1;
-        color: red;
-        display: none;
-    }
-
-    #form-buttons {
-        width: 100%;
-        align: center middle;
-        margin-top: 2;
-    }
-
-    #form-buttons Button {
-        margin: 0 1;
-    }
-
-    ConfirmationScreen {
-        align: center middle;
-    }
-
-    #dialog {
-        grid-size: 2;
-        grid-gutter: 1 2;
-        grid-rows: 1fr 3;
-        padding: 0 1;
-        width: 60;
-        height: 11;
-        border: thick $primary;
-        background: $surface;
-    }
-
-    #question {
-        column-span: 2;
-        height: 100%;
-        width: 100%;
-        content-align: center middle;
-    }
-
-    #yes {
-        width: 100%;
-    }
+    )
 
-    #no {
-        width: 100%;
-    }
-
-    NoteFormScreen {
-        layout: vertical;
-    }
-
-    #form-container {
-        margin: 1;
-        padding: 1;
-    }
+    # prefix map of the commands, built once when the class is loaded
+    COMMAND_SUGGESTER = PrefixSuggester(INPUT_SUGGESTIONS, case_sensitive=False)
 
-    #form-fields {
-        height: auto;
-        margin: 1;
-    }
-
-    .field-label {
-        margin-top: 1;
-        margin-bottom: 0;
-        text-style: bold;
-    }
-
-    #title-input {
-        width: 100%;
-        margin-bottom: 1;
-    }
+    CSS_PATH = "app.tcss"
 
-    #creation-date-display {
-        width: 100%;
-        margin-bottom: 1;
-        padding: 1;
-        background: $surface;
-        border: solid $primary;
+    # screens created once and reused on every push (help renders a large Markdown document)
+    SCREENS = {
+        "help": _help_screen,
     }
 
-    .readonly-field {
-        color: $text-muted;
-    }
-
-    #description-input {
-        width: 100%;
-        height: 10;
-        margin-bottom: 1;
-    }
-
-    #tags-input {
-        width: 100%;
-        margin-bottom: 1;
-    }
-
-    #error-message {
-        margin-top: 1;
-        margin-bottom: 1;
-        min-height: 1;
-    }
-
-    #save-button {
-        margin-right: 2;
-    }
-    """
-
     BINDINGS = [
         ("ctrl+q", "quit", "Quit"),
         ("f1", "show_help", "Help"),
@@ -238,6 +88,22 @@ class AddressBookApp(App):
         AppConfig.set_mode(mode)
 
         self.log_widget = None
+        self.input_widget = None
+        # list of available commands, the registry doesn't change after start
+        self._inline_help: str | None = None
+        # opened in the background after mount, see _open_storages
+        self.address_book_storage = None
+        self.notes_storage = None
+        self.command_registry = None
+        # commands handled by the app itself, looked up before the presenters registry
+        self._builtin_commands = {
+            "exit": self.action_quit,
+            "close": self.action_quit,
+            "clear": self.action_clear_log,
+        }
+
+    def _open_storages(self) -> None:
+        """Open storages (may sync or rebuild indexes) and register commands. Runs in a thread."""
         self.address_book_storage = AddressBookStorage()
         self.notes_storage = NotesStorage()
         self.command_registry = PresentersRegistry(
@@ -251,38 +117,50 @@ class AddressBookApp(App):
         with VerticalScroll(id="main-log-container"):
             yield RichLog(id="main-log", highlight=True, markup=True)
 
-        command_suggester = SuggestFromList(
-            self.INPUT_SUGGESTIONS, case_sensitive=False
-        )
-
         yield Input(
             id="command-input",
             placeholder="Enter command (e.g., 'all', 'add Bob 123...')",
-            suggester=command_suggester,
+            suggester=self.COMMAND_SUGGESTER,
         )
         yield Footer()
 
     def on_mount(self) -> None:
         """Called when app is first mounted."""
         self.log_widget = self.query_one(RichLog)
+        self.input_widget = self.query_one(Input)
 
         self.log_widget.write("[bold green]Welcome to the assistant bot![/bold green]")
+        self.log_widget.write("Loading contacts and notes...")
+
+        # commands can't run until storages are open
+        self.input_widget.disabled = True
+        self.run_worker(self._load(), exclusive=True)
+
+    async def _load(self) -> None:
+        """Open storages without blocking the UI, then enable the command input."""
+        await asyncio.to_thread(self._open_storages)
+
         self.log_widget.write(
             "Type commands below and press Enter. (Write close or exit to save and quit)"
         )
-
-        self.query_one(Input).focus()
+        self.input_widget.disabled = False
+        self.input_widget.focus()
 
     async def action_quit(self) -> None:
         """Called when the user write exit."""
 
         self.log_widget.write("[bold red]Good bye!👋[/bold red]")
-        await asyncio.sleep(1)
         self.exit()
 
+    async def action_clear_log(self) -> None:
+        """Called when the user write clear."""
+        self.log_widget.clear()
+
     def action_show_help(self) -> None:
         """Show help screen when F1 is pressed."""
-        self.push_screen(HelpScreen())
+        help_screen = self.get_screen("help")
+        if self.screen is not help_screen:
+            self.push_screen(help_screen)
 
     def log_operation_result(self, result: tuple) -> None:
         """Callback to log the result of a modal screen operation."""
@@ -299,18 +177,15 @@ class AddressBookApp(App):
 
         user_input = event.value
 
-        self.query_one(Input).value = ""
+        self.input_widget.value = ""
 
         self.log_widget.write(f"> {user_input}")
 
         command_id, args = parse_input(user_input)
 
-        if command_id == "exit" or command_id == "close":
-            await self.action_quit()
-            return
-
-        if command_id == "clear":
-            self.log_widget.clear()
+        builtin_command = self._builtin_commands.get(command_id)
+        if builtin_command:
+            await builtin_command()
             return
 
         command = self.command_registry.get(command_id)
@@ -319,6 +194,10 @@ class AddressBookApp(App):
             self.show_inline_help(command_id)
             return
 
+        if len(args) < command.min_args:
+            self.log_widget.write(f"[bold red]{command.usage}[/bold red]")
+            return
+
         try:
             await command.execute_tui(self, args)
         except Exception as e:
@@ -326,16 +205,18 @@ class AddressBookApp(App):
 
     def show_inline_help(self, command_id:str) -> None:
         """Show inline help in the log widget."""
-        self.log_widget.write(
-            f"[bold red]🦥 Uhh... I looked everywhere. No such '{command_id}'.[/bold red]"
-        )
-
-        output = "[bold green]Available commands:[/bold green]\n\n"
-
-        for cmd_name, presenter in sorted(self.command_registry.commands.items()):
-            if cmd_name != "exit":
-                output += f"[bold cyan]{cmd_name:20}[/bold cyan] - {presenter.description}\n"
-
-        output += f"[bold cyan]{'exit':20}[/bold cyan] - Exit the application\n"
-
-        self.log_widget.write(output)
+        if self._inline_help is None:
+            parts = ["[bold green]Available commands:[/bold green]\n"]
+            parts.extend(
+                f"[bold cyan]{cmd_name:20}[/bold cyan] - {presenter.description}"
+                for cmd_name, presenter in sorted(self.command_registry.commands.items())
+                if cmd_name != "exit"
+            )
+            parts.append(f"[bold cyan]{'exit':20}[/bold cyan] - Exit the application")
+            self._inline_help = "\n".join(parts) + "\n"
+
+        with self.batch_update():
+            self.log_widget.write(
+                f"[bold red]🦥 Uhh... I looked everywhere. No such '{command_id}'.[/bold red]"
+            )
+            self.log_widget.write(self._inline_help)
@@ -8,11 +8,65 @@ from textual.widgets import (
     Button,
 )
 
+from personal_assistant.models.exceptions import BirthdayInFutureError, InvalidBirthdayFormatError
+from personal_assistant.models.field import Birthday, Phone
 from personal_assistant.models.record import Record
 
 
 class AddContactScreen(ModalScreen):
 
+    DEFAULT_CSS = """
+    AddContactScreen {
+        align: center middle;
+    }
+
+    #add-contact-form {
+        width: 60;
+        height: auto;
+        border: thick $primary;
+        background: $panel;
+        padding: 1 2;
+    }
+
+    #add-contact-form .title {
+        width: 100%;
+        text-align: center;
+        padding-bottom: 1;
+    }
+
+    #add-contact-form Static {
+        margin-top: 1;
+        width: 100%;
+    }
+
+    #add-contact-form Input {
+        width: 100%;
+    }
+
+    #add-contact-form Input:disabled {
+        background: $boost;
+        color: $text-muted;
+        border: solid $panel;
+    }
+
+    #form-error {
+        height: auto;
+        margin-top: 1;
+        color: red;
+        display: none;
+    }
+
+    #form-buttons {
+        width: 100%;
+        align: center middle;
+        margin-top: 2;
+    }
+
+    #form-buttons Button {
+        margin: 0 1;
+    }
+    """
+
     def __init__(
         self,
         existing_contact: Optional[Record] = None,
@@ -21,40 +75,50 @@ class AddContactScreen(ModalScreen):
         super().__init__(**kwargs)
         self.existing_contact = existing_contact
 
+        # form widgets are kept here, so handlers don't query the DOM for them
+        self.title_widget = Static("Add New Contact", classes="title")
+        self.error_widget = Static(id="form-error")
+        self.name_input = Input(id="name-input", placeholder="John Doe")
+        self.phone1_input = Input(id="phone1-input", placeholder="0XXXXXXXXX")
+        self.phone2_input = Input(id="phone2-input", placeholder="0XXXXXXXXX")
+        self.birthday_input = Input(id="birthday-input", placeholder="DD.MM.YYYY")
+        self.email_input = Input(id="email-input", placeholder="john.doe@example.com")
+        self.address_input = Input(id="address-input", placeholder="123 Main St")
+
     def compose(self) -> ComposeResult:
         with Vertical(id="add-contact-form"):
 
-            yield Static("Add New Contact", classes="title")
+            yield self.title_widget
 
-            yield Static(id="form-error")
+            yield self.error_widget
 
             yield Static("Name: [red]*[/red]")
-            yield Input(id="name-input", placeholder="John Doe")
+            yield self.name_input
 
             yield Static("Phone1: [red]*[/red]")
-            yield Input(id="phone1-input", placeholder="0XXXXXXXXX")
+            yield self.phone1_input
 
             yield Static("Phone2:")
-            yield Input(id="phone2-input", placeholder="0XXXXXXXXX")
+            yield self.phone2_input
 
             yield Static("Birthday:")
-            yield Input(id="birthday-input", placeholder="DD.MM.YYYY")
+            yield self.birthday_input
 
             yield Static("Email:")
-            yield Input(id="email-input", placeholder="john.doe@example.com")
+            yield self.email_input
 
             yield Static("Address:")
-            yield Input(id="address-input", placeholder="123 Main St")
+            yield self.address_input
 
             with Horizontal(id="form-buttons"):
                 yield Button("Submit", id="submit-form", variant="primary")
                 yield Button("Cancel", id="cancel-form", variant="error")
 
     def on_mount(self) -> None:
-        self.query_one("#form-error", Static).display = False
+        self.error_widget.display = False
 
         if self.existing_contact:
-            self.query_one(".title", Static).update("Edit Contact")
+            self.title_widget.update("Edit Contact")
 
             first_name = self.existing_contact.first_name.value
             last_name = (
@@ -64,49 +128,42 @@ class AddContactScreen(ModalScreen):
             )
             name = f"{first_name} {last_name}".strip()
 
-            name_input = self.query_one("#name-input", Input)
-            name_input.value = name
+            self.name_input.value = name
 
             phones = self.existing_contact.phones
             if len(phones) > 0:
-                self.query_one("#phone1-input", Input).value = phones[0].value
+                self.phone1_input.value = phones[0].value
             if len(phones) > 1:
-                self.query_one("#phone2-input", Input).value = phones[1].value
+                self.phone2_input.value = phones[1].value
 
             if self.existing_contact.birthday:
-                self.query_one("#birthday-input", Input).value = (
-                    self.existing_contact.birthday.value.strftime("%d.%m.%Y")
-                )
+                self.birthday_input.value = self.existing_contact.birthday.formatted
 
             if self.existing_contact.email:
-                self.query_one("#email-input", Input).value = (
-                    self.existing_contact.email.value
-                )
+                self.email_input.value = self.existing_contact.email.value
 
             if self.existing_contact.address:
-                self.query_one("#address-input", Input).value = (
-                    self.existing_contact.address.value
-                )
+                self.address_input.value = self.existing_contact.address.value
 
-            self.query_one("#phone1-input", Input).focus()
+            self.phone1_input.focus()
 
         else:
 
-            self.query_one("#name-input", Input).focus()
+            self.name_input.focus()
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "cancel-form":
             self.dismiss((False, "Operation cancelled", None))
 
         elif event.button.id == "submit-form":
-            error_widget = self.query_one("#form-error", Static)
+            error_widget = self.error_widget
 
-            name = self.query_one("#name-input", Input).value.strip()
-            phone1 = self.query_one("#phone1-input", Input).value.strip()
-            phone2 = self.query_one("#phone2-input", Input).value.strip()
-            birthday_str = self.query_one("#birthday-input", Input).value.strip()
-            email = self.query_one("#email-input", Input).value.strip()
-            address = self.query_one("#address-input", Input).value.strip()
+            name = self.name_input.value.strip()
+            phone1 = self.phone1_input.value.strip()
+            phone2 = self.phone2_input.value.strip()
+            birthday_str = self.birthday_input.value.strip()
+            email = self.email_input.value.strip()
+            address = self.address_input.value.strip()
 
             if not name:
                 error_widget.update("[red]Error:[/red] Name is required")
@@ -118,6 +175,21 @@ class AddContactScreen(ModalScreen):
                 error_widget.display = True
                 return
 
+            # catch typos here instead of after the form is closed
+            for phone in (phone1, phone2):
+                if phone and Phone.normalize_ua_phone(phone) is None:
+                    error_widget.update(f"[red]Error:[/red] Invalid phone number: {phone}")
+                    error_widget.display = True
+                    return
+
+            if birthday_str:
+                try:
+                    Birthday(birthday_str)
+                except (InvalidBirthdayFormatError, BirthdayInFutureError) as e:
+                    error_widget.update(f"[red]Error:[/red] {e}")
+                    error_widget.display = True
+                    return
+
             try:
                 name_parts = name.split(maxsplit=1)
                 first_name = name_parts[0]
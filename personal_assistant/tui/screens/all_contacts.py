@@ -1,11 +1,80 @@
+from collections import OrderedDict
+from itertools import islice
+from typing import Iterator, Tuple
+
 from textual.app import ComposeResult
 from textual.screen import Screen
 from textual.widgets import DataTable, Footer, Header
 from personal_assistant.models.record import Record
 
+# placeholders of empty cells
+NO_PHONES = "[italic]No phones[/italic]"
+NO_BIRTHDAY = "[italic]No birthday[/italic]"
+NO_EMAIL = "[italic]No email[/italic]"
+NO_ADDRESS = "[italic]No address[/italic]"
+
+# rows added to the table at once, the first chunk is shown right away
+ROWS_CHUNK = 200
+# the next chunk is added when the view or the cursor gets this close to the last added row
+PRELOAD_ROWS = 50
+
+# text of the row numbers, shared by every table instead of formatted per row
+ROW_NUMBERS: tuple[str, ...] = tuple(map(str, range(1, 10001)))
+
+# cells of the last ROW_CACHE_SIZE shown contacts by (uuid, updated_at), reused when the screen is opened again
+ROW_CACHE_SIZE = 4096
+_row_cache: "OrderedDict[Tuple[str, str], tuple]" = OrderedDict()
+
+
+def _format_cells(record: Record) -> tuple:
+    """Build table cells of a contact (all columns but the row number)."""
+    first_name = record.first_name.value
+    last_name = record.last_name.value if record.last_name else None
+    name = f"{first_name} {last_name}" if last_name else first_name
+
+    birthday = record.birthday
+
+    return (
+        name,
+        record.phones_csv or NO_PHONES,
+        birthday.formatted if birthday else NO_BIRTHDAY,
+        record.email or NO_EMAIL,
+        record.address or NO_ADDRESS,
+    )
+
+
+def _row_cells(record: Record) -> tuple:
+    """Get table cells of a contact, formatted once per stored version of the contact."""
+    if record.uuid is None or record.updated_at is None:
+        # not saved or changed since loaded
+        return _format_cells(record)
+
+    key = (record.uuid, record.updated_at)
+    cells = _row_cache.get(key)
+    if cells is None:
+        cells = _format_cells(record)
+        _row_cache[key] = cells
+        if len(_row_cache) > ROW_CACHE_SIZE:
+            _row_cache.popitem(last=False)
+    else:
+        _row_cache.move_to_end(key)
+
+    return cells
+
 
 class AllContactsScreen(Screen):
 
+    DEFAULT_CSS = """
+    AllContactsScreen {
+        layout: vertical;
+    }
+
+    #all-contacts-table {
+        height: 100%;
+        width: 100%;
+    }
+    """
+
     BINDINGS = [
         (
             "escape",
@@ -17,6 +86,9 @@ class AllContactsScreen(Screen):
     def __init__(self, contacts: list[Record], **kwargs):
         super().__init__(**kwargs)
         self.contacts = contacts
+        self._rows: Iterator[tuple] = iter(())
+        # a chunk is scheduled and not added yet
+        self._chunk_pending = False
 
     def compose(self) -> ComposeResult:
         yield Header(name="All Contacts")
@@ -35,28 +107,38 @@ class AllContactsScreen(Screen):
             table.add_row("[italic]No contacts found.[/italic]")
             return
 
-        for i, record in enumerate(contacts, start=1):
-            name = f"{record.first_name.value} {record.last_name.value if record.last_name else ''}".strip()
-
-            phones = (
-                ", ".join(p.value for p in record.phones)
-                or "[italic]No phones[/italic]"
-            )
-            birthday = (
-                record.birthday.value.strftime("%d.%m.%Y")
-                if record.birthday
-                else "[italic]No birthday[/italic]"
-            )
-            email = (
-                record.email
-                if record.email and record.email.value
-                else "[italic]No email[/italic]"
-            )
-
-            address = (
-                record.address
-                if record.address and record.address.value
-                else "[italic]No address[/italic]"
-            )
-
-            table.add_row(str(i), name, phones, birthday, email, address)
+        self._rows = self._iter_rows()
+        self._add_rows_chunk()
+
+        # the rest of the rows are built only when the user scrolls or moves the cursor down to them
+        self.watch(table, "scroll_y", self._preload_rows, init=False)
+        self.watch(table, "cursor_coordinate", self._preload_rows, init=False)
+
+    def _preload_rows(self) -> None:
+        """Schedule the next chunk if the view or the cursor is close to the last added row."""
+        if self._chunk_pending:
+            return
+
+        table = self.query_one(DataTable)
+        if (
+            table.max_scroll_y - table.scroll_y < PRELOAD_ROWS
+            or table.row_count - table.cursor_row <= PRELOAD_ROWS
+        ):
+            # added after the refresh: adding rows moves the table's scroll and cursor,
+            # which must not start the next chunk before the layout is updated
+            self._chunk_pending = True
+            self.call_after_refresh(self._add_rows_chunk)
+
+    def _add_rows_chunk(self) -> None:
+        """Add the next ROWS_CHUNK rows (nothing if all rows were added)."""
+        rows = list(islice(self._rows, ROWS_CHUNK))
+        if rows:
+            # a chunk is added at once, the table updates its layout a single time per chunk
+            self.query_one(DataTable).add_rows(rows)
+        self._chunk_pending = False
+
+    def _iter_rows(self) -> Iterator[tuple]:
+        """Build table rows of the contacts one by one."""
+        for i, record in enumerate(self.contacts):
+            number = ROW_NUMBERS[i] if i < len(ROW_NUMBERS) else str(i + 1)
+            yield (number, *_row_cells(record))
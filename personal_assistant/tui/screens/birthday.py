@@ -1,10 +1,29 @@
+import asyncio
+from typing import Callable
+
 from textual.app import ComposeResult
 from textual.screen import Screen
 from textual.widgets import Header, DataTable, Footer
 
+# placeholders of a table being loaded and an empty table, and the "Days Until" text of today's birthdays
+LOADING = "[italic]Loading...[/italic]"
+NO_UPCOMING_BIRTHDAYS = "[italic]No upcoming birthdays in the next 7 days.[/italic]"
+TODAY = "Today!"
+
 
 class BirthdaysScreen(Screen):
 
+    DEFAULT_CSS = """
+    BirthdaysScreen {
+        layout: vertical;
+    }
+
+    #birthdays-table {
+        height: 100%;
+        width: 100%;
+    }
+    """
+
     BINDINGS = [
         (
             "escape",
@@ -13,10 +32,11 @@ class BirthdaysScreen(Screen):
         ),
     ]
 
-    def __init__(self, upcoming_birthdays: list[tuple[str, str, int]], **kwargs):
+    def __init__(self, upcoming_birthdays: Callable[[], list[tuple[str, str, int]]], **kwargs):
         """
         Args:
-            upcoming_birthdays: List of tuples (name, birthday_str, days_until)
+            upcoming_birthdays: Function returning list of tuples (name, birthday_str, days_until),
+                called in a thread once the screen is shown
         """
         super().__init__(**kwargs)
         self.upcoming_birthdays = upcoming_birthdays
@@ -30,11 +50,22 @@ class BirthdaysScreen(Screen):
         table = self.query_one(DataTable)
 
         table.add_columns("№", "Name", "Birthday", "Days Until")
+        table.add_row(LOADING)
+
+        self.run_worker(self._load(), exclusive=True)
+
+    async def _load(self) -> None:
+        """Find upcoming birthdays without blocking the UI, then replace the placeholder with them."""
+        upcoming_birthdays = await asyncio.to_thread(self.upcoming_birthdays)
+
+        table = self.query_one(DataTable)
+        table.clear()
 
-        if not self.upcoming_birthdays:
-            table.add_row("[italic]No upcoming birthdays in the next 7 days.[/italic]")
+        if not upcoming_birthdays:
+            table.add_row(NO_UPCOMING_BIRTHDAYS)
             return
 
-        for i, (name, birthday_str, days_until) in enumerate(self.upcoming_birthdays, start=1):
-            day_str = "Today!" if days_until == 0 else f"{days_until} day(s)"
-            table.add_row(str(i), name, birthday_str, day_str)
+        table.add_rows(
+            (str(i), name, birthday_str, TODAY if days_until == 0 else f"{days_until} day(s)")
+            for i, (name, birthday_str, days_until) in enumerate(upcoming_birthdays, start=1)
+        )
@@ -8,6 +8,38 @@ from textual.screen import ModalScreen
 class ConfirmationScreen(ModalScreen[bool]):
     """Screen to confirm an action."""
 
+    DEFAULT_CSS = """
+    ConfirmationScreen {
+        align: center middle;
+    }
+
+    #dialog {
+        grid-size: 2;
+        grid-gutter: 1 2;
+        grid-rows: 1fr 3;
+        padding: 0 1;
+        width: 60;
+        height: 11;
+        border: thick $primary;
+        background: $surface;
+    }
+
+    #question {
+        column-span: 2;
+        height: 100%;
+        width: 100%;
+        content-align: center middle;
+    }
+
+    #yes {
+        width: 100%;
+    }
+
+    #no {
+        width: 100%;
+    }
+    """
+
     def __init__(self, message: str) -> None:
         super().__init__()
         self.message = message
@@ -23,7 +23,7 @@ Use the commands below to manage contacts, notes, birthdays, and search your rec
 
 | Command | Description | Attributes |
 |----------|--------------|-------------|
-| **`search [query]`** | Search contacts by name. | `query`: text |
+| **`search [query]`** | Search contacts by name (prefix, or any part of the full name). | `query`: text |
 | **`search-phone [phone]`** | Search contacts by phone number. | `phone`: text |
 | **`search-email [email]`** | Search contacts by email address. | `email`: text |
 
@@ -55,6 +55,7 @@ Use the commands below to manage contacts, notes, birthdays, and search your rec
 |----------|--------------|-------------|
 | **`search-notes [query]`** | Search notes by title or content. | `query`: text |
 | **`search-tag [tag]`** | Search notes by tag. | `tag`: text |
+| **`search-date [from] [to]`** | Search notes created on a day or in a date range. | `from`, `to`: DD.MM.YYYY |
 
 ---
 
@@ -1,3 +1,4 @@
+import re
 from datetime import datetime
 from textual.app import ComposeResult
 from textual.screen import ModalScreen
@@ -15,9 +16,84 @@ from textual.message import Message
 
 from personal_assistant.models.note import Note
 
+# characters a tag can't contain
+FORBIDDEN_TAG_CHARS = re.compile(r"[%&]")
+# comma between tags with the whitespace around it
+TAG_SEPARATOR = re.compile(r"\s*,\s*")
+
 
 class NoteFormScreen(ModalScreen):
 
+    DEFAULT_CSS = """
+    NoteFormScreen {
+        layout: vertical;
+    }
+
+    #form-container {
+        margin: 1;
+        padding: 1;
+    }
+
+    #form-fields {
+        height: auto;
+        margin: 1;
+    }
+
+    .field-label {
+        margin-top: 1;
+        margin-bottom: 0;
+        text-style: bold;
+    }
+
+    #title-input {
+        width: 100%;
+        margin-bottom: 1;
+    }
+
+    #creation-date-display {
+        width: 100%;
+        margin-bottom: 1;
+        padding: 1;
+        background: $surface;
+        border: solid $primary;
+    }
+
+    .readonly-field {
+        color: $text-muted;
+    }
+
+    #description-input {
+        width: 100%;
+        height: 10;
+        margin-bottom: 1;
+    }
+
+    #tags-input {
+        width: 100%;
+        margin-bottom: 1;
+    }
+
+    #error-message {
+        margin-top: 1;
+        margin-bottom: 1;
+        min-height: 1;
+    }
+
+    #save-button {
+        margin-right: 2;
+    }
+
+    #form-buttons {
+        width: 100%;
+        align: center middle;
+        margin-top: 2;
+    }
+
+    #form-buttons Button {
+        margin: 0 1;
+    }
+    """
+
     BINDINGS = [
         ("escape", "cancel", "Cancel"),
         ("ctrl+s", "save", "Save"),
@@ -47,13 +123,11 @@ class NoteFormScreen(ModalScreen):
                 )
 
                 yield Label("Creation Date:", classes="field-label")
-                creation_date_str = (
-                    self.existing_note.creation_date.strftime("%d.%m.%Y %H:%M:%S")
-                    if self.existing_note
-                    else datetime.now().strftime("%d.%m.%Y %H:%M:%S")
-                )
+                date = self.existing_note.creation_date if self.existing_note else datetime.now()
                 yield Static(
-                    creation_date_str,
+                    # "DD.MM.YYYY HH:MM:SS" without strftime parsing a format string
+                    f"{date.day:02d}.{date.month:02d}.{date.year:04d} "
+                    f"{date.hour:02d}:{date.minute:02d}:{date.second:02d}",
                     id="creation-date-display",
                     classes="readonly-field",
                 )
@@ -66,7 +140,7 @@ class NoteFormScreen(ModalScreen):
 
                 yield Label("Tags (comma-separated, each > 3 symbols, no % & special symbols):", classes="field-label")
                 tags_value = (
-                    ", ".join(tag.value for tag in self.existing_note.tags)
+                    ", ".join([tag.value for tag in self.existing_note.tags])
                     if self.existing_note
                     else ""
                 )
@@ -116,16 +190,19 @@ class NoteFormScreen(ModalScreen):
 
             tags_list = []
             if tags_str:
-                tags_list = [tag.strip() for tag in tags_str.split(",") if tag.strip()]
-                for tag in tags_list:
+                # tags_str is stripped, so splitting at the separators leaves no whitespace around tags
+                for tag in TAG_SEPARATOR.split(tags_str):
+                    if not tag:
+                        continue
                     if len(tag) <= 3:
                         error_widget.update(f"[bold red]Error: Tag '{tag}' must be more than 3 symbols.[/bold red]")
                         tags_input.focus()
                         return
-                    if any(char in tag for char in '%&'):
+                    if FORBIDDEN_TAG_CHARS.search(tag):
                         error_widget.update(f"[bold red]Error: Tag '{tag}' contains invalid characters.[/bold red]")
                         tags_input.focus()
                         return
+                    tags_list.append(tag)
 
             note_data = {
                 "title": title,
@@ -0,0 +1,37 @@
+from typing import Dict, Iterable, Optional
+
+from textual.suggester import Suggester
+
+
+class PrefixSuggester(Suggester):
+    """
+    Give completion suggestions from a fixed list of options.
+
+    Same results as textual's SuggestFromList, but every prefix of every
+    option is mapped to its suggestion up front, so a lookup is a single
+    dict access instead of a scan over all options.
+    """
+
+    def __init__(self, suggestions: Iterable[str], *, case_sensitive: bool = True):
+        """
+        Args:
+            suggestions: Valid suggestions sorted by decreasing priority
+            case_sensitive: Whether suggestions are matched case sensitively;
+                they are always suggested with their original casing
+        """
+        super().__init__(case_sensitive=case_sensitive)
+        self._by_prefix: Dict[str, str] = {}
+        for suggestion in suggestions:
+            key = suggestion if case_sensitive else suggestion.casefold()
+            for end in range(len(key) + 1):
+                # the first suggestion in priority order wins a shared prefix
+                self._by_prefix.setdefault(key[:end], suggestion)
+
+    async def get_suggestion(self, value: str) -> Optional[str]:
+        """
+        Get a completion for the given value (casefolded unless case sensitive).
+
+        Returns:
+            A valid completion suggestion or None
+        """
+        return self._by_prefix.get(value)
@@ -1,11 +1,29 @@
 import faker
 import random
+from datetime import date
+from functools import lru_cache
 from typing import Generator, List
 
 from personal_assistant.models import Name
 from personal_assistant.models.record import Record
 from personal_assistant.models.note import Note, Tag
 
+# number of distinct random tags generated notes pick from
+TAG_POOL_SIZE = 1000
+
+
+@lru_cache(maxsize=None)
+def _get_faker() -> faker.Faker:
+    """Get the Faker shared by all generators, created on first use (loading its providers is slow)."""
+    return faker.Faker()
+
+
+@lru_cache(maxsize=None)
+def _get_tag_pool() -> tuple:
+    """Get random tag texts, built once so generating a note doesn't call Faker per tag."""
+    fake = _get_faker()
+    return tuple(fake.pystr(min_chars=4, max_chars=10) for _ in range(TAG_POOL_SIZE))
+
 
 def generate_contacts(num_contacts: int = 10) -> Generator[Record, None, None]:
     """
@@ -17,15 +35,15 @@ def generate_contacts(num_contacts: int = 10) -> Generator[Record, None, None]:
     Yields:
         A Record object with fake data.
     """
-    fake = faker.Faker()
+    fake = _get_faker()
+    # birthdays of people aged 18 to 80, as day ordinals (years counted as 365.25 days)
+    today = date.today().toordinal()
+    oldest, youngest = today - int(81 * 365.25) + 1, today - int(18 * 365.25)
     for _ in range(num_contacts):
-        full_name = fake.name()
-        full_name_lst = full_name.split(" ")
-        first_name = full_name_lst[0]
-        last_name = full_name_lst[1] if len(full_name_lst) > 1 else None
-        birthday = fake.date_of_birth(minimum_age=18, maximum_age=80).strftime(
-            "%d.%m.%Y"
-        )
+        first_name = fake.first_name()
+        last_name = fake.last_name()
+        day = date.fromordinal(random.randint(oldest, youngest))
+        birthday = f"{day.day:02d}.{day.month:02d}.{day.year:04d}"
         email = fake.email()
 
         record = Record(first_name)
@@ -33,7 +51,7 @@ def generate_contacts(num_contacts: int = 10) -> Generator[Record, None, None]:
         record.add_birthday(birthday)
         record.add_email(email)
 
-        for _ in range(fake.random_int(min=1, max=2)):
+        for _ in range(random.randint(1, 2)):
             record.add_phone(fake.phone_number())
 
         record.add_address(fake.address().replace("\n", ", "))
@@ -54,7 +72,8 @@ def generate_notes(
     Yields:
         A Note object with fake data.
     """
-    fake = faker.Faker()
+    fake = _get_faker()
+    tag_pool = _get_tag_pool()
     if contact_uuids is None:
         contact_uuids = []
 
@@ -63,9 +82,7 @@ def generate_notes(
         description = fake.paragraph(nb_sentences=3)
 
         num_tags = random.randint(1, 5)
-        tags = [
-            Tag(fake.pystr(min_chars=4, max_chars=10)) for _ in range(num_tags)
-        ]
+        tags = [Tag(tag) for tag in random.sample(tag_pool, num_tags)]
 
         note = Note(title, description, tags)
 
@@ -1,9 +1,15 @@
+import asyncio
 import pytest
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from types import SimpleNamespace
 
+from textual.app import App
+from textual.suggester import SuggestFromList
 
+
+from personal_assistant.models import address_book as address_book_module
 from personal_assistant.models import (
-    Field, Name, Phone, Birthday, Record, AddressBook, Email
+    Field, Name, Phone, Birthday, Record, AddressBook, Note
 )
 from personal_assistant.models.exceptions import (
     InvalidPhoneFormatError, InvalidBirthdayFormatError,
@@ -11,13 +17,127 @@ from personal_assistant.models.exceptions import (
     PhoneNotFoundError, RecordAlreadyExistsError
 )
 from personal_assistant.cli.args_parsers import parse_input, ArgsParser
-from personal_assistant.use_cases.commands import (
-    add_contact, change_contact, show_phone, add_birthday,
-    show_birthday, show_upcoming_birthdays, show_all,
-    add_contact_command, change_contact_command, show_phone_command,
-    add_birthday_command, show_birthday_command, show_upcoming_birthdays_command,
-    get_command
-)
+from personal_assistant.presenters import AddBirthdayPresenter
+from personal_assistant.presenters.presenters_registry import PresentersRegistry
+from personal_assistant.storage import AddressBookStorage, NotesStorage
+from personal_assistant.tui.app import AddressBookApp
+from personal_assistant.tui.screens.add_contact import AddContactScreen
+from personal_assistant.tui.suggester import PrefixSuggester
+
+
+# Fixed "today" for upcoming birthday tests (a Monday), so they do not
+# depend on the day the suite runs or on it crossing midnight
+TODAY = datetime(2024, 1, 1)
+
+# Birthdays falling N days after TODAY
+BIRTHDAYS_IN_DAYS = {
+    days: (TODAY + timedelta(days=days)).strftime("%d.%m.1990") for days in range(15)
+}
+
+
+class FrozenDatetime(datetime):
+    @classmethod
+    def today(cls):
+        return TODAY
+
+
+@pytest.fixture(scope="session")
+def today():
+    """Frozen current date, see TODAY."""
+    return TODAY
+
+
+@pytest.fixture(autouse=True)
+def frozen_today(monkeypatch):
+    """Make AddressBook see TODAY as the current date."""
+    monkeypatch.setattr(address_book_module, "datetime", FrozenDatetime)
+
+
+@pytest.fixture
+def book():
+    """Empty address book."""
+    return AddressBook()
+
+
+@pytest.fixture
+def record():
+    """Record of John without phones or birthday."""
+    return Record("John")
+
+
+class FakeLog:
+    """Log widget collecting written lines."""
+
+    def __init__(self):
+        self.lines = []
+
+    def write(self, content):
+        self.lines.append(str(content))
+
+    def clear(self):
+        self.lines.clear()
+
+    @property
+    def text(self):
+        return "\n".join(self.lines)
+
+
+class FakeApp:
+    """Stand-in for AddressBookApp: logs to FakeLog, records pushed screens
+    and answers every modal screen with screen_result."""
+
+    def __init__(self, screen_result=None):
+        self.log_widget = FakeLog()
+        self.screens = []
+        self.screen_result = screen_result
+        self.workers = []
+
+    async def push_screen(self, screen):
+        self.screens.append(screen)
+
+    async def push_screen_wait(self, screen):
+        self.screens.append(screen)
+        return self.screen_result
+
+    def run_worker(self, work):
+        self.workers.append(work)
+
+
+@pytest.fixture
+def storage(tmp_path):
+    """Empty contacts storage."""
+    return AddressBookStorage(str(tmp_path / "data"), str(tmp_path / "index"))
+
+
+@pytest.fixture
+def book_with_john(storage):
+    """Contacts storage with John added."""
+    john = Record("John")
+    john.add_phone("0501234567")
+    storage.add_record(john)
+    return storage
+
+
+@pytest.fixture
+def notes_storage(tmp_path):
+    """Empty notes storage."""
+    return NotesStorage(str(tmp_path / "data"), str(tmp_path / "index"))
+
+
+@pytest.fixture
+def registry(storage, notes_storage):
+    """Commands working on the storage and notes_storage fixtures."""
+    return PresentersRegistry(storage, notes_storage)
+
+
+def run_command(command, app, args):
+    """Run a presenter and the workers it started, like the app does."""
+    async def _run():
+        await command.execute_tui(app, args)
+        while app.workers:
+            await app.workers.pop(0)
+
+    asyncio.run(_run())
 
 
 class TestField:
@@ -31,6 +151,11 @@ class TestField:
         field = Field("test_value")
         assert str(field) == "test_value"
 
+    def test_field_bool(self):
+        assert Field("test_value")
+        assert not Field("")
+        assert not Field(None)
+
 
 class TestName:
     """Test Name class"""
@@ -47,25 +172,22 @@ class TestName:
 class TestPhone:
     """Test Phone class"""
 
-    def test_valid_phone_creation(self):
-        phone = Phone("1234567890")
-        assert phone.value == "1234567890"
-
-    def test_invalid_phone_too_short(self):
-        with pytest.raises(InvalidPhoneFormatError):
-            Phone("123456789")
-
-    def test_invalid_phone_too_long(self):
-        with pytest.raises(InvalidPhoneFormatError):
-            Phone("12345678901")
-
-    def test_invalid_phone_non_digits(self):
-        with pytest.raises(InvalidPhoneFormatError):
-            Phone("123abc7890")
-
-    def test_phone_str(self):
-        phone = Phone("9876543210")
-        assert str(phone) == "9876543210"
+    @pytest.mark.parametrize("value,expected", [
+        ("0501234567", "+380501234567"),
+        ("380671234567", "+380671234567"),
+        ("+1 234 567 8901", "+12345678901"),
+        ("123456789", None),
+        ("0121234567", None),
+        ("abc", None),
+    ])
+    def test_phone(self, value, expected):
+        if expected is not None:
+            phone = Phone(value)
+            assert phone.value == expected
+            assert str(phone) == expected
+        else:
+            with pytest.raises(InvalidPhoneFormatError):
+                Phone(value)
 
 
 class TestBirthday:
@@ -78,215 +200,250 @@ class TestBirthday:
         assert birthday.value.month == 1
         assert birthday.value.year == 1990
 
-    def test_invalid_birthday_format(self):
+    @pytest.mark.parametrize("value", ["1990-01-01", "01/01/1990", "32.13.1990"])
+    def test_invalid_birthday(self, value):
         with pytest.raises(InvalidBirthdayFormatError):
-            Birthday("1990-01-01")
+            Birthday(value)
 
-    def test_invalid_birthday_format_wrong_order(self):
-        with pytest.raises(InvalidBirthdayFormatError):
-            Birthday("01/01/1990")
+    def test_birthday_formatted(self):
+        assert Birthday("01.01.1990").formatted == "01.01.1990"
+        assert Birthday("1.1.1990").formatted == "01.01.1990"
 
-    def test_invalid_birthday_invalid_date(self):
-        with pytest.raises(InvalidBirthdayFormatError):
-            Birthday("32.13.1990")
+        birthday = Birthday("01.01.1990")
+        birthday.value = datetime(1991, 2, 3)
+        assert birthday.formatted == "03.02.1991"
+        assert str(birthday) == "03.02.1991"
 
 
 class TestRecord:
     """Test Record class"""
 
-    def test_record_creation(self):
-        record = Record("John")
+    def test_record_creation(self, record):
         assert record.first_name.value == "John"
         assert len(record.phones) == 0
         assert record.birthday is None
 
-    def test_add_phone(self):
-        record = Record("John")
-        record.add_phone("1234567890")
+    def test_add_phone(self, record):
+        record.add_phone("+380501234567")
         assert len(record.phones) == 1
-        assert record.phones[0].value == "1234567890"
+        assert record.phones[0].value == "+380501234567"
 
-    def test_add_multiple_phones(self):
-        record = Record("John")
-        record.add_phone("1234567890")
-        record.add_phone("9876543210")
+    def test_add_multiple_phones(self, record):
+        record.add_phone("+380501234567")
+        record.add_phone("+380671234567")
         assert len(record.phones) == 2
 
-    def test_add_duplicate_phone(self):
-        record = Record("John")
-        record.add_phone("1234567890")
+    def test_add_duplicate_phone(self, record):
+        record.add_phone("+380501234567")
         with pytest.raises(PhoneAlreadyExistsError):
-            record.add_phone("1234567890")
+            record.add_phone("+380501234567")
 
-    def test_find_phone_exists(self):
-        record = Record("John")
-        record.add_phone("1234567890")
-        found = record.find_phone("1234567890")
-        assert found == "1234567890"
+    def test_find_phone_exists(self, record):
+        record.add_phone("+380501234567")
+        found = record.find_phone("+380501234567")
+        assert found == "+380501234567"
 
-    def test_find_phone_not_exists(self):
-        record = Record("John")
-        record.add_phone("1234567890")
-        found = record.find_phone("9999999999")
+    def test_find_phone_not_exists(self, record):
+        record.add_phone("+380501234567")
+        found = record.find_phone("+380991234567")
         assert found is None
 
-    def test_edit_phone(self):
-        record = Record("John")
-        record.add_phone("1234567890")
-        record.edit_phone("1234567890", "9876543210")
+    def test_edit_phone(self, record):
+        record.add_phone("+380501234567")
+        record.edit_phone("+380501234567", "+380671234567")
         assert len(record.phones) == 1
-        assert record.phones[0].value == "9876543210"
+        assert record.phones[0].value == "+380671234567"
 
-    def test_edit_phone_not_found(self):
-        record = Record("John")
-        record.add_phone("1234567890")
+    def test_edit_phone_not_found(self, record):
+        record.add_phone("+380501234567")
         with pytest.raises(PhoneNotFoundError):
-            record.edit_phone("9999999999", "1111111111")
+            record.edit_phone("+380991234567", "+380931234567")
 
-    def test_delete_phone(self):
-        record = Record("John")
-        record.add_phone("1234567890")
-        record.delete_phone("1234567890")
+    def test_delete_phone(self, record):
+        record.add_phone("+380501234567")
+        record.delete_phone("+380501234567")
         assert len(record.phones) == 0
 
-    def test_delete_phone_not_found(self):
-        record = Record("John")
-        record.add_phone("1234567890")
+    def test_delete_phone_not_found(self, record):
+        record.add_phone("+380501234567")
         with pytest.raises(PhoneNotFoundError):
-            record.delete_phone("9999999999")
+            record.delete_phone("+380991234567")
 
-    def test_add_birthday(self):
-        record = Record("John")
+    def test_phones_csv(self, record):
+        assert record.phones_csv == ""
+
+        record.add_phone("0501234567")
+        record.add_phone("0671234567")
+        assert record.phones_csv == "+380501234567, +380671234567"
+
+        record.edit_phone("+380501234567", "0631234567")
+        assert record.phones_csv == "+380631234567, +380671234567"
+
+        record.delete_phone("+380671234567")
+        assert record.phones_csv == "+380631234567"
+
+        record.phones = []
+        assert record.phones_csv == ""
+
+    def test_changes_clear_updated_at(self):
+        record = Record.from_dict({
+            "uuid": "1",
+            "first_name": "John",
+            "phones": ["+380501234567"],
+            "updated_at": "2024-01-01T00:00:00",
+        })
+        assert record.updated_at == "2024-01-01T00:00:00"
+
+        record.add_phone("+380671234567")
+        assert record.updated_at is None
+
+    def test_add_birthday(self, record):
         record.add_birthday("01.01.1990")
         assert record.birthday is not None
         assert record.birthday.value.day == 1
         assert record.birthday.value.month == 1
 
-    def test_record_str(self):
-        record = Record("John")
-        record.add_phone("1234567890")
-        record.add_phone("9876543210")
+    def test_record_str(self, record):
+        record.add_phone("+380501234567")
+        record.add_phone("+380671234567")
         result = str(record)
         assert "John" in result
-        assert "1234567890" in result
-        assert "9876543210" in result
+        assert "+380501234567" in result
+        assert "+380671234567" in result
 
 
 class TestAddressBook:
     """Test AddressBook class"""
 
-    def test_address_book_creation(self):
-        book = AddressBook()
+    def test_address_book_creation(self, book):
         assert len(book) == 0
 
-    def test_add_record(self):
-        book = AddressBook()
-        record = Record("John")
+    def test_add_record(self, book, record):
         book.add_record(record)
         assert len(book) == 1
         assert "John" in book
 
-    def test_add_duplicate_record(self):
-        book = AddressBook()
+    def test_add_duplicate_record(self, book):
         record1 = Record("John")
         record2 = Record("John")
         book.add_record(record1)
         with pytest.raises(RecordAlreadyExistsError):
             book.add_record(record2)
 
-    def test_find_record(self):
-        book = AddressBook()
-        record = Record("John")
+    def test_find_record(self, book, record):
         book.add_record(record)
         found = book.find("John")
         assert found.first_name.value == "John"
 
-    def test_find_record_not_found(self):
-        book = AddressBook()
+    def test_find_record_not_found(self, book):
         assert book.find("NonExistent") is None
 
-    def test_delete_record(self):
-        book = AddressBook()
-        record = Record("John")
+    def test_find_ci(self, book):
+        book.add_record(Record("John"))
+        assert book.find_ci("jOHN").first_name.value == "John"
+        assert book.find_ci("Jo") is None
+        book.delete("John")
+        assert book.find_ci("john") is None
+
+    def test_starts_with(self, book):
+        for name in ("Joanna", "john", "Bob"):
+            book.add_record(Record(name))
+        assert [r.first_name.value for r in book.starts_with("JO")] == ["Joanna", "john"]
+        assert book.starts_with("x") == []
+
+    def test_search(self, book):
+        john = Record("John")
+        john.add_phone("0501234567")
+        book.add_record(john)
+        book.add_record(Record("Joanna"))
+        assert [r.first_name.value for r in book.search("JO")] == ["John", "Joanna"]
+        assert [r.first_name.value for r in book.search("1234")] == ["John"]
+        assert book.search("xyz") == []
+        assert book.search("  ") == []
+
+    def test_search_after_record_changed(self, book):
+        ann = Record("Ann")
+        book.add_record(ann)
+        assert book.search("050") == []
+
+        # the record changes in place, without going through the book
+        ann.add_phone("0501234567")
+        assert book.search("050") == [ann]
+        ann.edit_phone("+380501234567", "0671234567")
+        assert book.search("050") == []
+        assert book.search("067") == [ann]
+        ann.last_name = Name("Smith")
+        assert book.search("smith") == [ann]
+        ann.delete_phone("+380671234567")
+        assert book.search("067") == []
+
+    def test_search_after_delete_and_add(self, book):
+        book.add_record(Record("Ann"))
+        assert len(book.search("ann")) == 1
+        book.delete("Ann")
+        assert book.search("ann") == []
+        ann = Record("Ann")
+        ann.add_phone("0501234567")
+        book.add_record(ann)
+        assert book.search("050") == [ann]
+
+    def test_delete_record(self, book, record):
         book.add_record(record)
         book.delete("John")
         assert len(book) == 0
 
-    def test_delete_record_not_found(self):
-        book = AddressBook()
+    def test_delete_record_not_found(self, book):
         with pytest.raises(ContactNotFoundError):
             book.delete("NonExistent")
 
-    def test_getitem(self):
-        book = AddressBook()
-        record = Record("John")
+    def test_getitem(self, book, record):
         book.add_record(record)
         retrieved = book["John"]
         assert retrieved.first_name.value == "John"
 
-    def test_getitem_not_found(self):
-        book = AddressBook()
+    def test_getitem_not_found(self, book):
         with pytest.raises(ContactNotFoundError):
             _ = book["NonExistent"]
 
-    def test_delitem(self):
-        book = AddressBook()
-        record = Record("John")
+    def test_delitem(self, book, record):
         book.add_record(record)
         del book["John"]
         assert len(book) == 0
 
-    def test_get_upcoming_birthdays_empty_book(self):
-        book = AddressBook()
+    def test_get_upcoming_birthdays_empty_book(self, book):
         birthdays = book.get_upcoming_birthdays()
         assert len(birthdays) == 0
 
-    def test_get_upcoming_birthdays_no_birthdays_set(self):
-        book = AddressBook()
-        record = Record("John")
+    def test_get_upcoming_birthdays_no_birthdays_set(self, book, record):
         record.add_phone("1234567890")
         book.add_record(record)
         birthdays = book.get_upcoming_birthdays()
         assert len(birthdays) == 0
 
-    def test_get_upcoming_birthdays_within_range(self):
-        book = AddressBook()
-        record = Record("John")
+    def test_get_upcoming_birthdays_within_range(self, book, record):
         # Set birthday to 3 days from today
-        future_date = datetime.today() + timedelta(days=3)
-        birthday_str = future_date.strftime("%d.%m.1990")
-        record.add_birthday(birthday_str)
+        record.add_birthday(BIRTHDAYS_IN_DAYS[3])
         book.add_record(record)
 
         birthdays = book.get_upcoming_birthdays(warn_in_days=7)
         assert len(birthdays) == 1
         assert birthdays[0][0].first_name.value == "John"
 
-    def test_get_upcoming_birthdays_outside_range(self):
-        book = AddressBook()
-        record = Record("John")
+    def test_get_upcoming_birthdays_outside_range(self, book, record):
         # Set birthday to 10 days from today
-        future_date = datetime.today() + timedelta(days=10)
-        birthday_str = future_date.strftime("%d.%m.1990")
-        record.add_birthday(birthday_str)
+        record.add_birthday(BIRTHDAYS_IN_DAYS[10])
         book.add_record(record)
 
         birthdays = book.get_upcoming_birthdays(warn_in_days=7)
         assert len(birthdays) == 0
 
-    def test_get_upcoming_birthdays_weekend_adjustment(self):
-        book = AddressBook()
-        record = Record("John")
+    def test_get_upcoming_birthdays_weekend_adjustment(self, book, record, today):
 
         # Find next Saturday
-        today = datetime.today()
         days_until_saturday = (5 - today.weekday()) % 7
         if days_until_saturday == 0:
             days_until_saturday = 7
-        saturday = today + timedelta(days=days_until_saturday)
-
-        birthday_str = saturday.strftime("%d.%m.1990")
-        record.add_birthday(birthday_str)
+        record.add_birthday(BIRTHDAYS_IN_DAYS[days_until_saturday])
         book.add_record(record)
 
         birthdays = book.get_upcoming_birthdays(warn_in_days=14)
@@ -319,10 +476,10 @@ class TestArgsParser:
         assert command == "empty"
         assert args == []
 
-    def test_parse_input_exit_variations(self):
-        for exit_cmd in ["exit", "quit", "q", "close", "EXIT", "QUIT"]:
-            command, args = parse_input(exit_cmd)
-            assert command == "exit"
+    @pytest.mark.parametrize("exit_cmd", ["exit", "quit", "q", "close", "EXIT", "QUIT"])
+    def test_parse_input_exit_variations(self, exit_cmd):
+        command, args = parse_input(exit_cmd)
+        assert command == "exit"
 
     def test_args_parser_get_next(self):
         parser = ArgsParser(["arg1", "arg2", "arg3"])
@@ -357,203 +514,339 @@ class TestArgsParser:
 
 
 class TestCommands:
-    """Test command use cases"""
+    """Test command presenters and their dispatch by the app"""
 
-    def test_add_contact(self):
-        book = AddressBook()
-        message = COMMAND_HANDLERS["add-contact"](["John", "1234567890"], book)
-        assert "John" in book
-        assert book["John"].phones[0].value == "1234567890"
-        assert "added" in message.lower()
-
-    def test_add_contact_missing_args(self):
-        book = AddressBook()
-        result = COMMAND_HANDLERS["add-contact"](["John"], book)
-        assert "Invalid arguments" in result or "Error" in result
-
-    def test_change_contact(self):
-        book = AddressBook()
-        COMMAND_HANDLERS["add-contact"](["John", "1234567890"], book)
-        message = COMMAND_HANDLERS["change-contact"](["John", "1234567890", "9876543210"], book)
-        assert book["John"].phones[0].value == "9876543210"
-        assert "updated" in message.lower()
-
-    def test_change_contact_not_found(self):
-        book = AddressBook()
-        result = COMMAND_HANDLERS["change-contact"](["NonExistent", "1234567890", "9876543210"], book)
-        assert "Error" in result or "not found" in result.lower()
-
-    def test_show_phone(self):
-        book = AddressBook()
-        COMMAND_HANDLERS["add-contact"](["John", "1234567890"], book)
-        message = COMMAND_HANDLERS["phone"](["John"], book)
-        assert "1234567890" in message
-
-    def test_add_birthday(self):
-        book = AddressBook()
-        COMMAND_HANDLERS["add-contact"](["John", "1234567890"], book)
-        message = COMMAND_HANDLERS["add-birthday"](["John", "01.01.1990"], book)
-        assert book["John"].birthday is not None
-        assert "Birthday" in message
-
-    def test_show_birthday(self):
-        book = AddressBook()
-        COMMAND_HANDLERS["add-contact"](["John", "1234567890"], book)
-        COMMAND_HANDLERS["add-birthday"](["John", "01.01.1990"], book)
-        message = COMMAND_HANDLERS["show-birthday"](["John"], book)
-        assert "01.01.1990" in message
-
-    def test_show_birthday_not_set(self):
-        book = AddressBook()
-        COMMAND_HANDLERS["add-contact"](["John", "1234567890"], book)
-        message = COMMAND_HANDLERS["show-birthday"](["John"], book)
-        assert "does not have" in message.lower() or "no birthday" in message.lower()
-
-    def test_show_upcoming_birthdays(self):
-        book = AddressBook()
-        record = Record("John")
-        future_date = datetime.today() + timedelta(days=3)
-        birthday_str = future_date.strftime("%d.%m.1990")
-        record.add_birthday(birthday_str)
-        record.add_phone("1234567890")
-        book.add_record(record)
+    def test_add_contact(self, storage, registry):
+        contact = Record("John")
+        contact.add_phone("0501234567")
+        app = FakeApp((True, "Contact 'John' added", contact.to_dict()))
 
-        message = COMMAND_HANDLERS["birthdays"]([], book)
-        assert "John" in message or "No upcoming" in message
+        run_command(registry.get("add-contact"), app, [])
 
-    def test_show_all_empty(self):
-        book = AddressBook()
-        message = COMMAND_HANDLERS["all"]([], book)
-        assert "No contacts" in message or "empty" in message.lower()
+        assert [r.first_name.value for r in storage.search_by_phone("+380501234567")] == ["John"]
+        assert "added" in app.log_widget.text.lower()
 
-    def test_show_all_with_contacts(self):
-        book = AddressBook()
-        COMMAND_HANDLERS["add-contact"](["John", "1234567890"], book)
-        COMMAND_HANDLERS["add-contact"](["Jane", "9876543210"], book)
-        message = COMMAND_HANDLERS["all"]([], book)
-        assert "John" in message
-        assert "Jane" in message
+    def test_add_contact_cancelled(self, storage, registry):
+        app = FakeApp((False, "Operation cancelled"))
 
-    def test_get_command_valid(self):
-        command_func = get_command("add-contact")
-        assert command_func is not None
-        assert callable(command_func)
+        run_command(registry.get("add-contact"), app, [])
 
-    def test_get_command_invalid(self):
-        command_func = get_command("invalid_command")
-        # Should return a null object function that does nothing
-        assert callable(command_func)
-        result = command_func([], AddressBook())
-        assert isinstance(result, str)
-        assert "looked everywhere" in result.lower() or "no such" in result.lower()
+        assert storage.get_all_records() == []
+        assert "cancelled" in app.log_widget.text.lower()
 
+    def test_change_contact(self, book_with_john, registry):
+        john = book_with_john.search_by_first_name("John")[0]
+        changed = Record.from_dict(john.to_dict())
+        changed.edit_phone("+380501234567", "0671234567")
+        app = FakeApp((True, "Contact 'John' updated", changed.to_dict()))
 
-class TestExceptions:
-    """Test custom exceptions"""
+        run_command(registry.get("change-contact"), app, ["John"])
+
+        assert app.screens[0].existing_contact.uuid == john.uuid
+        assert book_with_john.search_by_phone("+380501234567") == []
+        assert [r.uuid for r in book_with_john.search_by_phone("+380671234567")] == [john.uuid]
+        assert "updated" in app.log_widget.text.lower()
+
+    def test_change_contact_not_found(self, registry):
+        app = FakeApp()
+
+        run_command(registry.get("change-contact"), app, ["NonExistent"])
+
+        assert app.screens == []
+        assert "not found" in app.log_widget.text.lower()
+
+    def test_show_phone(self, book_with_john, registry):
+        app = FakeApp()
+
+        run_command(registry.get("phone"), app, ["John"])
+
+        assert "+380501234567" in app.log_widget.text
+
+    def test_add_birthday(self, book_with_john):
+        app = FakeApp()
+
+        run_command(AddBirthdayPresenter(book_with_john), app, ["John", "01.01.1990"])
+
+        assert book_with_john.search_by_first_name("John")[0].birthday.formatted == "01.01.1990"
+        assert "Birthday" in app.log_widget.text
+
+    def test_show_birthday(self, book_with_john, registry):
+        run_command(AddBirthdayPresenter(book_with_john), FakeApp(), ["John", "01.01.1990"])
+        app = FakeApp()
+
+        run_command(registry.get("show-birthday"), app, ["John"])
+
+        assert "01.01.1990" in app.log_widget.text
+
+    def test_show_birthday_not_set(self, book_with_john, registry):
+        app = FakeApp()
+
+        run_command(registry.get("show-birthday"), app, ["John"])
+
+        assert "no birthday" in app.log_widget.text.lower()
+
+    def test_show_upcoming_birthdays(self, storage, registry, record):
+        # the storage looks at the real current date; a weekend shift keeps it within 7 days
+        record.add_birthday((date.today() + timedelta(days=3)).strftime("%d.%m.2000"))
+        storage.add_record(record)
+        app = FakeApp()
+
+        run_command(registry.get("birthdays"), app, [])
+
+        (screen,) = app.screens
+        assert [name for name, _, _ in screen.upcoming_birthdays()] == ["John"]
+
+    def test_show_all_empty(self, registry):
+        app = FakeApp()
+
+        run_command(registry.get("all"), app, [])
+
+        assert app.screens[0].contacts == []
+
+    def test_show_all_with_contacts(self, book_with_john, registry):
+        jane = Record("Jane")
+        jane.add_phone("0671234567")
+        book_with_john.add_record(jane)
+        app = FakeApp()
+
+        run_command(registry.get("all"), app, [])
+
+        assert {r.first_name.value for r in app.screens[0].contacts} == {"John", "Jane"}
+
+    def test_delete_contact(self, book_with_john, registry):
+        app = FakeApp(True)
+
+        run_command(registry.get("delete-contact"), app, ["John"])
+
+        assert book_with_john.get_all_records() == []
+        assert "deleted" in app.log_widget.text.lower()
+
+    def test_search_notes_by_date(self, notes_storage, registry):
+        notes_storage.add_note(Note("Shopping list", "Milk and bread"))
+        today = date.today().strftime("%d.%m.%Y")
+
+        app = FakeApp()
+        run_command(registry.get("search-date"), app, [today])
+        assert "Found 1 note(s)" in app.log_widget.text
+        assert "Shopping list" in app.log_widget.text
+
+        # the range may be given in any order
+        app = FakeApp()
+        run_command(registry.get("search-date"), app, [today, "01.01.2000"])
+        assert "Shopping list" in app.log_widget.text
 
-    def test_invalid_phone_format_error(self):
-        with pytest.raises(InvalidPhoneFormatError) as exc_info:
-            raise InvalidPhoneFormatError("123")
-        assert "123" in str(exc_info.value)
-        assert "10 digits" in str(exc_info.value)
+        app = FakeApp()
+        run_command(registry.get("search-date"), app, ["01.01.2000", "31.12.2000"])
+        assert "No notes created in 01.01.2000 - 31.12.2000" in app.log_widget.text
 
-    def test_invalid_birthday_format_error(self):
-        with pytest.raises(InvalidBirthdayFormatError) as exc_info:
-            raise InvalidBirthdayFormatError("01/01/1990")
-        assert "01/01/1990" in str(exc_info.value)
-        assert "DD.MM.YYYY" in str(exc_info.value)
+    def test_search_notes_by_date_invalid(self, registry):
+        app = FakeApp()
 
-    def test_contact_not_found_error(self):
-        with pytest.raises(ContactNotFoundError) as exc_info:
-            raise ContactNotFoundError("Contact 'John' not found")
-        assert "John" in str(exc_info.value)
+        run_command(registry.get("search-date"), app, ["2024-01-01"])
 
-    def test_phone_not_found_error(self):
-        with pytest.raises(PhoneNotFoundError) as exc_info:
-            raise PhoneNotFoundError("Phone not found")
-        assert "Phone" in str(exc_info.value)
+        assert "Invalid date format" in app.log_widget.text
 
-    def test_phone_already_exists_error(self):
-        with pytest.raises(PhoneAlreadyExistsError) as exc_info:
-            raise PhoneAlreadyExistsError("Phone already exists")
-        assert "already exists" in str(exc_info.value)
+    def test_get_command(self, registry):
+        assert registry.get("add-contact").name == "add-contact"
+        assert registry.get("invalid_command") is None
 
-    def test_record_already_exists_error(self):
-        with pytest.raises(RecordAlreadyExistsError) as exc_info:
-            raise RecordAlreadyExistsError("Record already exists")
-        assert "already exists" in str(exc_info.value)
+    @pytest.fixture
+    def app(self, registry):
+        """AddressBookApp that is not running, with fake widgets."""
+        app = AddressBookApp()
+        app.command_registry = registry
+        app.log_widget = FakeLog()
+        app.input_widget = SimpleNamespace(value="")
+        return app
+
+    @staticmethod
+    def submit(app, user_input):
+        asyncio.run(app.on_input_submitted(SimpleNamespace(value=user_input)))
+
+    @pytest.mark.parametrize("command_id", ["phone", "show-birthday", "search", "search-date", "change-contact", "delete-contact"])
+    def test_missing_args_show_usage(self, app, registry, command_id):
+        command = registry.get(command_id)
+        assert command.min_args == 1
+
+        self.submit(app, command_id)
+
+        assert app.log_widget.lines == [f"> {command_id}", f"[bold red]{command.usage}[/bold red]"]
+
+    def test_enough_args_run_command(self, app, book_with_john):
+        self.submit(app, "phone John")
+
+        assert "+380501234567" in app.log_widget.text
+
+    def test_unknown_command_shows_help(self, app):
+        self.submit(app, "invalid_command")
+
+        assert "no such 'invalid_command'" in app.log_widget.text.lower()
+        assert "add-contact" in app.log_widget.text
+
+
+class TestAddContactScreen:
+    """Test validation done by the contact form before it is closed"""
+
+    @staticmethod
+    def submit_form(birthday):
+        """Fill in the form with John and the birthday, submit it and return (results, error text)."""
+        class FormApp(App):
+            def __init__(self):
+                super().__init__()
+                self.results = []
+
+            def on_mount(self):
+                self.push_screen(AddContactScreen(), self.results.append)
+
+        async def _run():
+            app = FormApp()
+            async with app.run_test() as pilot:
+                screen = app.screen
+                screen.name_input.value = "John"
+                screen.phone1_input.value = "0501234567"
+                screen.birthday_input.value = birthday
+                screen.query_one("#submit-form").press()
+                await pilot.pause()
+                error = str(screen.error_widget.render()) if screen.error_widget.display else ""
+                return app.results, error
+
+        return asyncio.run(_run())
+
+    @pytest.mark.parametrize("birthday", ["01.01.1990", "1.1.1990", ""])
+    def test_valid_birthday(self, birthday):
+        results, error = self.submit_form(birthday)
+        assert error == ""
+        (result,) = results
+        assert result[0] is True
+        assert result[2]["birthday"] == (birthday or None)
+
+    @pytest.mark.parametrize("birthday,expected", [
+        ("31.02.1990", "Invalid date format"),
+        ("99.99.2000", "Invalid date format"),
+        ("1990-01-01", "Invalid date format"),
+        ((datetime.now() + timedelta(days=1)).strftime("%d.%m.%Y"), "cannot be in the future"),
+    ])
+    def test_invalid_birthday(self, birthday, expected):
+        results, error = self.submit_form(birthday)
+        assert results == []
+        assert expected in error
+
+
+class TestPrefixSuggester:
+    """Test command completion of the input"""
+
+    @staticmethod
+    def suggest(suggester, values):
+        async def _run():
+            # Suggester casefolds the input before get_suggestion unless it is case sensitive
+            if not suggester.case_sensitive:
+                return [await suggester.get_suggestion(value.casefold()) for value in values]
+            return [await suggester.get_suggestion(value) for value in values]
+
+        return asyncio.run(_run())
+
+    def test_same_suggestions_as_suggest_from_list(self):
+        commands = AddressBookApp.INPUT_SUGGESTIONS
+        values = sorted({command[:end] for command in commands for end in range(len(command) + 1)})
+        values += ["SEARCH-T", "Del", "x", "alll", "search-tags"]
+
+        assert self.suggest(PrefixSuggester(commands, case_sensitive=False), values) == self.suggest(
+            SuggestFromList(commands, case_sensitive=False), values
+        )
+
+    def test_first_option_wins_shared_prefix(self):
+        suggester = PrefixSuggester(["search", "search-phone", "Search-Tag"], case_sensitive=False)
+
+        assert self.suggest(suggester, ["sea", "search-", "search-t", "nothing"]) == [
+            "search", "search-phone", "Search-Tag", None,
+        ]
+
+    def test_case_sensitive(self):
+        suggester = PrefixSuggester(["Hello"], case_sensitive=True)
+
+        assert self.suggest(suggester, ["He", "he"]) == ["Hello", None]
+
+
+class TestExceptions:
+    """Test custom exceptions"""
+
+    @pytest.mark.parametrize("exc,message,expected", [
+        (InvalidPhoneFormatError, "Invalid phone number: 123", ["123"]),
+        (InvalidBirthdayFormatError, "01/01/1990", ["01/01/1990", "DD.MM.YYYY"]),
+        (ContactNotFoundError, "Contact 'John' not found", ["John"]),
+        (PhoneNotFoundError, "Phone not found", ["Phone"]),
+        (PhoneAlreadyExistsError, "Phone already exists", ["already exists"]),
+        (RecordAlreadyExistsError, "Record already exists", ["already exists"]),
+    ])
+    def test_exception_message(self, exc, message, expected):
+        with pytest.raises(exc) as exc_info:
+            raise exc(message)
+        for text in expected:
+            assert text in str(exc_info.value)
 
 
 class TestIntegration:
     """Integration tests for complete workflows"""
 
-    def test_full_contact_lifecycle(self):
-        book = AddressBook()
+    def test_full_contact_lifecycle(self, book):
 
         # Add contact
-        COMMAND_HANDLERS["add-contact"](["John", "1234567890"], book)
+        record = Record("John")
+        record.add_phone("+380501234567")
+        book.add_record(record)
         assert "John" in book
 
         # Add birthday
-        COMMAND_HANDLERS["add-birthday"](["John", "01.01.1990"], book)
+        book["John"].add_birthday("01.01.1990")
         assert book["John"].birthday is not None
 
         # Change phone
-        COMMAND_HANDLERS["change-contact"](["John", "1234567890", "9876543210"], book)
-        assert book["John"].phones[0].value == "9876543210"
+        book["John"].edit_phone("+380501234567", "+380671234567")
+        assert book["John"].phones[0].value == "+380671234567"
 
-        # Show phone
-        message = COMMAND_HANDLERS["phone"](["John"], book)
-        assert "9876543210" in message
+        # Find phone
+        assert book["John"].find_phone("+380671234567") == "+380671234567"
 
         # Delete contact
         book.delete("John")
         assert "John" not in book
 
-    def test_multiple_contacts_with_birthdays(self):
-        book = AddressBook()
+    def test_multiple_contacts_with_birthdays(self, book):
 
         # Add multiple contacts
-        today = datetime.today()
         for i in range(5):
             name = f"Contact{i}"
             phone = f"123456789{i}"
-            future_date = today + timedelta(days=i)
-            birthday_str = future_date.strftime("%d.%m.1990")
 
             record = Record(name)
             record.add_phone(phone)
-            record.add_birthday(birthday_str)
+            record.add_birthday(BIRTHDAYS_IN_DAYS[i])
             book.add_record(record)
 
         assert len(book) == 5
 
         # Check upcoming birthdays
         birthdays = book.get_upcoming_birthdays(warn_in_days=7)
-        assert len(birthdays) >= 0
+        assert len(birthdays) == 5
 
         # Show all
-        message = COMMAND_HANDLERS["all"]([], book)
-        assert "Contact0" in message
+        assert "Contact0" in str(book)
 
-    def test_error_handling_workflow(self):
-        book = AddressBook()
+    def test_error_handling_workflow(self, book):
 
         # Try to change non-existent contact
-        result = COMMAND_HANDLERS["change-contact"](["NonExistent", "1234567890", "9876543210"], book)
-        assert "Error" in result or "not found" in result.lower()
+        with pytest.raises(ContactNotFoundError):
+            _ = book["NonExistent"]
 
-        # Add contact with invalid phone - should be caught by the command handler
-        result = COMMAND_HANDLERS["add-contact"](["John", "123"], book)
-        assert "Error" in result or "Invalid" in result
+        # Add contact with invalid phone
+        record = Record("John")
+        with pytest.raises(InvalidPhoneFormatError):
+            record.add_phone("123")
 
         # Add contact with valid phone
-        COMMAND_HANDLERS["add-contact"](["John", "1234567890"], book)
+        record.add_phone("+380501234567")
+        book.add_record(record)
 
         # Try to add duplicate phone
         with pytest.raises(PhoneAlreadyExistsError):
-            book["John"].add_phone("1234567890")
-
-
-
-
+            book["John"].add_phone("+380501234567")
@@ -0,0 +1,479 @@
+import json
+import os
+import time
+from datetime import date, datetime
+
+import pytest
+
+from personal_assistant.config import AppConfig
+from personal_assistant.models import Name, Note, Record, Tag
+from personal_assistant.storage import (
+    AddressBookStorage, HeapStorage, IndexManager, NotesStorage, WriteBackHeapStorage,
+)
+from personal_assistant.storage import address_book, heap_storage, sqlite_heap_storage
+from personal_assistant.storage.constants import (
+    INDEX_CONTACT_FIRST_NAME, INDEX_CONTACT_PHONE, INDEX_NOTE_CREATION_DATE,
+)
+from personal_assistant.storage.index_manager import DATE_AGGREGATE_FILE, INDEX_FORMAT_VERSION
+from personal_assistant.storage.mmap_hash_bucket import MmapHashBucket
+from personal_assistant.storage.mmap_trie_bucket import MmapTrieBucket
+
+
+def make_record(first_name, phone, last_name=None):
+    record = Record(first_name)
+    if last_name:
+        record.last_name = Name(last_name)
+    record.add_phone(phone)
+    return record
+
+
+def freeze_now(monkeypatch, moment):
+    """Make records created from now on get moment as their created_at."""
+    class FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return moment
+
+    for module in (heap_storage, sqlite_heap_storage):
+        monkeypatch.setattr(module, "datetime", FrozenDatetime)
+
+
+def freeze_today(monkeypatch, day):
+    """Make AddressBookStorage see day as the current date, until today_value of the returned class is changed."""
+    class FrozenDate(date):
+        today_value = day
+
+        @classmethod
+        def today(cls):
+            return cls.today_value
+
+    monkeypatch.setattr(address_book, "date", FrozenDate)
+    return FrozenDate
+
+
+def close(storage):
+    """Close heap backends that hold a connection or a background thread."""
+    close_heap = getattr(storage.heap, "close", None)
+    if close_heap:
+        close_heap()
+
+
+@pytest.fixture(params=["json", "writeback", "sqlite"])
+def backend(request, monkeypatch):
+    """Heap backend used by storages opened in the test."""
+    monkeypatch.setattr(AppConfig, "HEAP_BACKEND", request.param)
+    return request.param
+
+
+@pytest.fixture
+def open_storage(tmp_path):
+    """Open storages of a class on the same data and index directories, closed after the test."""
+    opened = []
+
+    def _open(storage_class):
+        storage = storage_class(str(tmp_path / "data"), str(tmp_path / "index"))
+        opened.append(storage)
+        return storage
+
+    yield _open
+    for storage in opened:
+        close(storage)
+
+
+@pytest.fixture
+def index_manager(tmp_path):
+    """Empty index manager."""
+    return IndexManager(str(tmp_path / "index"))
+
+
+class TestAddressBookStorage:
+    """Test AddressBookStorage CRUD and search on every heap backend"""
+
+    def test_add_update_delete_search_reopen(self, backend, open_storage):
+        storage = open_storage(AddressBookStorage)
+        storage.add_record(make_record("John", "0501234567", "Smith"))
+        storage.add_record(make_record("Joanna", "0671234567"))
+
+        john = storage.search_by_phone("+380501234567")[0]
+        assert john.first_name.value == "John"
+        assert {r.first_name.value for r in storage.search_by_first_name("jo")} == {"John", "Joanna"}
+        assert [r.first_name.value for r in storage.search_by_name("n smi")] == ["John"]
+
+        john.first_name = Name("Mike")
+        john.edit_phone("+380501234567", "0931234567")
+        assert storage.update_record(john)
+
+        joanna = storage.search_by_phone("+380671234567")[0]
+        assert storage.delete_record(joanna.uuid)
+
+        close(storage)
+        storage = open_storage(AddressBookStorage)
+
+        assert [r.first_name.value for r in storage.search_by_first_name("mi")] == ["Mike"]
+        assert storage.search_by_first_name("jo") == []
+        assert storage.search_by_phone("+380501234567") == []
+        assert [r.first_name.value for r in storage.search_by_phone("+380931234567")] == ["Mike"]
+        assert storage.search_by_phone("+380671234567") == []
+        assert len(storage.get_all_records()) == 1
+
+    def test_add_records_bulk(self, backend, open_storage):
+        storage = open_storage(AddressBookStorage)
+        uuids = storage.add_records_bulk(
+            [make_record(f"Contact{i}", f"050123456{i}") for i in range(5)]
+        )
+
+        assert len(uuids) == 5
+        assert all(uuids)
+        assert [r.uuid for r in storage.search_by_phone("+380501234563")] == [uuids[3]]
+        assert len(storage.search_by_first_name("contact")) == 5
+
+    def test_upcoming_birthdays_cached_per_day(self, open_storage, monkeypatch):
+        frozen_date = freeze_today(monkeypatch, date(2024, 1, 1))  # a Monday
+        storage = open_storage(AddressBookStorage)
+        john = make_record("John", "0501234567")
+        john.add_birthday("03.01.1990")
+        storage.add_record(john)
+
+        scans = []
+        find_upcoming_birthdays = storage._find_upcoming_birthdays
+
+        def counted_find(*args):
+            scans.append(args)
+            return find_upcoming_birthdays(*args)
+
+        monkeypatch.setattr(storage, "_find_upcoming_birthdays", counted_find)
+
+        assert storage.get_upcoming_birthdays(7) == [("John", "03.01.2024", 2)]
+        assert storage.get_upcoming_birthdays(7) == [("John", "03.01.2024", 2)]
+        assert len(scans) == 1
+
+        # a write drops the cached results
+        jane = make_record("Jane", "0671234567")
+        jane.add_birthday("05.01.1990")
+        storage.add_record(jane)
+        assert storage.get_upcoming_birthdays(7) == [("John", "03.01.2024", 2), ("Jane", "05.01.2024", 4)]
+        assert len(scans) == 2
+
+        # so does the next day
+        frozen_date.today_value = date(2024, 1, 4)
+        assert storage.get_upcoming_birthdays(7) == [("Jane", "05.01.2024", 1)]
+        assert len(scans) == 3
+
+    def test_upcoming_birthdays_not_cached_when_written_during_scan(self, open_storage, monkeypatch):
+        freeze_today(monkeypatch, date(2024, 1, 1))
+        storage = open_storage(AddressBookStorage)
+        john = make_record("John", "0501234567")
+        john.add_birthday("03.01.1990")
+        storage.add_record(john)
+
+        find_upcoming_birthdays = storage._find_upcoming_birthdays
+
+        def find_while_jane_is_added(*args):
+            # the scan runs in a worker thread while the UI adds a contact
+            upcoming = find_upcoming_birthdays(*args)
+            jane = make_record("Jane", "0671234567")
+            jane.add_birthday("05.01.1990")
+            storage.add_record(jane)
+            monkeypatch.setattr(storage, "_find_upcoming_birthdays", find_upcoming_birthdays)
+            return upcoming
+
+        monkeypatch.setattr(storage, "_find_upcoming_birthdays", find_while_jane_is_added)
+
+        # the stale result is returned once, but not cached
+        assert storage.get_upcoming_birthdays(7) == [("John", "03.01.2024", 2)]
+        assert storage.get_upcoming_birthdays(7) == [("John", "03.01.2024", 2), ("Jane", "05.01.2024", 4)]
+
+
+class TestNotesStorage:
+    """Test NotesStorage CRUD and search on every heap backend"""
+
+    def test_add_update_delete_search_reopen(self, backend, open_storage):
+        storage = open_storage(NotesStorage)
+        storage.add_note(Note("Shopping list", "Milk and bread", [Tag("home")]))
+        uuid = storage.add_note(Note("Meeting notes", "Discuss the roadmap", [Tag("work")]))
+
+        assert [n.title.value for n in storage.search_by_tag("work")] == ["Meeting notes"]
+        assert [n.title.value for n in storage.search_by_content("ROADMAP")] == ["Meeting notes"]
+
+        note = storage.search_by_title("meet")[0]
+        note.update_description("Discuss the budget")
+        note.remove_tag("work")
+        note.add_tag("finance")
+        assert storage.update_record(note)
+
+        assert storage.delete_note(storage.search_by_title("shop")[0].uuid)
+
+        close(storage)
+        storage = open_storage(NotesStorage)
+
+        assert storage.search_by_title("shop") == []
+        assert storage.search_by_tag("work") == []
+        assert [n.uuid for n in storage.search_by_tag("finance")] == [uuid]
+        assert storage.search_by_content("roadmap") == []
+        assert [n.uuid for n in storage.search_by_content("budget")] == [uuid]
+
+    def test_add_notes_bulk(self, backend, open_storage):
+        storage = open_storage(NotesStorage)
+        uuids = storage.add_notes_bulk([Note(f"Generated note {i}", f"text {i}", [Tag("bulk")]) for i in range(5)])
+
+        assert len(uuids) == 5
+        assert {n.uuid for n in storage.search_by_tag("bulk")} == set(uuids)
+        assert [n.uuid for n in storage.search_by_content("text 3")] == [uuids[3]]
+
+
+    def test_search_by_date_reads_month_aggregates(self, backend, open_storage, monkeypatch):
+        storage = open_storage(NotesStorage)
+        uuids = {}
+        for created in (date(2023, 2, 1), date(2024, 1, 31), date(2024, 2, 1)):
+            freeze_now(monkeypatch, datetime(created.year, created.month, created.day, 12))
+            uuids[created] = storage.add_note(Note(f"Note {created}", "text"))
+        freeze_now(monkeypatch, datetime(2024, 2, 15, 12))
+        (uuids[date(2024, 2, 15)],) = storage.add_notes_bulk([Note("Bulk note", "text")])
+
+        # every month of the year and the month itself are answered by the month aggregates
+        aggregate = storage.index_manager.index_root / INDEX_NOTE_CREATION_DATE / "2024" / "02" / DATE_AGGREGATE_FILE
+        assert set(json.loads(aggregate.read_text(encoding="utf-8"))["uuids"]) == {
+            uuids[date(2024, 2, 1)], uuids[date(2024, 2, 15)],
+        }
+        assert {n.uuid for n in storage.search_by_date(2024)} == {
+            uuids[date(2024, 1, 31)], uuids[date(2024, 2, 1)], uuids[date(2024, 2, 15)],
+        }
+        assert {n.uuid for n in storage.search_by_date(2024, 2)} == {uuids[date(2024, 2, 1)], uuids[date(2024, 2, 15)]}
+        assert [n.uuid for n in storage.search_by_date(2024, 2, 15)] == [uuids[date(2024, 2, 15)]]
+        assert [n.uuid for n in storage.search_by_date(2023)] == [uuids[date(2023, 2, 1)]]
+        assert storage.search_by_date(2024, 3) == []
+
+        # a deleted note leaves its day and month
+        storage.delete_note(uuids[date(2024, 2, 15)])
+        assert [n.uuid for n in storage.search_by_date(2024, 2)] == [uuids[date(2024, 2, 1)]]
+        assert storage.search_by_date(2024, 2, 15) == []
+
+    def test_search_by_date_range(self, backend, open_storage, monkeypatch):
+        storage = open_storage(NotesStorage)
+        uuids = {}
+        for created in (date(2024, 1, 31), date(2024, 2, 1), date(2024, 2, 15), date(2024, 3, 1), date(2024, 4, 2)):
+            freeze_now(monkeypatch, datetime(created.year, created.month, created.day, 12))
+            uuids[created] = storage.add_note(Note(f"Note {created}", "text"))
+
+        def found(start, end):
+            return [n.uuid for n in storage.search_by_date_range(start, end)]
+
+        # edge months day by day, February and March whole from their aggregates
+        assert found(date(2024, 1, 31), date(2024, 4, 1)) == [
+            uuids[date(2024, 1, 31)], uuids[date(2024, 2, 1)], uuids[date(2024, 2, 15)], uuids[date(2024, 3, 1)],
+        ]
+        assert found(date(2024, 2, 2), date(2024, 2, 29)) == [uuids[date(2024, 2, 15)]]
+        assert found(date(2024, 4, 2), date(2024, 4, 2)) == [uuids[date(2024, 4, 2)]]
+        assert found(date(2023, 1, 1), date(2023, 12, 31)) == []
+
+        # a cached result is dropped once notes change
+        storage.delete_note(uuids[date(2024, 2, 15)])
+        assert found(date(2024, 2, 2), date(2024, 2, 29)) == []
+
+    def test_get_notes_by_contact(self, backend, open_storage):
+        storage = open_storage(NotesStorage)
+        shared = Note("Shared note", "About both")
+        shared.contact_ids = {"contact-1", "contact-2"}
+        own = Note("Own note", "About one")
+        own.contact_ids = {"contact-1"}
+        shared_uuid = storage.add_note(shared)
+        own_uuid = storage.add_note(own)
+        storage.add_note(Note("Unlinked note", "About nobody"))
+
+        assert {n.uuid for n in storage.get_notes_by_contact("contact-1")} == {shared_uuid, own_uuid}
+        assert [n.uuid for n in storage.get_notes_by_contact("contact-2")] == [shared_uuid]
+        assert storage.get_notes_by_contact("contact-3") == []
+
+        # unlinking a contact and deleting a note update the contact index
+        (note,) = storage.search_by_title("shared")
+        note.contact_ids.discard("contact-2")
+        assert storage.update_record(note)
+        assert storage.get_notes_by_contact("contact-2") == []
+
+        assert storage.delete_note(own_uuid)
+        close(storage)
+        storage = open_storage(NotesStorage)
+        assert [n.uuid for n in storage.get_notes_by_contact("contact-1")] == [shared_uuid]
+
+    def test_search_cache_is_dropped_on_writes(self, open_storage):
+        storage = open_storage(NotesStorage)
+        uuid = storage.add_note(Note("Meeting notes", "Discuss the roadmap", [Tag("work")]))
+        assert [n.uuid for n in storage.search_by_title("meet")] == [uuid]
+
+        # cached results hand out fresh notes, changing one doesn't change the cache
+        storage.search_by_title("meet")[0].update_title("Changed")
+        assert [n.title.value for n in storage.search_by_title("meet")] == ["Meeting notes"]
+
+        second_uuid = storage.add_note(Note("Meetup", "Python meetup", [Tag("work")]))
+        assert {n.uuid for n in storage.search_by_title("meet")} == {uuid, second_uuid}
+        assert {n.uuid for n in storage.search_by_tag("work")} == {uuid, second_uuid}
+
+        (bulk_uuid,) = storage.add_notes_bulk([Note("Meeting room", "Book it", [Tag("work")])])
+        assert {n.uuid for n in storage.search_by_tag("work")} == {uuid, second_uuid, bulk_uuid}
+
+        (note,) = storage.search_by_title("meetup")
+        note.remove_tag("work")
+        assert storage.update_record(note)
+        assert {n.uuid for n in storage.search_by_tag("work")} == {uuid, bulk_uuid}
+
+        assert storage.delete_note(uuid)
+        assert {n.uuid for n in storage.search_by_title("meet")} == {second_uuid, bulk_uuid}
+
+
+class TestIndexSync:
+    """Test manifest, heap fingerprint and format version checks done on startup"""
+
+    def test_reindex_record_changed_by_another_process(self, open_storage):
+        storage = open_storage(AddressBookStorage)
+        storage.add_record(make_record("John", "0501234567"))
+        john_uuid = storage.search_by_phone("+380501234567")[0].uuid
+        storage.rebuild_indexes(force=True)
+
+        file_path = os.path.join(storage.heap.data_root, "contacts", f"{john_uuid}.json")
+        with open(file_path, encoding="utf-8") as f:
+            data = json.load(f)
+        data["first_name"] = "Mike"
+        with open(file_path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(file_path + ".tmp", file_path)
+
+        storage = open_storage(AddressBookStorage)
+
+        assert storage.search_by_first_name("jo") == []
+        assert [r.uuid for r in storage.search_by_first_name("mi")] == [john_uuid]
+
+    def test_manifest_keeps_index_entries_only(self, open_storage):
+        storage = open_storage(AddressBookStorage)
+        storage.add_record(make_record("John", "0501234567"))
+        storage.rebuild_indexes(force=True)
+
+        manifest = storage.index_manager.load_manifest("contacts")
+        (entry,) = manifest.values()
+        assert set(entry) == {"mtime_ns", "entries"}
+        assert ["hash", INDEX_CONTACT_PHONE, "+380501234567"] in entry["entries"]
+
+    def test_migrate_outdated_format_version(self, open_storage):
+        storage = open_storage(AddressBookStorage)
+        storage.add_record(make_record("John", "0501234567"))
+
+        # indexes of an older version, with a stale entry a rebuild must drop
+        index_manager = storage.index_manager
+        index_manager.add_to_trie_index(INDEX_CONTACT_FIRST_NAME, "Ghost", "missing-uuid")
+        with open(index_manager.index_root / "contacts" / "format_version.json", "w") as f:
+            json.dump({"version": INDEX_FORMAT_VERSION - 1}, f)
+
+        storage = open_storage(AddressBookStorage)
+
+        assert storage.index_manager.load_format_version("contacts") == INDEX_FORMAT_VERSION
+        assert storage.index_manager.search_by_prefix(INDEX_CONTACT_FIRST_NAME, "gh") == {}
+        assert [r.first_name.value for r in storage.search_by_first_name("jo")] == ["John"]
+
+
+class TestIndexManager:
+    """Test mutation log, compaction and packed bucket copies"""
+
+    def test_search_after_compaction(self, index_manager):
+        for i in range(50):
+            index_manager.add_to_hash_index(INDEX_CONTACT_PHONE, "+380501234567", f"uuid{i}")
+        for i in range(0, 50, 2):
+            index_manager.remove_from_hash_index(INDEX_CONTACT_PHONE, "+380501234567", f"uuid{i}")
+
+        file_path, _ = index_manager._get_hash_path(INDEX_CONTACT_PHONE, "+380501234567")
+        with open(file_path, encoding="utf-8") as f:
+            snapshot = json.load(f)
+        log_path = index_manager._get_log_path(file_path)
+        log_lines = log_path.read_text(encoding="utf-8").splitlines() if log_path.exists() else []
+
+        # most operations were merged into the file, the log only holds the latest ones
+        assert len(log_lines) < 75
+        assert sum(map(len, snapshot.values())) > 0
+
+        expected = {f"uuid{i}" for i in range(1, 50, 2)}
+        assert set(index_manager.search_by_exact_match(INDEX_CONTACT_PHONE, "+380501234567")) == expected
+        assert set(IndexManager(str(index_manager.index_root)).search_by_exact_match(
+            INDEX_CONTACT_PHONE, "+380501234567")) == expected
+
+    def test_replay_ignores_torn_log_line(self, index_manager):
+        index_manager.add_to_hash_index(INDEX_CONTACT_PHONE, "+380501234567", "uuid1")
+        index_manager.add_to_hash_index(INDEX_CONTACT_PHONE, "+380501234567", "uuid2")
+
+        file_path, _ = index_manager._get_hash_path(INDEX_CONTACT_PHONE, "+380501234567")
+        with open(index_manager._get_log_path(file_path), "ab") as f:
+            f.write(b'["+","')
+
+        assert index_manager.search_by_exact_match(INDEX_CONTACT_PHONE, "+380501234567") == ["uuid1", "uuid2"]
+
+    def test_hash_search_through_packed_copy(self, index_manager):
+        index_manager.add_to_hash_index(INDEX_CONTACT_PHONE, "+380501234567", "uuid1")
+        file_path, full_hash = index_manager._get_hash_path(INDEX_CONTACT_PHONE, "+380501234567")
+
+        # the first search builds the packed copy, the next ones are answered by it
+        assert index_manager.search_by_exact_match(INDEX_CONTACT_PHONE, "+380501234567") == ["uuid1"]
+        bucket = MmapHashBucket(file_path)
+        assert bucket.packed_path.exists()
+        assert bucket.lookup(full_hash, bucket.source_version()) == ["uuid1"]
+        assert bucket.lookup("00" * 8, bucket.source_version()) == []
+
+        # a change of the bucket makes the packed copy stale
+        index_manager.add_to_hash_index(INDEX_CONTACT_PHONE, "+380501234567", "uuid2")
+        assert bucket.lookup(full_hash, bucket.source_version()) is None
+        assert index_manager.search_by_exact_match(INDEX_CONTACT_PHONE, "+380501234567") == ["uuid1", "uuid2"]
+        assert bucket.lookup(full_hash, bucket.source_version()) == ["uuid1", "uuid2"]
+
+    def test_bloom_filter_has_no_false_negatives(self, tmp_path):
+        bucket = MmapHashBucket(tmp_path / "bucket.json")
+        index_data = {f"{i:016x}": [f"uuid{i}"] for i in range(0, 5000, 7)}
+        version = (1, 2, 3)
+        bucket.build(index_data, version)
+
+        for full_hash, uuids in index_data.items():
+            assert bucket.lookup(full_hash, version) == uuids
+        missing = [f"{i:016x}" for i in range(1, 5000, 7)]
+        assert all(bucket.lookup(full_hash, version) == [] for full_hash in missing)
+
+    def test_trie_search_through_packed_copy(self, index_manager):
+        for name, uuid in [("John", "uuid1"), ("Joanna", "uuid2"), ("Jo", "uuid3"), ("Jack", "uuid4")]:
+            index_manager.add_to_trie_index(INDEX_CONTACT_FIRST_NAME, name, uuid)
+
+        assert index_manager.search_by_prefix(INDEX_CONTACT_FIRST_NAME, "joh") == {"john": ["uuid1"]}
+
+        file_path = index_manager._get_trie_path(INDEX_CONTACT_FIRST_NAME, "jo")
+        bucket = MmapTrieBucket(file_path)
+        assert bucket.packed_path.exists()
+        assert bucket.lookup_prefix("jo", bucket.source_version()) == [
+            ("jo", ["uuid3"]), ("joanna", ["uuid2"]), ("john", ["uuid1"]),
+        ]
+        assert bucket.lookup_prefix("jox", bucket.source_version()) == []
+        assert set(index_manager.iter_uuids_by_prefix(INDEX_CONTACT_FIRST_NAME, "j")) == {
+            "uuid1", "uuid2", "uuid3", "uuid4",
+        }
+
+
+class TestWriteBackHeapStorage:
+    """Test coalescing of background writes"""
+
+    def test_flush_on_max_pending(self, tmp_path):
+        heap = WriteBackHeapStorage(str(tmp_path / "data"), flush_interval=60, max_pending=3)
+        try:
+            uuids = [heap.create_contact({"first_name": f"Contact{i}"})["uuid"] for i in range(2)]
+
+            # below max_pending the writes wait for the interval, reads see them anyway
+            contacts_dir = tmp_path / "data" / "contacts"
+            assert not any(contacts_dir.glob("*.json"))
+            assert heap.read_contact(uuids[0])["first_name"] == "Contact0"
+
+            uuids.append(heap.create_contact({"first_name": "Contact2"})["uuid"])
+            deadline = time.monotonic() + 5
+            while len(list(contacts_dir.glob("*.json"))) < 3 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert {path.stem for path in contacts_dir.glob("*.json")} == set(uuids)
+        finally:
+            heap.close()
+
+    def test_close_flushes_pending(self, tmp_path):
+        heap = WriteBackHeapStorage(str(tmp_path / "data"), flush_interval=60)
+        uuid = heap.create_contact({"first_name": "John"})["uuid"]
+        heap.close()
+
+        assert (tmp_path / "data" / "contacts" / f"{uuid}.json").exists()
+        assert HeapStorage(str(tmp_path / "data")).read_contact(uuid)["first_name"] == "John"